@@ -47,27 +47,28 @@ def _ref_from_path(path: Path, root: Path) -> str:
     return "/".join(rel_no_suffix.parts)
 
 
-def _extract_title(path: Path) -> str:
-    """Extract title from module docstring first line, fallback to file stem."""
+def _parse_module(path: Path) -> ast.Module | None:
+    """Read and parse a module, returning None when it cannot be read or parsed."""
     try:
-        source = path.read_text(encoding="utf-8")
-        module_ast = ast.parse(source)
+        return ast.parse(path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+
+
+def _extract_title(module_ast: ast.Module | None, path: Path) -> str:
+    """Extract title from module docstring first line, fallback to file stem."""
+    if module_ast is not None:
         docstring = ast.get_docstring(module_ast, clean=True)
         if docstring:
             first_line = docstring.splitlines()[0].strip()
             if first_line:
                 return first_line
-    except (OSError, SyntaxError, UnicodeDecodeError):
-        pass
     return path.stem
 
 
-def _has_top_level_main(path: Path) -> bool:
+def _has_top_level_main(module_ast: ast.Module | None) -> bool:
     """Return True when module defines top-level sync or async `main`."""
-    try:
-        source = path.read_text(encoding="utf-8")
-        module_ast = ast.parse(source)
-    except (OSError, SyntaxError, UnicodeDecodeError):
+    if module_ast is None:
         return False
 
     for node in module_ast.body:
@@ -84,7 +85,9 @@ def discover_examples(root: Path | None = None) -> list[ExampleEntry]:
     for path in root_path.rglob("*.py"):
         if not _is_candidate(path):
             continue
-        if not _has_top_level_main(path):
+        # Parse once for both the main() check and the docstring title
+        module_ast = _parse_module(path)
+        if not _has_top_level_main(module_ast):
             continue
 
         ref = _ref_from_path(path, root_path)
@@ -96,7 +99,7 @@ def discover_examples(root: Path | None = None) -> list[ExampleEntry]:
                 group=group,
                 module=_module_from_path(path, root_path),
                 path=path,
-                title=_extract_title(path),
+                title=_extract_title(module_ast, path),
             )
         )
 
@@ -38,7 +38,7 @@ from data_collector.tables.runtime import Runtime
 from data_collector.utilities.app_registration import ensure_service_app
 from data_collector.utilities.app_status import update_app_status
 from data_collector.utilities.database.main import Database
-from data_collector.utilities.functions.math import get_totalh, get_totalm, get_totals
+from data_collector.utilities.functions.math import get_runtime_totals
 from data_collector.utilities.log.main import LoggingService
 
 
@@ -189,9 +189,10 @@ def run_manager(external_stop_event: threading.Event | None = None) -> None:
                 runtime_row.end_time = end_time
                 start = runtime_row.start_time
                 if start is not None:
-                    runtime_row.totals = get_totals(start, end_time)
-                    runtime_row.totalm = get_totalm(start, end_time)
-                    runtime_row.totalh = get_totalh(start, end_time)
+                    totals, totalm, totalh = get_runtime_totals(start, end_time)
+                    runtime_row.totals = totals
+                    runtime_row.totalm = totalm
+                    runtime_row.totalh = totalh
                 runtime_row.except_cnt = manager.exception_count
                 runtime_row.exit_code = exit_code
                 session.commit()
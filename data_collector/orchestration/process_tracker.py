@@ -30,7 +30,7 @@ from data_collector.tables.apps import Apps
 from data_collector.tables.runtime import Runtime
 from data_collector.utilities.app_status import update_app_status
 from data_collector.utilities.database.main import Database
-from data_collector.utilities.functions.math import get_totalh, get_totalm, get_totals
+from data_collector.utilities.functions.math import get_runtime_totals
 
 
 @dataclass
@@ -325,9 +325,10 @@ class ProcessTracker:
             runtime_record = self._database.query(statement, session).scalar_one_or_none()
             if runtime_record is not None:
                 runtime_record.end_time = end_time
-                runtime_record.totals = get_totals(tracked.start_time, end_time)
-                runtime_record.totalm = get_totalm(tracked.start_time, end_time)
-                runtime_record.totalh = get_totalh(tracked.start_time, end_time)
+                totals, totalm, totalh = get_runtime_totals(tracked.start_time, end_time)
+                runtime_record.totals = totals
+                runtime_record.totalm = totalm
+                runtime_record.totalh = totalh
                 runtime_record.exit_code = effective_exit_code
                 session.commit()
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from typing import Any
@@ -108,11 +109,11 @@ class AsyncScraper(BaseScraper):
                     return
                 if thread_context is not None:
                     token = registry.bind_context(thread_context)
-                    invocation_start = datetime.now(UTC)
+                    invocation_start_ns = time.perf_counter_ns()
                     try:
                         await worker(item, instance_id)
                     finally:
-                        duration_ms = (datetime.now(UTC) - invocation_start).total_seconds() * 1000.0
+                        duration_ms = (time.perf_counter_ns() - invocation_start_ns) / 1_000_000
                         thread_context.record_invocation_duration(duration_ms)
                         registry.unbind_context(token)
                 else:
@@ -470,7 +470,7 @@ class BaseScraper(FunWatchMixin):
         if self.metrics.request_count == 0:
             return
 
-        stats = self.metrics.log_stats(self.logger)
+        stats = self.metrics.error_stats()
         error_rate = stats.get("error_rate_percent", 0.0) / 100.0
         error_breakdown: dict[str, int] = stats.get("error_breakdown", {})
 
@@ -505,7 +505,7 @@ class BaseScraper(FunWatchMixin):
         - "other" -> ErrorCategory.UNKNOWN
 
         Args:
-            error_breakdown: Error counts by type from RequestMetrics.log_stats().
+            error_breakdown: Error counts by type from RequestMetrics.error_stats().
         """
         if self.fatal_flag != FatalFlag.NONE:
             return
@@ -109,7 +109,21 @@ class LogSettings(BaseSettings):
     splunk_ca_bundle: str | None = Field(default=None, validation_alias="DC_LOG_SPLUNK_CA_BUNDLE")
     splunk_index: str = Field(default="default", validation_alias="DC_LOG_SPLUNK_INDEX")
     splunk_sourcetype: str = Field(default="data_collector:structured", validation_alias="DC_LOG_SPLUNK_SOURCETYPE")
+    splunk_batch_size: int = 100
+    splunk_flush_interval: float = 0.5
+    splunk_compress: bool = True
+    splunk_background_send: bool = True
+    splunk_max_buffer: int = 10000
     log_max_queue: int = 10000
+    log_queue_impl: Literal["bounded", "simple"] = "bounded"
+    log_queue_overflow: Literal["block", "drop", "reserve"] = "drop"
+    log_listener_cpu: int | None = None
+    log_strip_record_context: bool = True
+    log_listener_batch_max: int = 256
+    log_db_batch_size: int = 256
+    log_db_flush_interval: float = 0.1
+    log_db_use_copy: bool = True
+    log_db_max_buffer: int = 10000
     log_format: Literal["console", "json"] = "console"
     log_level: int = 10
     log_context_max_keys: int = 50
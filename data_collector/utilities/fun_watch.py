@@ -13,6 +13,7 @@ import logging
 import statistics
 import sys
 import threading
+import time
 from collections.abc import Callable
 from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
@@ -26,7 +27,7 @@ from data_collector.settings.main import MainDatabaseSettings
 from data_collector.tables.apps import AppFunctions
 from data_collector.tables.log import FunctionLog
 from data_collector.utilities.database.main import Database
-from data_collector.utilities.functions.runtime import make_hash
+from data_collector.utilities.functions.runtime import get_function_id, make_hash
 
 logger = structlog.get_logger(__name__)
 T = TypeVar("T")
@@ -46,6 +47,12 @@ _INTERNAL_MODULE_PREFIXES: tuple[str, ...] = (
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _is_internal_module(module_name: str) -> bool:
+    """Return True when *module_name* is framework or stdlib plumbing (memoized per module)."""
+    return module_name.startswith(_INTERNAL_MODULE_PREFIXES)
+
+
 def _find_root_caller() -> str | None:
     """Walk the call stack to find the first non-internal, non-synthetic caller.
 
@@ -59,8 +66,7 @@ def _find_root_caller() -> str | None:
     try:
         frame = frame.f_back  # skip _find_root_caller itself
         while frame is not None:
-            module = frame.f_globals.get("__name__", "")
-            if not any(module.startswith(p) for p in _INTERNAL_MODULE_PREFIXES):
+            if not _is_internal_module(frame.f_globals.get("__name__", "")):
                 fn_name = frame.f_code.co_name
                 if not fn_name.startswith("<"):
                     return fn_name
@@ -79,6 +85,38 @@ def _get_class_lineno(cls: type, fallback: int) -> int:
         return fallback
 
 
+@functools.lru_cache(maxsize=1024)
+def _resolve_source_location(decorated_func: Any, instance_class: type) -> tuple[str, str, str, int, str]:
+    """Resolve static source metadata for a decorated method on a given class.
+
+    The result depends only on the function object and the instance class, so
+    it is computed once per pair instead of on every invocation (the subclass
+    branch reads the module source via ``inspect.findsource``).
+
+    Returns:
+        Tuple of (chain_label, definition_filepath, filepath, func_lineno, caller_module_name).
+    """
+    function_name = decorated_func.__name__
+    chain_label = f"{instance_class.__name__}.{function_name}"
+    definition_filepath = inspect.getfile(decorated_func)
+    func_lineno = decorated_func.__code__.co_firstlineno
+
+    func_defining_module = getattr(decorated_func, "__module__", None)
+    instance_module_name: str = instance_class.__module__
+    if func_defining_module and func_defining_module != instance_module_name:
+        instance_module = sys.modules.get(instance_module_name)
+        instance_file = getattr(instance_module, "__file__", None) if instance_module else None
+        if isinstance(instance_file, str):
+            filepath = instance_file
+            func_lineno = _get_class_lineno(instance_class, func_lineno)
+        else:
+            filepath = definition_filepath
+    else:
+        filepath = definition_filepath
+
+    return chain_label, definition_filepath, filepath, func_lineno, Path(filepath).name
+
+
 class FunWatchContext:
     """Aggregate counters for a single function within a single runtime.
 
@@ -342,7 +380,7 @@ class FunWatchRegistry:
                 function_id=thread_function_hash,
                 function_name=worker_name,
             )
-            invocation_start = datetime.now(UTC)
+            invocation_start_ns = time.perf_counter_ns()
             try:
                 return func(*args, **kwargs)
             except Exception as exc:
@@ -363,7 +401,7 @@ class FunWatchRegistry:
                 )
                 raise
             finally:
-                duration_ms = (datetime.now(UTC) - invocation_start).total_seconds() * 1000.0
+                duration_ms = (time.perf_counter_ns() - invocation_start_ns) / 1_000_000
                 thread_context.record_invocation_duration(duration_ms)
                 structlog.contextvars.unbind_contextvars(*parent_structlog_context.keys(), "function_name")
                 self.unbind_context(token)
@@ -386,7 +424,7 @@ class FunWatchRegistry:
         *,
         main_app: str,
         app_id: str,
-        start_time: datetime,
+        start_time: datetime | None = None,
         log_role: str = "function",
         caller_log_id: int | None = None,
     ) -> FunWatchContext:
@@ -395,7 +433,8 @@ class FunWatchRegistry:
         Uses double-checked locking: fast-path read without lock, then atomic
         creation under ``_aggregate_lock`` on first access.  The FunctionLog
         INSERT happens inside the lock to guarantee exactly one row per function
-        per runtime.
+        per runtime.  ``start_time`` defaults to the creation time, so the
+        per-invocation fast path never reads the wall clock.
         """
         key = (function_hash, runtime_id)
         context = self._aggregate_contexts.get(key)
@@ -407,6 +446,8 @@ class FunWatchRegistry:
             if context is not None:
                 return context
 
+            if start_time is None:
+                start_time = datetime.now(UTC)
             context = FunWatchContext()
             context.first_start_time = start_time
             context.log_id = self.start_function_log(
@@ -489,7 +530,7 @@ class FunWatchRegistry:
             Tuple of (aggregate FunWatchContext, function_hash for structlog binding).
         """
         function_name = getattr(callback, "__qualname__", None) or getattr(callback, "__name__", "thread_callback")
-        function_hash = str(make_hash(app_id + function_name))
+        function_hash = get_function_id(app_id, function_name)
         filepath = inspect.getfile(callback) if hasattr(callback, "__code__") else ""
 
         self.register_function(function_hash, function_name, filepath, app_id)
@@ -499,7 +540,6 @@ class FunWatchRegistry:
             runtime_id,
             main_app=main_app or app_id,
             app_id=app_id,
-            start_time=datetime.now(UTC),
             log_role="thread",
             caller_log_id=caller_log_id,
         )
@@ -597,7 +637,7 @@ def _finalize_fun_watch(
     *,
     aggregate_context: FunWatchContext,
     registry: FunWatchRegistry,
-    invocation_start_time: datetime,
+    invocation_start_ns: int,
     exc_occurred: bool,
     log_lifecycle: bool,
     effective_log_level: int,
@@ -618,8 +658,8 @@ def _finalize_fun_watch(
 ) -> None:
     """Shared finalization logic for sync and async @fun_watch wrappers."""
     try:
+        duration_ms = (time.perf_counter_ns() - invocation_start_ns) / 1_000_000
         end_time = datetime.now(UTC)
-        duration_ms = (end_time - invocation_start_time).total_seconds() * 1000.0
         aggregate_context.record_invocation_duration(duration_ms)
 
         solved, failed = aggregate_context.snapshot()
@@ -690,7 +730,7 @@ class _FunWatchSetupResult:
     registry: FunWatchRegistry
     aggregate_context: FunWatchContext
     context_token: Token[FunWatchContext | None]
-    invocation_start_time: datetime
+    invocation_start_ns: int
     function_name: str = ""
     function_id: str = ""
     app_id: str = ""
@@ -735,27 +775,11 @@ def _setup_fun_watch_invocation(
         )
 
     function_name = decorated_func.__name__
-    class_name = type(instance).__name__
-    chain_label = f"{class_name}.{function_name}"
-    definition_filepath = inspect.getfile(decorated_func)
-    func_lineno = decorated_func.__code__.co_firstlineno
-
-    func_defining_module = getattr(decorated_func, "__module__", None)
     instance_class: type = type(instance)  # pyright: ignore[reportUnknownVariableType]
-    instance_module_name: str = instance_class.__module__
-    if func_defining_module and func_defining_module != instance_module_name:
-        instance_module = sys.modules.get(instance_module_name)
-        instance_file = getattr(instance_module, "__file__", None) if instance_module else None
-        if isinstance(instance_file, str):
-            filepath = instance_file
-            func_lineno = _get_class_lineno(instance_class, func_lineno)
-        else:
-            filepath = definition_filepath
-    else:
-        filepath = definition_filepath
-
-    caller_module_name = Path(filepath).name
-    function_id: str = str(make_hash(app_id + function_name))
+    chain_label, definition_filepath, filepath, func_lineno, caller_module_name = _resolve_source_location(
+        decorated_func, instance_class,
+    )
+    function_id = get_function_id(app_id, function_name)
 
     registry.register_function(function_id, function_name, definition_filepath, app_id)
 
@@ -766,14 +790,13 @@ def _setup_fun_watch_invocation(
     registry.ensure_context_proxy(instance)
 
     thread_id = threading.get_ident()
-    invocation_start_time = datetime.now(UTC)
+    invocation_start_ns = time.perf_counter_ns()
 
     aggregate_context = registry.get_or_create_aggregate_context(
         function_id,
         runtime_id,
         main_app=main_app,
         app_id=app_id,
-        start_time=invocation_start_time,
     )
     aggregate_context.increment_call_count()
 
@@ -827,7 +850,7 @@ def _setup_fun_watch_invocation(
         registry=registry,
         aggregate_context=aggregate_context,
         context_token=context_token,
-        invocation_start_time=invocation_start_time,
+        invocation_start_ns=invocation_start_ns,
         function_name=function_name,
         function_id=function_id,
         app_id=app_id,
@@ -912,7 +935,7 @@ def fun_watch(
                 _finalize_fun_watch(
                     aggregate_context=setup.aggregate_context,
                     registry=setup.registry,
-                    invocation_start_time=setup.invocation_start_time,
+                    invocation_start_ns=setup.invocation_start_ns,
                     exc_occurred=exc_occurred,
                     log_lifecycle=log_lifecycle,
                     effective_log_level=setup.effective_log_level,
@@ -969,7 +992,7 @@ def fun_watch(
                 _finalize_fun_watch(
                     aggregate_context=setup.aggregate_context,
                     registry=setup.registry,
-                    invocation_start_time=setup.invocation_start_time,
+                    invocation_start_ns=setup.invocation_start_ns,
                     exc_occurred=exc_occurred,
                     log_lifecycle=log_lifecycle,
                     effective_log_level=setup.effective_log_level,
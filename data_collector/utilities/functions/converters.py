@@ -1,7 +1,6 @@
 """Data conversion helpers used across runtime utilities."""
 
 from collections.abc import Mapping
-from dataclasses import is_dataclass
 from typing import Any, cast
 
 _SENTINEL = object()
@@ -38,40 +37,32 @@ def to_none(value: Any) -> Any | None:
     return value
 
 
+def _public_items(raw: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a plain dict of *raw* without callables or private keys."""
+    return {k: v for k, v in raw.items() if not callable(v) and not k.startswith("_")}
+
+
 def object_to_dict(obj: Any) -> dict[str, Any] | Any:
     """
     Best-effort conversion of obj to a plain `dict` suitable for deterministic hashing.
     """
 
+    # Plain dicts are the dominant input (bulk_hash rows); skip the ABC check
+    if type(obj) is dict:
+        return _public_items(cast(dict[str, Any], obj))
+
     # If it is a mapping, return dict version without callables or private keys
     if isinstance(obj, Mapping):
-        obj_map = dict(cast(Mapping[str, Any], obj))
-        return {
-            k: v for k, v in obj_map.items()
-            if not callable(v) and not k.startswith("_")
-        }
-
-    # Dataclass instances are converted through vars(...)
-    if is_dataclass(obj) and not isinstance(obj, type):
-        obj_map = vars(obj)
-        return {
-            k: v for k, v in obj_map.items()
-            if not callable(v) and not k.startswith("_")
-        }
-
-    # If it is generic object with attribute __dict__
+        return _public_items(cast(Mapping[str, Any], obj))
+
+    # Generic objects and non-slotted dataclass instances expose __dict__
     raw = getattr(obj, "__dict__", _SENTINEL)
     if isinstance(raw, dict):
-        clean: dict[str, Any] = {}
-        for key, val in cast(dict[str, Any], raw).items():
-            if key.startswith("_") or callable(val):
-                continue
-            clean[key] = val
-        return clean
+        return _public_items(cast(dict[str, Any], raw))
 
-    # If class contains __slots__ only
+    # If class contains __slots__ only (including slotted dataclasses)
     if hasattr(obj, "__slots__"):
-        clean = {}
+        clean: dict[str, Any] = {}
         slots = getattr(obj, "__slots__", ())
         if isinstance(slots, str):
             slots = (slots,)
@@ -4,16 +4,22 @@ from datetime import datetime
 
 def get_totals(start: datetime, end: datetime) -> int:
     """Calculates total number of seconds between two datetime"""
-    return int((end - start).total_seconds())
+    delta = end - start
+    return delta.days * 86400 + delta.seconds
 
 
 def get_totalm(start: datetime, end: datetime) -> int:
     """Calculates total number of minutes between two datetime"""
-    totalm = int(get_totals(start, end)/60)
-    return totalm
+    return get_totals(start, end) // 60
 
 
 def get_totalh(start: datetime, end: datetime) -> int:
     """Calculates total number of hours between two datetime"""
-    totalh = int(get_totalm(start, end)/60)
-    return totalh
+    return get_totals(start, end) // 3600
+
+
+def get_runtime_totals(start: datetime, end: datetime) -> tuple[int, int, int]:
+    """Calculates total seconds, minutes and hours between two datetime in one pass"""
+    totals = get_totals(start, end)
+    totalm = totals // 60
+    return totals, totalm, totalm // 60
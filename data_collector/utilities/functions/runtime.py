@@ -2,21 +2,34 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import importlib
 import json
 import logging
-import re
-from collections.abc import Sequence
+import operator
+import sys
+from collections.abc import Callable, Sequence
 from enum import Enum
 from pathlib import PurePath
 from typing import Any, TypedDict, cast
 
 from data_collector.utilities.functions import converters
 
+# Every code point matched by ``re`` ``\s`` (equivalently ``str.isspace()``)
+_WHITESPACE_DELETE_TABLE: dict[int, int | None] = str.maketrans(
+    "", "",
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006"
+    "\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000",
+)
 
+
+@functools.lru_cache(maxsize=128)
 def is_module_available(module_name: str) -> bool:
-    """Return True when a Python module is importable."""
+    """Return True when a Python module is importable, cached per module name."""
+    if module_name in sys.modules:
+        # A None entry is the import system's marker for a blocked import.
+        return sys.modules[module_name] is not None  # pyright: ignore[reportUnnecessaryComparison]
     try:
         importlib.import_module(module_name)
         return True
@@ -24,9 +37,28 @@ def is_module_available(module_name: str) -> bool:
         return False
 
 
-def list_enum_values(enum_cls: type[Enum]) -> list[Any]:
-    """Return declared enum values in order."""
-    return [member.value for member in enum_cls]
+@functools.cache
+def list_enum_values(enum_cls: type[Enum]) -> tuple[Any, ...]:
+    """Return declared enum values in order, cached per enum class."""
+    return tuple(member.value for member in enum_cls)
+
+
+def _map_by_key(
+    objs: Sequence[Any],
+    get_key: Callable[[Any], Any],
+    label: str,
+    logger: logging.Logger | None,
+) -> dict[Any, Any]:
+    """Map *objs* by key (last occurrence wins), warning about duplicate keys when a logger is given."""
+    mapped = {get_key(obj): obj for obj in objs}
+    if logger and len(mapped) != len(objs):
+        seen: set[Any] = set()
+        for obj in objs:
+            key = get_key(obj)
+            if key in seen:
+                logger.warning(f"Duplicate key in {label}: {key}")
+            seen.add(key)
+    return mapped
 
 
 def obj_diff(
@@ -37,30 +69,49 @@ def obj_diff(
 ) -> tuple[list[Any], list[Any]]:
     """Compare two object collections and return (to_insert, to_remove)."""
 
-    def get_key(obj: Any) -> Any:
-        if isinstance(compare_key, (list, tuple)):
-            return tuple(getattr(obj, key) for key in compare_key)
-        return getattr(obj, compare_key)
-
-    new_map: dict[Any, Any] = {}
-    for obj in new_objs:
-        key = get_key(obj)
-        if key in new_map and logger:
-            logger.warning("Duplicate key in new_objs: %s", key)
-        new_map[key] = obj
-
-    existing_map: dict[Any, Any] = {}
-    for obj in existing_objs:
-        key = get_key(obj)
-        if key in existing_map and logger:
-            logger.warning("Duplicate key in existing_objs: %s", key)
-        existing_map[key] = obj
+    get_key = (
+        operator.attrgetter(*compare_key) if isinstance(compare_key, (list, tuple))
+        else operator.attrgetter(compare_key)
+    )
+    new_map = _map_by_key(new_objs, get_key, "new_objs", logger)
+    existing_map = _map_by_key(existing_objs, get_key, "existing_objs", logger)
 
     to_insert = [obj for key, obj in new_map.items() if key not in existing_map]
     to_remove = [obj for key, obj in existing_map.items() if key not in new_map]
     return to_insert, to_remove
 
 
+@functools.lru_cache(maxsize=16)
+def _hash_template(constructor: str) -> Any:
+    """Return a pristine hash object for *constructor* to be cloned with ``copy()``.
+
+    ``hashlib.new`` resolves the algorithm by name on every call; copying an
+    already-initialised object skips that lookup.  The cached template is never
+    updated, only copied.
+
+    ``"blake3"`` is served by the optional ``blake3`` package (SIMD-accelerated,
+    same ``update``/``hexdigest``/``copy`` interface) when it is installed.
+    """
+    if constructor == "blake3":
+        if not is_module_available("blake3"):
+            raise ValueError("Hash constructor 'blake3' not available. Install the 'blake3' package.")
+        return importlib.import_module("blake3").blake3()
+    try:
+        return hashlib.new(constructor)
+    except ValueError as exc:
+        raise ValueError(f"Hash constructor '{constructor}' not available.") from exc
+
+
+@functools.lru_cache(maxsize=2)
+def _json_encoder(sort_keys: bool) -> json.JSONEncoder:
+    """Return a shared encoder matching ``json.dumps(..., ensure_ascii=False, default=str)``.
+
+    ``json.dumps`` builds a new :class:`json.JSONEncoder` on every call when
+    non-default options are passed; the encoder is stateless between calls.
+    """
+    return json.JSONEncoder(sort_keys=sort_keys, ensure_ascii=False, default=str)
+
+
 def make_hash(
     data: dict[str, Any] | str | Any,
     constructor: str = "sha3_256",
@@ -73,10 +124,7 @@ def make_hash(
     no_spacing: bool = True,
 ) -> str | dict[str, Any] | Any:
     """Create a deterministic hash from input data."""
-    try:
-        hash_func = hashlib.new(constructor)
-    except ValueError as exc:
-        raise ValueError(f"Hash constructor '{constructor}' not available.") from exc
+    hash_func = _hash_template(constructor).copy()
 
     hash_data: dict[str, Any] | str | Any = converters.object_to_dict(data)
 
@@ -90,9 +138,6 @@ def make_hash(
         if on_keys:
             hash_data = {k: hash_data[k] for k in on_keys if k in hash_data}
 
-        if sort_keys:
-            hash_data = dict(sorted(hash_data.items(), key=lambda item: item[0]))
-
     if normalize_case:
         if isinstance(hash_data, dict):
             hash_data = cast(dict[str, Any], hash_data)
@@ -106,13 +151,14 @@ def make_hash(
         if isinstance(hash_data, dict):
             hash_data = cast(dict[str, Any], hash_data)
             hash_data = {
-                k: (re.sub(r"\s+", "", v) if isinstance(v, str) else v) for k, v in hash_data.items()
+                k: (v.translate(_WHITESPACE_DELETE_TABLE) if isinstance(v, str) else v) for k, v in hash_data.items()
             }
         if isinstance(hash_data, str):
-            hash_data = re.sub(r"\s+", "", hash_data)
+            hash_data = hash_data.translate(_WHITESPACE_DELETE_TABLE)
 
+    # Key ordering for sort_keys is applied by the encoder itself
     payload = (
-        json.dumps(hash_data, sort_keys=sort_keys, ensure_ascii=False, default=str).encode()
+        _json_encoder(sort_keys).encode(hash_data).encode()
         if not isinstance(hash_data, str)
         else hash_data.encode()
     )
@@ -134,15 +180,10 @@ def make_hash(
 
 def bulk_hash(data: list[Any], **kwargs: Any) -> list[Any]:
     """Hash every element in *data* by delegating to :func:`make_hash`."""
-    hashed_list: list[Any] = []
-
     if "inplace" not in kwargs:
         kwargs.update({"inplace": True})
 
-    for item in data:
-        hashed_list.append(make_hash(item, **kwargs))
-
-    return hashed_list
+    return [make_hash(item, **kwargs) for item in data]
 
 
 class AppInfo(TypedDict):
@@ -169,10 +210,12 @@ def _resolve_app_group(app_group: str, app_parent: str, app_name: str) -> str:
     return app_group
 
 
-def _split_app_path(filepath: str, depth: int = -4) -> list[str]:
+@functools.lru_cache(maxsize=256)
+def _split_app_path(filepath: str, depth: int = -4) -> tuple[str, ...]:
     """Split a file path and return the last *abs(depth)* components.
 
-    Uses :class:`pathlib.PurePath` for cross-platform path handling.
+    Uses :class:`pathlib.PurePath` for cross-platform path handling.  Results
+    are memoized because callers pass the same ``__file__`` paths repeatedly.
 
     Args:
         filepath: Absolute or relative path to a Python module.
@@ -189,9 +232,10 @@ def _split_app_path(filepath: str, depth: int = -4) -> list[str]:
         raise ValueError(
             f"Path '{filepath}' has {len(parts)} components, need at least {required}"
         )
-    return list(parts[depth:])
+    return parts[depth:]
 
 
+@functools.lru_cache(maxsize=1024)
 def get_parent_id(app_group: str, app_parent: str) -> str:
     """Compute a deterministic parent identifier from the application hierarchy.
 
@@ -205,12 +249,18 @@ def get_parent_id(app_group: str, app_parent: str) -> str:
     return hashlib.sha256(f"{app_group}|{app_parent}".encode()).hexdigest()
 
 
+@functools.lru_cache(maxsize=1024)
 def get_app_id(app_group: str, app_parent: str, app_name: str) -> str:
     """Compute a deterministic app identifier from the application hierarchy.
 
     Concatenates ``app_group|app_parent|app_name`` with pipe separators and
     returns the SHA-256 hex digest (64 characters).
 
+    The digest is persisted as ``Apps.app`` and referenced by every table that
+    carries an ``app_id``, so the algorithm and width are part of the stored
+    data contract.  Per-event cost is avoided through memoization rather than
+    a cheaper hash.
+
     Args:
         app_group: Top-level grouping (typically country code or ``"examples"``).
         app_parent: Parent application or domain (e.g. ``"financials"``).
@@ -220,6 +270,21 @@ def get_app_id(app_group: str, app_parent: str, app_name: str) -> str:
     return hashlib.sha256(f"{app_group}|{app_parent}|{app_name}".encode()).hexdigest()
 
 
+@functools.lru_cache(maxsize=1024)
+def get_function_id(app_id: str, function_name: str) -> str:
+    """Compute a deterministic function identifier for ``@fun_watch`` tracking.
+
+    Hashes ``app_id + function_name`` with :func:`make_hash`.  Results are
+    memoized because the number of distinct functions per process is small
+    while the identifier is needed on every decorated invocation.
+
+    Args:
+        app_id: Application hash identifier.
+        function_name: Qualified name of the tracked function or thread callback.
+    """
+    return str(make_hash(app_id + function_name))
+
+
 def get_app_info(filepath: str, only_id: bool = False, depth: int = -4) -> str | AppInfo:
     """Derive application identity from a module's file path.
 
@@ -2,60 +2,268 @@
 
 from __future__ import annotations
 
+import csv
+import gzip
+import io
 import json
 import logging
 import socket
+import sys
+import threading
 import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from types import TracebackType
 from typing import Any
 
 import requests  # type: ignore[import-untyped]
-from sqlalchemy.orm import Session
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+from sqlalchemy import insert
 
 from data_collector.enums import LogLevel
 from data_collector.tables.log import Logs
 from data_collector.utilities.log.processors import normalize_log_record, separate_fixed_context
 
+_ExcInfo = tuple[type[BaseException] | None, BaseException | None, TracebackType | None]
+# Receives (handler, summary record, exc_info); RouterHandler passes its _log_sink_failure
+_WriteFailureCallback = Callable[[logging.Handler, logging.LogRecord, _ExcInfo], None]
 
-class DatabaseHandler(logging.Handler):
-    """Persist log records to a database table."""
 
-    def __init__(self, engine: Any) -> None:
+class _BufferedHandler(logging.Handler, ABC):
+    """Base handler that buffers converted records and writes them in batches.
+
+    Subclasses convert a record to a buffer item in ``_build_item()`` and write
+    a list of items in ``_write_batch()``. The buffer is written when it reaches
+    ``batch_size`` (inside ``emit()``) or every ``flush_interval`` seconds by a
+    daemon flusher thread started on first use.
+
+    With ``background_writes`` a full batch only wakes the flusher thread, so
+    the caller (the queue listener) never waits on the sink.  A failed write
+    loses nothing yet: its items are put back at the front of the buffer and
+    retried by the flusher every ``retry_interval`` seconds or more, and until
+    a write succeeds full batches no longer trigger writes of their own.  The
+    failure is therefore not raised to the caller, wherever the write ran; it
+    is reported once, with the retry and drop counts, to ``on_write_failure``
+    (wired by ``RouterHandler`` to its fallback file) or to ``handleError``
+    when no callback is set.  ``max_buffer`` bounds the buffer: beyond it the
+    oldest items are dropped and counted in ``dropped_items``.
+    """
+
+    # Minimum seconds between flusher retries while the sink is failing
+    retry_interval: float = 1.0
+
+    def __init__(
+        self,
+        batch_size: int,
+        flush_interval: float,
+        background_writes: bool = False,
+        max_buffer: int = 0,
+    ) -> None:
         super().__init__()
-        self.engine = engine
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.background_writes = background_writes
+        self.max_buffer = max(max_buffer, self.batch_size) if max_buffer else 0
+        self.dropped_items = 0
+        self.on_write_failure: _WriteFailureCallback | None = None
+        self._buffer: list[dict[str, Any]] = []
+        self._write_failed = False
+        self._buffer_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._flusher: threading.Thread | None = None
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Insert structured payload into the `logs` table."""
-        event_dict = normalize_log_record(record)
-        fixed_context, context_json = separate_fixed_context(event_dict)
-        event_message = str(event_dict.get("event", record.getMessage()))
-        level_value = _resolve_log_level(event_dict.get("level"), record.levelno)
-        overflow_context = json.dumps(context_json, default=str) if context_json else None
-
-        entry = Logs(
-            app_id=fixed_context.get("app_id"),
-            module_name=fixed_context.get("module_name"),
-            module_path=fixed_context.get("module_path"),
-            function_name=fixed_context.get("function_name"),
-            function_id=fixed_context.get("function_id"),
-            call_chain=fixed_context.get("call_chain"),
-            thread_id=_coerce_int(fixed_context.get("thread_id")),
-            lineno=_coerce_int(fixed_context.get("lineno")),
-            log_level=level_value,
-            msg=event_message,
-            context_json=overflow_context,
-            runtime=fixed_context.get("runtime"),
-        )
+        """Buffer the converted record and write the batch once it is full."""
+        self._add_items([self._build_item(record)])
+
+    def emit_many(self, records: list[logging.LogRecord]) -> None:
+        """Buffer several records under one lock acquisition (``RouterHandler.emit_batch`` fast path)."""
+        self._add_items([self._build_item(record) for record in records])
+
+    def _add_items(self, items: list[dict[str, Any]]) -> None:
+        """Append items to the buffer and write (or hand off) the batch once it is full."""
+        self._ensure_flusher()
+        with self._buffer_lock:
+            self._buffer.extend(items)
+            self._trim_buffer()
+            batch_full = len(self._buffer) >= self.batch_size
+        # While the sink is failing only the flusher retries, so a full buffer does not write per record
+        if not batch_full or self._write_failed:
+            return
+        if self.background_writes:
+            self._wake_event.set()
+        else:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered items; failures go to ``on_write_failure`` (or ``handleError``)."""
+        try:
+            self._write_buffer()
+        except Exception:
+            self._report_write_failure(sys.exc_info())
+
+    def close(self) -> None:
+        """Stop the flusher thread and write any remaining items."""
+        self._stop_event.set()
+        self._wake_event.set()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout=max(self.flush_interval * 10, 1.0))
+        self.flush()
+        super().close()
+
+    @abstractmethod
+    def _build_item(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Convert a log record to the item buffered for ``_write_batch()``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write_batch(self, items: list[dict[str, Any]]) -> None:
+        """Write one non-empty batch of buffered items to the sink."""
+        raise NotImplementedError
+
+    def _ensure_flusher(self) -> None:
+        """Start the flusher thread on first use (double-checked locking)."""
+        if self._flusher is not None:
+            return
+        with self._buffer_lock:
+            if self._flusher is None and not self._stop_event.is_set():
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name=f"{type(self).__name__}Flusher", daemon=True,
+                )
+                self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        """Write the buffer every ``flush_interval`` seconds, or when woken, until closed."""
+        while not self._stop_event.is_set():
+            if self._write_failed:
+                self._stop_event.wait(max(self.flush_interval, self.retry_interval))
+            else:
+                self._wake_event.wait(self.flush_interval)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            self.flush()
+
+    def _write_buffer(self) -> None:
+        """Swap out the buffer and pass it to ``_write_batch()`` in ``batch_size`` chunks.
+
+        On failure the unwritten items are put back at the front of the buffer
+        before the exception propagates.
+        """
+        with self._buffer_lock:
+            items, self._buffer = self._buffer, []
+        for start in range(0, len(items), self.batch_size):
+            try:
+                self._write_batch(items[start:start + self.batch_size])
+            except Exception:
+                with self._buffer_lock:
+                    self._buffer[:0] = items[start:]
+                    self._trim_buffer()
+                self._write_failed = True
+                raise
+        self._write_failed = False
 
-        # DatabaseHandler intentionally uses a raw session (not Database.add) because it holds
+    def _trim_buffer(self) -> None:
+        """Drop the oldest items beyond ``max_buffer``; the caller holds ``_buffer_lock``."""
+        overflow = len(self._buffer) - self.max_buffer if self.max_buffer else 0
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self.dropped_items += overflow
+
+    def _report_write_failure(self, exc_info: _ExcInfo) -> None:
+        """Pass a failed write to ``on_write_failure``, or ``handleError`` without one."""
+        with self._buffer_lock:
+            buffered = len(self._buffer)
+        failure_record = logging.makeLogRecord({
+            "name": __name__,
+            "levelno": logging.ERROR,
+            "levelname": "ERROR",
+            "msg": (
+                f"{type(self).__name__} failed to write buffered log items; "
+                f"{buffered} still buffered for retry, {self.dropped_items} dropped in total (max_buffer)"
+            ),
+        })
+        callback = self.on_write_failure
+        if callback is None:
+            self.handleError(failure_record)
+        else:
+            callback(self, failure_record, exc_info)
+
+
+class DatabaseHandler(_BufferedHandler):
+    """Persist log records to the ``Logs`` table in batches.
+
+    Each batch is written with a single executemany of a Core INSERT built
+    once per handler, in one pooled connection and transaction.
+    On PostgreSQL through psycopg2 (and ``use_copy`` enabled) the batch is
+    streamed with ``COPY ... FROM STDIN`` instead, which skips per-row
+    statement handling on the server.
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        batch_size: int = 256,
+        flush_interval: float = 0.1,
+        use_copy: bool = True,
+        max_buffer: int = 10_000,
+    ) -> None:
+        super().__init__(batch_size=batch_size, flush_interval=flush_interval, max_buffer=max_buffer)
+        self.engine = engine
+        self._insert = insert(Logs)
+        self.use_copy = use_copy and getattr(getattr(engine, "dialect", None), "driver", None) == "psycopg2"
+
+    def _build_item(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Map the structured payload to a ``Logs`` row."""
+        return _build_log_row(record)
+
+    def _write_batch(self, items: list[dict[str, Any]]) -> None:
+        """Insert buffered rows with one executemany statement."""
+        # DatabaseHandler intentionally uses a raw connection (not Database.bulk_insert) because it holds
         # an engine, not a Database instance. The Logs table is infrastructure -- tracking it in
         # AppDbObjects would pollute every app's dependency graph with a universal dependency.
-        with Session(self.engine) as session:
-            session.add(entry)
-            session.commit()
+        if self.use_copy:
+            self._copy_batch(items)
+            return
+        # Core connection rather than an ORM Session: rows are plain dicts, so the ORM
+        # bulk-insert layer and Session setup only add per-batch overhead.
+        with self.engine.begin() as connection:
+            connection.execute(self._insert, items)
+
+    def _copy_batch(self, items: list[dict[str, Any]]) -> None:
+        """Stream buffered rows into ``Logs`` with PostgreSQL ``COPY FROM STDIN``."""
+        columns = list(items[0])
+        buffer = io.StringIO()
+        # QUOTE_NOTNULL leaves None unquoted (NULL in COPY CSV) and quotes everything else,
+        # so empty strings stay empty strings.
+        csv.writer(buffer, quoting=csv.QUOTE_NOTNULL).writerows([item[column] for column in columns] for item in items)
+        buffer.seek(0)
+        copy_sql = f"COPY {Logs.__tablename__} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.copy_expert(copy_sql, buffer)
+            finally:
+                cursor.close()
+            connection.commit()
+        finally:
+            connection.close()
+
 
+class SplunkHECHandler(_BufferedHandler):
+    """Forward log records to Splunk HEC endpoint in batches.
 
-class SplunkHECHandler(logging.Handler):
-    """Forward log records to Splunk HEC endpoint."""
+    Events are posted over a pooled ``requests.Session`` so the TCP/TLS
+    connection is reused, and each batch is sent as one HEC request whose
+    body is the newline-delimited concatenation of the event payloads,
+    gzip-compressed unless ``compress`` is disabled.  By default batches are
+    posted from the flusher thread (``background_writes``), so network
+    latency never stalls the queue listener and the other sinks; a failed
+    post reaches ``on_write_failure`` and its events are retried.
+    """
 
     def __init__(
         self,
@@ -65,19 +273,41 @@ class SplunkHECHandler(logging.Handler):
         ca_bundle: str | None = None,
         index: str = "default",
         sourcetype: str = "data_collector:structured",
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        compress: bool = True,
+        background_writes: bool = True,
+        max_buffer: int = 10_000,
     ) -> None:
-        super().__init__()
+        super().__init__(
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            background_writes=background_writes,
+            max_buffer=max_buffer,
+        )
+        self.compress = compress
         self.url = hec_url.rstrip("/") + "/event"
-        self.headers = {"Authorization": f"Splunk {token}"}
+        self.headers = {"Authorization": f"Splunk {token}", "Content-Type": "application/json"}
         self.verify: bool | str = ca_bundle if ca_bundle else verify_tls
         self.index = index
         self.sourcetype = sourcetype
         self.host = socket.gethostname()
+        self.session = requests.Session()
+        if compress:
+            self.headers["Content-Encoding"] = "gzip"
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
-    def emit(self, record: logging.LogRecord) -> None:
-        """Post structured event payload to Splunk HEC."""
+    def close(self) -> None:
+        """Send remaining events and release pooled connections."""
+        super().close()
+        self.session.close()
+
+    def _build_item(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Build the HEC event envelope for a record."""
         event_dict = normalize_log_record(record)
-        payload = {
+        return {
             "time": time.time(),
             "host": self.host,
             "source": event_dict.get("app_id", record.name),
@@ -85,16 +315,42 @@ class SplunkHECHandler(logging.Handler):
             "index": self.index,
             "event": event_dict,
         }
-        response = requests.post(
+
+    def _write_batch(self, items: list[dict[str, Any]]) -> None:
+        """Post buffered events as one newline-delimited HEC request."""
+        body = "\n".join(json.dumps(item, default=str) for item in items).encode("utf-8")
+        if self.compress:
+            # Level 1: repetitive JSON envelopes compress well even at the cheapest level.
+            body = gzip.compress(body, compresslevel=1)
+        response = self.session.post(
             self.url,
-            headers=self.headers,
-            json=payload,
-            timeout=2.5,
+            data=body,
+            timeout=(1.0, 5.0),
             verify=self.verify,
         )
         response.raise_for_status()
 
 
+def _build_log_row(record: logging.LogRecord) -> dict[str, Any]:
+    """Map a log record to a ``Logs`` column mapping for bulk insert."""
+    event_dict = normalize_log_record(record)
+    fixed_context, context_json = separate_fixed_context(event_dict)
+    return {
+        "app_id": fixed_context.get("app_id"),
+        "module_name": fixed_context.get("module_name"),
+        "module_path": fixed_context.get("module_path"),
+        "function_name": fixed_context.get("function_name"),
+        "function_id": fixed_context.get("function_id"),
+        "call_chain": fixed_context.get("call_chain"),
+        "thread_id": _coerce_int(fixed_context.get("thread_id")),
+        "lineno": _coerce_int(fixed_context.get("lineno")),
+        "log_level": _resolve_log_level(event_dict.get("level"), record.levelno),
+        "msg": str(event_dict["event"]),
+        "context_json": json.dumps(context_json, default=str) if context_json else None,
+        "runtime": fixed_context.get("runtime"),
+    }
+
+
 def _resolve_log_level(level_name: Any, default_level: int) -> int:
     """Resolve log level names to framework enum values."""
     if isinstance(level_name, str):
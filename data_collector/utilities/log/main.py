@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 import logging
+import os
 import threading
+import warnings
 from logging.handlers import QueueHandler, QueueListener
-from queue import Queue
-from typing import Any, cast
+from queue import Empty, Full, Queue, SimpleQueue
+from typing import Any, Literal, cast
 
 import structlog  # type: ignore[import-untyped]
 from structlog.stdlib import BoundLogger, ProcessorFormatter  # type: ignore[import-untyped]
 
 from data_collector.settings.main import LogSettings
 from data_collector.utilities.log.handlers import DatabaseHandler, SplunkHECHandler
-from data_collector.utilities.log.processors import extract_caller_info, limit_context_size
+from data_collector.utilities.log.processors import (
+    attach_rendered_exception,
+    extract_caller_info,
+    limit_context_size,
+)
 from data_collector.utilities.log.router import RouterHandler
 
 
@@ -76,12 +82,216 @@ class _StructlogConfigurator:
 
 
 class _RawQueueHandler(QueueHandler):
-    """QueueHandler that preserves structured records."""
+    """QueueHandler that preserves structured records.
+
+    ``prepare`` returns the record itself, so message formatting and record
+    copying never run on the producer thread. An unbounded ``SimpleQueue``
+    never overflows. When a bounded ``Queue`` is full, ``overflow`` selects
+    between blocking the producer (``"block"``) and dropping the record
+    (``"drop"``). ``"reserve"`` drops like ``"drop"`` but keeps the last
+    quarter of the capacity for WARNING and above: DEBUG/INFO records are
+    shed once the queue is three-quarters full. Outside ``"block"``, a
+    non-zero ``soft_limit`` also caps an unbounded queue: records are dropped
+    once ``qsize()`` reaches it.
+
+    Dropped records are counted in ``dropped_records`` instead of reported
+    through ``handleError`` one traceback at a time. The next record that
+    does fit is followed by one WARNING summarising the drops since the
+    previous summary; ``report_dropped`` does the same on demand (e.g. from
+    ``LoggingService.stop``). The counters are shared by producer threads
+    and guarded by ``_drop_lock``.
+    """
+
+    def __init__(
+        self,
+        log_queue: Queue[logging.LogRecord] | SimpleQueue[logging.LogRecord],
+        overflow: Literal["block", "drop", "reserve"] = "drop",
+        strip_exc_info: bool = False,
+        soft_limit: int = 0,
+    ) -> None:
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.strip_exc_info = strip_exc_info
+        self.soft_limit = soft_limit
+        capacity = soft_limit or getattr(log_queue, "maxsize", 0)
+        self.low_level_limit = capacity - capacity // 4 if overflow == "reserve" else 0
+        self.dropped_records = 0
+        self._reported_drops = 0
+        self._drop_lock = threading.Lock()
+        self._exception_formatter = logging.Formatter()
 
     def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
-        """Return the unmodified record so listeners receive structured payloads."""
+        """Return the record so listeners receive structured payloads.
+
+        With ``strip_exc_info`` the traceback is rendered into ``exc_text`` and
+        ``exc_info`` is cleared, so a queued record no longer pins the
+        traceback's frames (and every local variable in them) in memory.
+        """
+        if self.strip_exc_info and record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
         return record
 
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record on the queue, applying the overflow policy when it is full."""
+        if self.overflow == "block":
+            cast(Queue[logging.LogRecord], self.queue).put(record)
+            return
+        if self.low_level_limit or self.soft_limit:
+            queued = cast(SimpleQueue[logging.LogRecord], self.queue).qsize()
+            if (self.soft_limit and queued >= self.soft_limit) or (
+                self.low_level_limit and record.levelno < logging.WARNING and queued >= self.low_level_limit
+            ):
+                self._count_drop()
+                return
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self._count_drop()
+            return
+        # Unlocked fast path; report_dropped re-checks under the lock
+        if self.dropped_records > self._reported_drops:
+            self.report_dropped()
+
+    def _count_drop(self) -> None:
+        with self._drop_lock:
+            self.dropped_records += 1
+
+    def report_dropped(self) -> bool:
+        """Queue one WARNING for records dropped since the last report.
+
+        Returns ``False`` when the warning itself does not fit in the queue;
+        the drops then stay pending for the next report. Checking, queueing
+        and marking the drops as reported happen under ``_drop_lock``, so
+        concurrent producers report each drop once.
+        """
+        with self._drop_lock:
+            dropped = self.dropped_records
+            pending = dropped - self._reported_drops
+            if pending <= 0:
+                return True
+            warning = logging.makeLogRecord(
+                {
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": logging.getLevelName(logging.WARNING),
+                    "msg": (
+                        f"Dropped {pending} log record(s) because the log queue was full "
+                        f"(log_queue_overflow={self.overflow!r}, {dropped} dropped in total)"
+                    ),
+                }
+            )
+            try:
+                self.queue.put_nowait(warning)
+            except Full:
+                return False
+            self._reported_drops = dropped
+            return True
+
+
+class _BatchingQueueListener(QueueListener):
+    """QueueListener that hands queued records to handlers in batches.
+
+    After each blocking ``dequeue`` the listener drains whatever else is
+    already queued (up to ``batch_max`` records) without waiting, so batching
+    adds no latency.  Handlers that define ``emit_batch`` (``RouterHandler``)
+    receive the whole batch under one lock acquisition; other handlers are
+    handled per record exactly like ``QueueListener.handle``.
+    """
+
+    def __init__(
+        self,
+        log_queue: Queue[logging.LogRecord] | SimpleQueue[logging.LogRecord],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        batch_max: int = 256,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_max = max(1, batch_max)
+
+    def _monitor(self) -> None:
+        """Drain the queue in batches until the stop sentinel is dequeued."""
+        log_queue = cast(Queue[logging.LogRecord | None], self.queue)
+        # SimpleQueue has no task accounting
+        has_task_done = hasattr(log_queue, "task_done")
+        stopping = False
+        while not stopping:
+            record: logging.LogRecord | None = self.dequeue(True)
+            batch: list[logging.LogRecord] = []
+            while True:
+                if record is None:  # QueueListener's stop sentinel
+                    stopping = True
+                    if has_task_done:
+                        log_queue.task_done()
+                    break
+                batch.append(self.prepare(record))
+                if len(batch) >= self.batch_max:
+                    break
+                try:
+                    record = log_queue.get_nowait()
+                except Empty:
+                    break
+            if batch:
+                self.handle_batch(batch)
+                if has_task_done:
+                    for _ in batch:
+                        log_queue.task_done()
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Pass a batch of records to every handler."""
+        lowest_levelno = min(record.levelno for record in records)
+        for handler in self.handlers:
+            selected = records
+            if self.respect_handler_level and handler.level > lowest_levelno:
+                selected = [record for record in records if record.levelno >= handler.level]
+            if not selected:
+                continue
+            emit_batch = getattr(type(handler), "emit_batch", None)
+            if emit_batch is None:
+                for record in selected:
+                    handler.handle(record)
+                continue
+            accepted = [record for record in selected if handler.filter(record)] if handler.filters else selected
+            if accepted:
+                handler.acquire()
+                try:
+                    emit_batch(handler, accepted)
+                finally:
+                    handler.release()
+
+
+class _BatchStreamHandler(logging.StreamHandler[Any]):
+    """Console handler that writes a whole listener batch with one ``write``.
+
+    ``emit`` behaves like ``logging.StreamHandler``.  ``emit_many`` (used by
+    ``RouterHandler.emit_batch``) formats every record, then writes the joined
+    text and flushes once, so a batch costs one write syscall instead of one
+    per record.  A record that fails to format is reported through
+    ``handleError`` without dropping the rest of the batch.
+    """
+
+    def emit_many(self, records: list[logging.LogRecord]) -> None:
+        """Format *records* and write them to the stream in one call."""
+        terminator = self.terminator
+        lines: list[str] = []
+        for record in records:
+            try:
+                lines.append(self.format(record) + terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+        if not lines:
+            return
+        try:
+            self.stream.write("".join(lines))
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(records[-1])
+
 
 class _StructlogContextFilter(logging.Filter):
     """Bridge structlog contextvars to stdlib LogRecords.
@@ -163,7 +373,7 @@ class LoggingService:
         self.logger = logging.getLogger(self.logger_name)
         self.logger_level: int = self.settings.log_level if log_level is None else log_level
 
-        self.log_queue: Queue[logging.LogRecord] | None = None
+        self.log_queue: Queue[logging.LogRecord] | SimpleQueue[logging.LogRecord] | None = None
         self.log_listener: QueueListener | None = None
         self.debug: bool = False
 
@@ -174,6 +384,19 @@ class LoggingService:
     def append_sink(self, sink: logging.Handler) -> None:
         """Append a sink handler routed by `RouterHandler`."""
         self.sinks.append(sink)
+        self.refresh_levels()
+
+    def refresh_levels(self) -> None:
+        """Gate the queue handlers at the lowest sink level.
+
+        A record below every sink's level would be discarded by
+        ``RouterHandler``; with the queue handlers at that level it is dropped
+        in ``Logger.callHandlers`` instead of being queued.  Call again after
+        changing a sink's level.
+        """
+        floor = min((sink.level for sink in self.sinks), default=logging.NOTSET)
+        for handler in self._queue_handlers():
+            handler.setLevel(floor)
 
     def _build_console_formatter(self) -> ProcessorFormatter:
         """Create ProcessorFormatter with renderer selected by `log_format`."""
@@ -183,7 +406,7 @@ class LoggingService:
         else:
             renderer = structlog.dev.ConsoleRenderer()
 
-        foreign_pre_chain = _build_pre_chain(self.settings)
+        foreign_pre_chain = [*_build_pre_chain(self.settings), attach_rendered_exception]
         return ProcessorFormatter(
             foreign_pre_chain=cast(Any, foreign_pre_chain),
             processors=[
@@ -224,7 +447,15 @@ class LoggingService:
 
         if not self.debug:
             if self.settings.log_to_db and self.db_engine:
-                self.append_sink(DatabaseHandler(self.db_engine))
+                self.append_sink(
+                    DatabaseHandler(
+                        self.db_engine,
+                        batch_size=self.settings.log_db_batch_size,
+                        flush_interval=self.settings.log_db_flush_interval,
+                        use_copy=self.settings.log_db_use_copy,
+                        max_buffer=self.settings.log_db_max_buffer,
+                    )
+                )
             if self.settings.log_to_splunk and self.settings.splunk_hec_url and self.settings.splunk_token:
                 self.append_sink(
                     SplunkHECHandler(
@@ -234,6 +465,11 @@ class LoggingService:
                         ca_bundle=self.settings.splunk_ca_bundle,
                         index=self.settings.splunk_index,
                         sourcetype=self.settings.splunk_sourcetype,
+                        batch_size=self.settings.splunk_batch_size,
+                        flush_interval=self.settings.splunk_flush_interval,
+                        compress=self.settings.splunk_compress,
+                        background_writes=self.settings.splunk_background_send,
+                        max_buffer=self.settings.splunk_max_buffer,
                     )
                 )
 
@@ -254,7 +490,7 @@ class LoggingService:
             if is_persistence_sink:
                 sink.addFilter(required_context_filter)
 
-        console = logging.StreamHandler()
+        console = _BatchStreamHandler()
         console.setLevel(self.logger_level)
         console.setFormatter(self._build_console_formatter())
         self.sinks.append(console)
@@ -265,16 +501,36 @@ class LoggingService:
             error_max_bytes=self.settings.log_error_max_bytes,
             error_backup_count=self.settings.log_error_backup_count,
         )
-        self.log_queue = self.log_queue or Queue(maxsize=self.settings.log_max_queue)
+        if self.log_queue is None:
+            # SimpleQueue is a C-level unbounded queue without Condition objects, so producers
+            # contend less; the bounded Queue keeps log_max_queue and the overflow policy.
+            if self.settings.log_queue_impl == "simple":
+                self.log_queue = SimpleQueue()
+            else:
+                self.log_queue = Queue(maxsize=self.settings.log_max_queue)
 
         if not self.log_listener:
-            self.log_listener = QueueListener(self.log_queue, router, respect_handler_level=True)
+            self.log_listener = _BatchingQueueListener(
+                self.log_queue,
+                router,
+                respect_handler_level=True,
+                batch_max=self.settings.log_listener_batch_max,
+            )
 
+        # SimpleQueue has no maxsize; log_max_queue becomes a soft cap checked on enqueue.
+        soft_limit = self.settings.log_max_queue if isinstance(self.log_queue, SimpleQueue) else 0
         if not any(
             isinstance(handler, _RawQueueHandler) and getattr(handler, "queue", None) is self.log_queue
             for handler in self.logger.handlers
         ):
-            self.logger.addHandler(_RawQueueHandler(self.log_queue))
+            self.logger.addHandler(
+                _RawQueueHandler(
+                    self.log_queue,
+                    self.settings.log_queue_overflow,
+                    strip_exc_info=self.settings.log_strip_record_context,
+                    soft_limit=soft_limit,
+                )
+            )
 
         # Configure the "data_collector" parent logger so that all framework
         # library modules using logging.getLogger(__name__) inherit handlers
@@ -287,26 +543,77 @@ class LoggingService:
             isinstance(handler, _RawQueueHandler) and getattr(handler, "queue", None) is self.log_queue
             for handler in framework_logger.handlers
         ):
-            framework_handler = _RawQueueHandler(self.log_queue)
+            framework_handler = _RawQueueHandler(
+                self.log_queue,
+                self.settings.log_queue_overflow,
+                strip_exc_info=self.settings.log_strip_record_context,
+                soft_limit=soft_limit,
+            )
             framework_handler.addFilter(_StructlogContextFilter())
             framework_logger.addHandler(framework_handler)
             framework_logger.setLevel(min(framework_logger.level or logging.WARNING, self.logger_level))
 
+        self.refresh_levels()
         self.start()
         return cast(BoundLogger, structlog.get_logger(self.logger_name).bind())
 
+    @property
+    def dropped_records(self) -> int:
+        """Records dropped by this service's queue handlers under ``log_queue_overflow``."""
+        return sum(handler.dropped_records for handler in self._queue_handlers())
+
+    def _queue_handlers(self) -> list[_RawQueueHandler]:
+        return [
+            handler
+            for logger in (self.logger, logging.getLogger("data_collector"))
+            for handler in logger.handlers
+            if isinstance(handler, _RawQueueHandler) and handler.queue is self.log_queue
+        ]
+
     def start(self) -> None:
-        """Start queue listener when not already alive."""
+        """Start queue listener when not already alive.
+
+        When ``log_listener_cpu`` is set, the listener thread is pinned to that
+        CPU on platforms that support ``os.sched_setaffinity`` (Linux).  A CPU
+        that cannot be used (offline, outside the process's cpuset, invalid)
+        only emits a ``RuntimeWarning``; the listener keeps running unpinned.
+        """
         if self.log_listener is None:
             return
 
         thread = getattr(self.log_listener, "_thread", None)
         if thread is None or not thread.is_alive():
             self.log_listener.start()
+            listener_cpu = self.settings.log_listener_cpu
+            thread = getattr(self.log_listener, "_thread", None)
+            if listener_cpu is not None and thread is not None and hasattr(os, "sched_setaffinity"):
+                try:
+                    os.sched_setaffinity(thread.native_id, {listener_cpu})
+                except (OSError, ValueError) as exc:
+                    warnings.warn(
+                        f"Could not pin the log listener thread to CPU {listener_cpu} ({exc}); running unpinned",
+                        RuntimeWarning,
+                        stacklevel=2,
+                    )
 
     def stop(self) -> None:
-        """Stop queue listener if started."""
+        """Stop queue listener if started and flush sinks that buffer records.
+
+        Drops not yet reported by a queue handler are queued as a final
+        WARNING before the listener drains the queue; if even that does not
+        fit, they are reported through ``warnings.warn``.
+        """
         if self.log_listener:
             thread = getattr(self.log_listener, "_thread", None)
             if thread is not None and thread.is_alive():
+                for handler in self._queue_handlers():
+                    if not handler.report_dropped():
+                        warnings.warn(
+                            f"{handler.dropped_records} log record(s) dropped because the log queue was full "
+                            f"(log_queue_overflow={handler.overflow!r})",
+                            RuntimeWarning,
+                            stacklevel=2,
+                        )
                 self.log_listener.stop()
+        for sink in self.sinks:
+            sink.flush()
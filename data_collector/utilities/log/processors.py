@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import inspect
+import functools
 import logging
+import sys
 import threading
 from collections.abc import Callable
 from pathlib import Path
@@ -62,13 +63,31 @@ _STANDARD_LOG_RECORD_KEYS: frozenset[str] = frozenset(
     ).__dict__.keys()
 )
 
+# structlog ProcessorFormatter bookkeeping keys that never belong in a sink payload.
+_STRUCTLOG_BOOKKEEPING_KEYS: frozenset[str] = frozenset({"_record", "_from_structlog"})
+
+_RECORD_EXTRA_EXCLUDED_KEYS: frozenset[str] = (
+    _STANDARD_LOG_RECORD_KEYS | _STRUCTLOG_BOOKKEEPING_KEYS | {"_logger", "_name", "_rendered_message"}
+)
+
 Processor = Callable[[Any, str, dict[str, Any]], dict[str, Any]]
 
 
+@functools.lru_cache(maxsize=1024)
+def _is_internal_module(module_name: str) -> bool:
+    """Return True when *module_name* belongs to logging internals (memoized per module)."""
+    return module_name.startswith(STRUCTLOG_INTERNAL_MODULE_PREFIXES)
+
+
 def _is_internal_frame(frame: FrameType) -> bool:
     """Return True when frame belongs to logging internals."""
-    module_name = str(frame.f_globals.get("__name__", ""))
-    return module_name.startswith(STRUCTLOG_INTERNAL_MODULE_PREFIXES)
+    return _is_internal_module(str(frame.f_globals.get("__name__", "")))
+
+
+@functools.lru_cache(maxsize=256)
+def _module_name_from_path(module_path: str) -> str:
+    """Return the file name of *module_path*; memoized because callers come from few files."""
+    return Path(module_path).name
 
 
 def extract_caller_info() -> Processor:
@@ -86,18 +105,14 @@ def extract_caller_info() -> Processor:
         # frames belong to stdlib logging (filtered by _is_internal_frame).
         record: logging.LogRecord | None = event_dict.get("_record")
         if record is not None and record.pathname:
-            event_dict.setdefault("module_name", Path(record.pathname).name)
+            event_dict.setdefault("module_name", _module_name_from_path(record.pathname))
             event_dict.setdefault("module_path", record.pathname)
             event_dict.setdefault("function_name", record.funcName)
             event_dict.setdefault("lineno", record.lineno)
             event_dict.setdefault("thread_id", threading.get_ident())
             return event_dict
 
-        frame = inspect.currentframe()
-        if frame is None:
-            return event_dict
-
-        frame = frame.f_back
+        frame: FrameType | None = sys._getframe(1)  # pyright: ignore[reportPrivateUsage]
         caller_frame: FrameType | None = None
 
         try:
@@ -113,7 +128,7 @@ def extract_caller_info() -> Processor:
             return event_dict
 
         module_path = caller_frame.f_code.co_filename
-        event_dict.setdefault("module_name", Path(module_path).name)
+        event_dict.setdefault("module_name", _module_name_from_path(module_path))
         event_dict.setdefault("module_path", module_path)
         event_dict.setdefault("function_name", caller_frame.f_code.co_name)
         event_dict.setdefault("lineno", caller_frame.f_lineno)
@@ -143,6 +158,20 @@ def limit_context_size(max_keys: int) -> Processor:
     return processor
 
 
+def attach_rendered_exception(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Expose a traceback pre-rendered into ``record.exc_text`` as the ``exception`` key.
+
+    Foreign (stdlib) records whose ``exc_info`` was rendered and cleared before
+    queueing carry the traceback only in ``exc_text``; this restores it for
+    ``ProcessorFormatter`` renderers.
+    """
+    record = event_dict.get("_record")
+    exc_text = getattr(record, "exc_text", None)
+    if exc_text and "exception" not in event_dict and "exc_info" not in event_dict:
+        event_dict["exception"] = exc_text
+    return event_dict
+
+
 def separate_fixed_context(event_dict: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
     """Split event payload into fixed DB columns and overflow context."""
     fixed_context = {key: event_dict[key] for key in DB_FIXED_KEYS if key in event_dict}
@@ -154,27 +183,38 @@ def separate_fixed_context(event_dict: dict[str, Any]) -> tuple[dict[str, Any],
     return fixed_context, context_json
 
 
+def rendered_message(record: logging.LogRecord) -> str:
+    """Return ``record.getMessage()``, rendering ``msg % args`` at most once per record.
+
+    The result is cached on the record, so sinks that each need the text
+    (DB, Splunk, the fallback file) share one rendering.
+    """
+    cached = record.__dict__.get("_rendered_message")
+    if cached is None:
+        cached = record.getMessage()
+        record.__dict__["_rendered_message"] = cached
+    return cached
+
+
 def normalize_log_record(record: logging.LogRecord) -> dict[str, Any]:
     """Normalize stdlib/structlog records to a structured event dict."""
     message = record.msg
     if isinstance(message, dict):
-        event_dict = {str(key): value for key, value in cast(dict[Any, Any], message).items()}
+        event_dict = {
+            str(key): value
+            for key, value in cast(dict[Any, Any], message).items()
+            if key not in _STRUCTLOG_BOOKKEEPING_KEYS
+        }
     else:
-        event_dict = {"event": record.getMessage()}
-
-    extra_values = {
-        key: value
-        for key, value in record.__dict__.items()
-        if key not in _STANDARD_LOG_RECORD_KEYS and key not in {"_logger", "_name"}
-    }
-
-    for key, value in extra_values.items():
-        event_dict.setdefault(key, value)
+        event_dict = {"event": rendered_message(record)}
 
-    event_dict.pop("_record", None)
-    event_dict.pop("_from_structlog", None)
+    for key, value in record.__dict__.items():
+        if key not in _RECORD_EXTRA_EXCLUDED_KEYS:
+            event_dict.setdefault(key, value)
 
-    event_dict.setdefault("event", record.getMessage())
+    # Format the message only when the payload carries no event of its own.
+    if "event" not in event_dict:
+        event_dict["event"] = rendered_message(record)
     level_name = str(event_dict.get("level", record.levelname)).lower()
     event_dict["level"] = level_name
     event_dict.setdefault("logger", record.name)
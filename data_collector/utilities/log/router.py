@@ -4,15 +4,46 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 import traceback
 from logging.handlers import RotatingFileHandler
 from types import TracebackType
 
-from data_collector.utilities.log.processors import normalize_log_record
+from data_collector.utilities.log.processors import normalize_log_record, rendered_message
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the ``asctime`` second prefix across records.
+
+    ``logging.Formatter.formatTime`` runs ``time.strftime`` for every record.
+    Records created within the same wall-clock second share that prefix, so it
+    is cached per second and only the millisecond suffix is appended per record.
+    Output is identical to ``logging.Formatter``.
+    """
+
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None) -> None:
+        super().__init__(fmt, datefmt)
+        self._cached_time: tuple[int, str | None, str] = (-1, None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Format the record creation time, reusing the cached per-second prefix."""
+        created_second = int(record.created)
+        cached_second, cached_datefmt, formatted_second = self._cached_time
+        if created_second != cached_second or datefmt != cached_datefmt:
+            formatted_second = time.strftime(datefmt or self.default_time_format, self.converter(created_second))
+            self._cached_time = (created_second, datefmt, formatted_second)
+        if datefmt or not self.default_msec_format:
+            return formatted_second
+        return self.default_msec_format % (formatted_second, record.msecs)
 
 
 class RouterHandler(logging.Handler):
-    """Forward each record to all configured handlers."""
+    """Forward each record to all configured handlers.
+
+    The router has no I/O lock of its own: it is driven only by the single
+    queue listener thread, and every sink takes its own lock.  Attach it to
+    a ``QueueListener``, never directly to a logger used by several threads.
+    """
 
     def __init__(
         self,
@@ -25,32 +56,132 @@ class RouterHandler(logging.Handler):
         super().__init__()
         self.handlers = handlers
         self.swallow_errors = swallow_errors
+        # Buffered sinks also write from their own flusher thread, where no exception reaches
+        # emit(); route those failures to the fallback file as well.
+        for handler in handlers:
+            if getattr(handler, "on_write_failure", False) is None:
+                setattr(handler, "on_write_failure", self._log_sink_failure)  # noqa: B010
         self._fallback = RotatingFileHandler(
             error_file,
             maxBytes=error_max_bytes,
             backupCount=error_backup_count,
         )
-        self._fallback.setFormatter(logging.Formatter("%(asctime)s SINK_FAILURE %(message)s"))
+        self._fallback.setFormatter(_CachedTimeFormatter("%(asctime)s SINK_FAILURE %(message)s"))
+
+    def createLock(self) -> None:
+        """Skip the RLock (and its at-fork registration); see the class docstring."""
+        self.lock = None
+
+    def acquire(self) -> None:
+        """No-op: the router has no lock."""
+
+    def release(self) -> None:
+        """No-op: the router has no lock."""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Apply filters and emit without taking a lock."""
+        filtered = self.filter(record)
+        if filtered:
+            self.emit(filtered if isinstance(filtered, logging.LogRecord) else record)
+        return bool(filtered)
 
     def emit(self, record: logging.LogRecord) -> None:
         """Dispatch record to child handlers while isolating sink failures."""
+        levelno = record.levelno
         for handler in self.handlers:
+            # The level gate lives in Logger.callHandlers, which is bypassed here,
+            # so skip sinks whose level is above the record.
+            if levelno < handler.level:
+                continue
+            # Inline Handler.handle(): only call filter() when the sink has filters.
+            sink_record = record
+            if handler.filters:
+                filtered = handler.filter(record)
+                if not filtered:
+                    continue
+                if isinstance(filtered, logging.LogRecord):
+                    sink_record = filtered
+            handler.acquire()
             try:
-                handler.handle(record)
+                handler.emit(sink_record)
             except Exception:
                 if not self.swallow_errors:
                     raise
-                self._log_sink_failure(handler, record, sys.exc_info())
+                self._log_sink_failure(handler, sink_record, sys.exc_info())
+            finally:
+                handler.release()
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        """Dispatch a batch of records, taking each sink's lock once per batch.
+
+        Applies the same level gate, filters, and failure isolation as
+        :meth:`emit`.  Sinks that define ``emit_many`` receive all accepted
+        records in one call; other sinks get ``emit`` per record.  Called from
+        the single queue listener thread.  Sinks may receive the caller's
+        ``records`` list itself and must not mutate it.
+        """
+        lowest_levelno = min(record.levelno for record in records)
+        for handler in self.handlers:
+            level = handler.level
+            accepted: list[logging.LogRecord]
+            if level <= lowest_levelno and not handler.filters:
+                # Nothing to drop: share the batch list instead of building a copy per sink.
+                accepted = records
+            else:
+                accepted = []
+                for record in records:
+                    if record.levelno < level:
+                        continue
+                    filtered = handler.filter(record)
+                    if filtered:
+                        accepted.append(filtered if isinstance(filtered, logging.LogRecord) else record)
+            if not accepted:
+                continue
+
+            emit_many = getattr(type(handler), "emit_many", None)
+            handler.acquire()
+            try:
+                if emit_many is not None:
+                    self._emit_many(handler, accepted)
+                else:
+                    for record in accepted:
+                        try:
+                            handler.emit(record)
+                        except Exception:
+                            if not self.swallow_errors:
+                                raise
+                            self._log_sink_failure(handler, record, sys.exc_info())
+            finally:
+                handler.release()
+
+    def _emit_many(self, handler: logging.Handler, records: list[logging.LogRecord]) -> None:
+        """Hand *records* to a sink's ``emit_many`` fast path, logging every record on failure."""
+        try:
+            handler.emit_many(records)  # type: ignore[attr-defined]
+        except Exception:
+            if not self.swallow_errors:
+                raise
+            exc_info = sys.exc_info()
+            # Every record failed with the same exception: render its traceback once for the batch.
+            traceback_text = "".join(traceback.format_exception(*exc_info))
+            for record in records:
+                self._log_sink_failure(handler, record, exc_info, traceback_text)
 
     def _log_sink_failure(
         self,
         handler: logging.Handler,
         record: logging.LogRecord,
         exc_info: tuple[type[BaseException] | None, BaseException | None, TracebackType | None],
+        traceback_text: str | None = None,
     ) -> None:
-        """Write sink failure details to fallback file."""
+        """Write sink failure details to fallback file.
+
+        ``traceback_text`` is the pre-rendered traceback of ``exc_info``; it is
+        rendered here when not supplied.
+        """
         payload = normalize_log_record(record)
-        traceback_text = "".join(traceback.format_exception(*exc_info))
+        if traceback_text is None:
+            traceback_text = "".join(traceback.format_exception(*exc_info))
         failure_record = logging.LogRecord(
             name="sink_fallback",
             level=logging.ERROR,
@@ -66,8 +197,9 @@ class RouterHandler(logging.Handler):
             f"handler={handler_name} | "
             f"error={error!r} | "
             f"original_level={record.levelname} | "
-            f"original_msg={record.getMessage()} | "
+            f"original_msg={rendered_message(record)} | "
             f"original_payload={payload}\n"
             f"Traceback:\n{traceback_text}"
         )
-        self._fallback.emit(failure_record)
+        # handle() takes the fallback's lock: buffered sinks report from their flusher threads too
+        self._fallback.handle(failure_record)
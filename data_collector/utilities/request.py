@@ -10,14 +10,22 @@ Classes:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import heapq
+import itertools
 import logging
+import math
 import random
+import re
 import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
-from enum import StrEnum
+from enum import IntFlag, StrEnum
 from pathlib import Path
-from typing import Any, TypedDict, cast
+from typing import Any, NamedTuple, TypedDict, cast
 from urllib.parse import urlparse
 
 import httpx
@@ -26,6 +34,8 @@ import zeep
 from zeep.exceptions import Fault, TransportError
 from zeep.transports import Transport
 
+from data_collector.utilities.functions.runtime import is_module_available
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,160 +50,305 @@ class RequestErrorType(StrEnum):
     OTHER = "other"
 
 
+# Counter attribute name per error type, e.g. "timeout" -> "timeout_err"
+_ERROR_COUNTER_NAMES: dict[str, str] = {error_type.value: f"{error_type.value}_err" for error_type in RequestErrorType}
+
+
+class _ErrorFlag(IntFlag):
+    """Classification bits of the last recorded error, see ``Request._last_error_flags``."""
+
+    BLOCKED = 1
+    PROXY = 2
+    TIMEOUT = 4
+    SERVER_DOWN = 8
+
+
 class _ProxyStats(TypedDict):
     count: int
     success: int
-    timings: list[float]
+    timings: _Reservoir
+
 
+class _TargetFailure(NamedTuple):
+    """Immutable circuit breaker entry; replaced wholesale so readers need no lock."""
 
-class _TargetFailure(TypedDict):
     failures: int
-    proxies: set[str]
+    proxies: frozenset[str]
+
+
+@functools.lru_cache(maxsize=4096)
+def _url_parts(url: str) -> tuple[str, str]:
+    """Return ``(netloc, flattened_path)`` of *url*; memoized because scrapers revisit the same URLs."""
+    parsed = urlparse(url)
+    return parsed.netloc, parsed.path.strip("/").replace("/", "_") or "index"
 
 
 class ExceptionDescriptor:
-    """Tracks errors with timestamps for time-based analysis."""
+    """Tracks the most recent errors with timestamps for time-based analysis.
 
-    def __init__(self) -> None:
-        self.errors: dict[datetime, dict[str, str]] = {}
+    Args:
+        max_errors: Number of most recent errors kept; older entries are discarded.
+    """
+
+    def __init__(self, max_errors: int = 256) -> None:
+        self.errors: deque[tuple[datetime, dict[str, str]]] = deque(maxlen=max_errors)
 
     def add_error(self, error_type: str, message: str, url: str | None = None) -> None:
         """Record an error with the current timestamp."""
-        self.errors[datetime.now(UTC)] = {
+        self.errors.append((datetime.now(UTC), {
             "type": error_type,
             "message": message,
             "url": url or "",
-        }
+        }))
 
     def get_last_error(self) -> dict[str, str] | None:
         """Return the most recent error dict, or None."""
-        return next(reversed(self.errors.values()), None)
+        return self.errors[-1][1] if self.errors else None
 
     def get_errors_by_type(self, error_type: str) -> list[dict[str, str]]:
-        """Return all errors matching the given type string."""
-        return [v for v in self.errors.values() if v["type"] == error_type]
+        """Return all retained errors matching the given type string."""
+        return [error for _, error in self.errors if error["type"] == error_type]
 
     def has_errors_after(self, timestamp: datetime) -> bool:
         """Return True if any error was recorded after the given timestamp."""
-        return any(err_time > timestamp for err_time in self.errors)
+        # Entries are appended in time order, so only the newest one needs checking
+        return bool(self.errors) and self.errors[-1][0] > timestamp
 
     def clear(self) -> None:
         """Remove all recorded errors."""
         self.errors.clear()
 
 
+class _LockFreeCounter:
+    """Integer counter attribute stored as an ``itertools.count``.
+
+    ``next()`` on a count is a single C call, which the GIL makes atomic, so
+    increments need no lock. Reads and assignments go through
+    ``RequestMetrics._read_counter`` / ``_assign_counter``.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: RequestMetrics | None, owner: type) -> Any:
+        if instance is None:
+            return self
+        return instance._read_counter(self._name)  # pyright: ignore[reportPrivateUsage]
+
+    def __set__(self, instance: RequestMetrics, value: int) -> None:
+        instance._assign_counter(self._name, value)  # pyright: ignore[reportPrivateUsage]
+
+
+class _Reservoir:
+    """Fixed-size uniform sample of a stream, maintained with Algorithm L.
+
+    Once full, the number of items to skip before the next replacement is drawn
+    from a geometric distribution, so the RNG is only consulted on insertions
+    instead of on every offered item.
+    """
+
+    __slots__ = ("samples", "_size", "_weight", "_next_insert")
+
+    def __init__(self, size: int) -> None:
+        self.samples: list[float] = []
+        self._size = size
+        self._weight = 1.0
+        self._next_insert = 0
+
+    def offer(self, value: float, seen: int) -> None:
+        """Offer the *seen*-th item (1-based) of the stream to the sample."""
+        if len(self.samples) < self._size:
+            self.samples.append(value)
+            if len(self.samples) == self._size:
+                self._advance(seen)
+        elif seen == self._next_insert:
+            # int(random() * k) is one C call; randrange() goes through Python-level _randbelow()
+            self.samples[int(random.random() * self._size)] = value
+            self._advance(seen)
+
+    def _advance(self, seen: int) -> None:
+        """Shrink the acceptance weight and schedule the next replacement."""
+        # random() may return 0.0; log() needs a strictly positive argument
+        self._weight *= math.exp(math.log(random.random() or 1e-300) / self._size)
+        skip = math.log(random.random() or 1e-300) / math.log1p(-min(self._weight, 1.0 - 2 ** -53))
+        self._next_insert = seen + math.floor(skip) + 1
+
+
+class _DomainShard:
+    """Per-domain metrics guarded by one stripe lock of ``RequestMetrics``."""
+
+    __slots__ = ("lock", "timings", "request_counts", "success_counts", "status_codes", "target_failures")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Per-domain timing reservoir: {domain: _Reservoir of response_time_ms}
+        self.timings: dict[str, _Reservoir] = {}
+        # Total requests per domain (stream position for the reservoir)
+        self.request_counts: dict[str, int] = {}
+        # 2xx responses per domain, kept alongside status_codes so stats need no scan
+        self.success_counts: dict[str, int] = {}
+        # Per-domain status codes: {domain: {status_code: count}}
+        self.status_codes: dict[str, dict[int, int]] = {}
+        # Circuit breaker: {domain: _TargetFailure(failures, proxies)}
+        self.target_failures: dict[str, _TargetFailure] = {}
+
+
+class _ProxyShard:
+    """Per-proxy metrics guarded by one stripe lock of ``RequestMetrics``."""
+
+    __slots__ = ("lock", "stats")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Per-proxy stats: {proxy_key: {"count": int, "success": int, "timings": _Reservoir}}
+        self.stats: dict[str, _ProxyStats] = {}
+
+
 class RequestMetrics:
     """Thread-safe shared metrics collector for multi-threaded HTTP operations.
 
     Created once per runtime and passed to every Request instance. Aggregates
     error counters, timing data, status codes, per-proxy stats, and circuit
     breaker state across all threads.
+
+    Per-domain and per-proxy state is striped over ``SHARD_COUNT`` shards, each
+    with its own lock, so threads hitting different domains or proxies do not
+    contend. Global counters are incremented without any lock.
     """
 
     RESERVOIR_SIZE: int = 1000
+    SHARD_COUNT: int = 16
+
+    # Aggregated error counters
+    request_count = _LockFreeCounter()
+    timeout_err = _LockFreeCounter()
+    proxy_err = _LockFreeCounter()
+    bad_status_code_err = _LockFreeCounter()
+    redirect_err = _LockFreeCounter()
+    request_err = _LockFreeCounter()
+    other_err = _LockFreeCounter()
 
     def __init__(
         self,
         max_target_failures: int = 3,
         min_distinct_proxies: int = 2,
     ) -> None:
-        self._lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+        counter_names = ("request_count", *_ERROR_COUNTER_NAMES.values())
+        self._counters: dict[str, itertools.count[int]] = {name: itertools.count() for name in counter_names}
+        self._counter_reads: dict[str, itertools.count[int]] = {name: itertools.count() for name in counter_names}
 
-        # Aggregated error counters
-        self.request_count: int = 0
-        self.timeout_err: int = 0
-        self.proxy_err: int = 0
-        self.bad_status_code_err: int = 0
-        self.redirect_err: int = 0
-        self.request_err: int = 0
-        self.other_err: int = 0
+        self._domain_shards = tuple(_DomainShard() for _ in range(self.SHARD_COUNT))
+        self._proxy_shards = tuple(_ProxyShard() for _ in range(self.SHARD_COUNT))
+        self._max_target_failures = max_target_failures
+        self._min_distinct_proxies = min_distinct_proxies
 
-        # Per-domain timing reservoir: {domain: [response_time_ms, ...]}
-        self._domain_timings: dict[str, list[float]] = {}
-        # Total requests per domain (needed for reservoir Algorithm R)
-        self._domain_request_counts: dict[str, int] = {}
+    def _read_counter(self, name: str) -> int:
+        """Return the current value of a lock-free counter.
 
-        # Per-domain status codes: {domain: {status_code: count}}
-        self._domain_status_codes: dict[str, dict[int, int]] = {}
+        Reading consumes one step of the count, so a second count tracks the
+        reads and is subtracted; reads are serialized by ``_counter_lock``.
+        """
+        with self._counter_lock:
+            return next(self._counters[name]) - next(self._counter_reads[name])
+
+    def _read_error_counters(self) -> dict[str, int]:
+        """Return every error counter keyed by error type, under one lock acquisition."""
+        with self._counter_lock:
+            return {
+                error_type: next(self._counters[name]) - next(self._counter_reads[name])
+                for error_type, name in _ERROR_COUNTER_NAMES.items()
+            }
 
-        # Per-proxy stats: {proxy_key: {"count": int, "success": int, "timings": list}}
-        self._proxy_stats: dict[str, _ProxyStats] = {}
+    def _assign_counter(self, name: str, value: int) -> None:
+        """Reset a lock-free counter to *value*."""
+        with self._counter_lock:
+            self._counters[name] = itertools.count(value)
+            self._counter_reads[name] = itertools.count()
 
-        # Circuit breaker: {domain: {"failures": int, "proxies": set}}
-        self._target_failures: dict[str, _TargetFailure] = {}
-        self._max_target_failures = max_target_failures
-        self._min_distinct_proxies = min_distinct_proxies
+    def _domain_shard(self, domain: str) -> _DomainShard:
+        """Return the shard owning *domain*."""
+        return self._domain_shards[hash(domain) & (self.SHARD_COUNT - 1)]
+
+    def _proxy_shard(self, proxy_key: str) -> _ProxyShard:
+        """Return the shard owning *proxy_key*."""
+        return self._proxy_shards[hash(proxy_key) & (self.SHARD_COUNT - 1)]
 
     def record_request(
         self, domain: str, proxy: str | None, status_code: int, response_time_ms: float
     ) -> None:
         """Record a completed HTTP request. Called by Request._make_request()."""
-        with self._lock:
-            self.request_count += 1
+        is_success = 200 <= status_code < 300
+        proxy_key = proxy or "direct"
 
-            # Domain timing — reservoir sampling (Algorithm R)
-            if domain not in self._domain_timings:
-                self._domain_timings[domain] = []
-                self._domain_request_counts[domain] = 0
-            self._domain_request_counts[domain] += 1
-            n = self._domain_request_counts[domain]
-            reservoir = self._domain_timings[domain]
-            if len(reservoir) < self.RESERVOIR_SIZE:
-                reservoir.append(response_time_ms)
-            else:
-                j = random.randint(0, n - 1)
-                if j < self.RESERVOIR_SIZE:
-                    reservoir[j] = response_time_ms
+        next(self._counters["request_count"])
+        # Increment bad_status_code_err for non-2xx
+        if not is_success:
+            next(self._counters["bad_status_code_err"])
+
+        shard = self._domain_shard(domain)
+        with shard.lock:
+            # Domain timing — reservoir sampling (Algorithm L)
+            if domain not in shard.timings:
+                shard.timings[domain] = _Reservoir(self.RESERVOIR_SIZE)
+                shard.request_counts[domain] = 0
+            shard.request_counts[domain] += 1
+            shard.timings[domain].offer(response_time_ms, shard.request_counts[domain])
 
             # Domain status codes
-            if domain not in self._domain_status_codes:
-                self._domain_status_codes[domain] = {}
-            codes = self._domain_status_codes[domain]
+            if domain not in shard.status_codes:
+                shard.status_codes[domain] = {}
+            codes = shard.status_codes[domain]
             codes[status_code] = codes.get(status_code, 0) + 1
 
-            # Per-proxy stats
-            proxy_key = proxy or "direct"
-            if proxy_key not in self._proxy_stats:
-                self._proxy_stats[proxy_key] = {"count": 0, "success": 0, "timings": []}
-            pstat = self._proxy_stats[proxy_key]
-            pstat["count"] += 1
-            if 200 <= status_code < 300:
-                pstat["success"] += 1
-            ptimings = pstat["timings"]
-            if len(ptimings) < self.RESERVOIR_SIZE:
-                ptimings.append(response_time_ms)
-            else:
-                j = random.randint(0, pstat["count"] - 1)
-                if j < self.RESERVOIR_SIZE:
-                    ptimings[j] = response_time_ms
-
             # Circuit breaker — reset on success (2xx)
-            if 200 <= status_code < 300:
-                self._target_failures.pop(domain, None)
+            if is_success:
+                shard.success_counts[domain] = shard.success_counts.get(domain, 0) + 1
+                shard.target_failures.pop(domain, None)
             else:
-                self._record_target_failure(domain, proxy_key)
+                self._record_target_failure(shard, domain, proxy_key)
 
-            # Increment bad_status_code_err for non-2xx
-            if not (200 <= status_code < 300):
-                self.bad_status_code_err += 1
+        proxy_shard = self._proxy_shard(proxy_key)
+        with proxy_shard.lock:
+            if proxy_key not in proxy_shard.stats:
+                proxy_shard.stats[proxy_key] = {
+                    "count": 0, "success": 0, "timings": _Reservoir(self.RESERVOIR_SIZE),
+                }
+            pstat = proxy_shard.stats[proxy_key]
+            pstat["count"] += 1
+            if is_success:
+                pstat["success"] += 1
+            pstat["timings"].offer(response_time_ms, pstat["count"])
 
     def record_error(self, domain: str, proxy: str | None, error_type: str) -> None:
         """Record an HTTP error. Called by Request._make_request() on exception."""
         proxy_key = proxy or "direct"
-        with self._lock:
-            self.request_count += 1
-            counter_name = f"{error_type}_err"
-            if hasattr(self, counter_name):
-                setattr(self, counter_name, getattr(self, counter_name) + 1)
-            self._record_target_failure(domain, proxy_key)
-
-    def _record_target_failure(self, domain: str, proxy_key: str) -> None:
-        """Update circuit breaker state. Must be called with lock held."""
-        if domain not in self._target_failures:
-            self._target_failures[domain] = {"failures": 0, "proxies": set()}
-        entry = self._target_failures[domain]
-        entry["failures"] += 1
-        entry["proxies"].add(proxy_key)
+        next(self._counters["request_count"])
+        counter_name = _ERROR_COUNTER_NAMES.get(error_type)
+        if counter_name is not None:
+            next(self._counters[counter_name])
+        shard = self._domain_shard(domain)
+        # Once a target is unhealthy through this proxy, further failures change nothing
+        # observable until a success resets it, so skip the lock during failure bursts
+        entry = shard.target_failures.get(domain)
+        if entry is not None and proxy_key in entry.proxies and self._is_tripped(entry):
+            return
+        with shard.lock:
+            self._record_target_failure(shard, domain, proxy_key)
+
+    @staticmethod
+    def _record_target_failure(shard: _DomainShard, domain: str, proxy_key: str) -> None:
+        """Update circuit breaker state. Must be called with the shard lock held.
+
+        The entry is replaced, never mutated, so ``is_target_unhealthy`` can
+        read it without the lock.
+        """
+        entry = shard.target_failures.get(domain)
+        if entry is None:
+            shard.target_failures[domain] = _TargetFailure(1, frozenset((proxy_key,)))
+            return
+        proxies = entry.proxies if proxy_key in entry.proxies else entry.proxies | {proxy_key}
+        shard.target_failures[domain] = _TargetFailure(entry.failures + 1, proxies)
 
     def is_target_unhealthy(self, url: str) -> bool:
         """Circuit breaker check.
@@ -201,94 +356,113 @@ class RequestMetrics:
         Returns True if a target has failed >= max_target_failures times across
         >= min_distinct_proxies different proxies.
         """
-        domain = urlparse(url).netloc
-        with self._lock:
-            entry = self._target_failures.get(domain)
-            if entry is None:
-                return False
-            return (
-                entry["failures"] >= self._max_target_failures
-                and len(entry["proxies"]) >= self._min_distinct_proxies
-            )
+        domain = _url_parts(url)[0]
+        # Lock-free read: entries are immutable and swapped in by a single dict store
+        entry = self._domain_shard(domain).target_failures.get(domain)
+        return entry is not None and self._is_tripped(entry)
+
+    def _is_tripped(self, entry: _TargetFailure) -> bool:
+        """Return True if *entry* crosses both circuit breaker thresholds."""
+        return entry.failures >= self._max_target_failures and len(entry.proxies) >= self._min_distinct_proxies
+
+    def error_stats(self) -> dict[str, Any]:
+        """Return request and error totals from the global counters only.
+
+        Takes no shard lock and computes no percentiles, so it is cheap enough
+        for periodic checks such as ``BaseScraper.fatal_check()``.
+        """
+        # Read each lock-free counter once
+        request_count: int = self.request_count
+        error_counts = self._read_error_counters()
+        total_errors = sum(error_counts.values())
+        error_rate = (total_errors / request_count * 100) if request_count > 0 else 0.0
+
+        # Build error breakdown dynamically
+        error_breakdown: dict[str, int] = {attr: val for attr, val in error_counts.items() if val > 0}
+
+        return {
+            "total_requests": request_count,
+            "total_errors": total_errors,
+            "error_rate_percent": round(error_rate, 2),
+            "error_breakdown": error_breakdown,
+        }
 
     def log_stats(self, logger: logging.Logger) -> dict[str, Any]:
         """Log and return aggregated statistics dictionary."""
-        with self._lock:
-            total_errors = (
-                self.timeout_err + self.proxy_err + self.bad_status_code_err
-                + self.redirect_err + self.request_err + self.other_err
-            )
-            error_rate = (total_errors / self.request_count * 100) if self.request_count > 0 else 0.0
-
-            # Build error breakdown dynamically
-            error_breakdown: dict[str, int] = {}
-            for attr in ("timeout", "proxy", "bad_status_code", "redirect", "request", "other"):
-                val: int = getattr(self, f"{attr}_err")
-                if val > 0:
-                    error_breakdown[attr] = val
+        stats = self.compute_stats()
+        logger.info("Request statistics", extra={"request_stats": stats})
+        return stats
+
+    def compute_stats(self) -> dict[str, Any]:
+        """Return aggregated statistics dictionary without logging it.
+
+        Takes every shard lock (domain shards, then proxy shards) so the
+        per-domain and per-proxy snapshot is consistent; this is the rare path.
+        """
+        stats = self.error_stats()
+        with contextlib.ExitStack() as stack:
+            for shard in self._domain_shards:
+                stack.enter_context(shard.lock)
+            for proxy_shard in self._proxy_shards:
+                stack.enter_context(proxy_shard.lock)
 
             # Aggregate timing from all domains
             all_timings: list[float] = []
-            for timings in self._domain_timings.values():
-                all_timings.extend(timings)
-            timing = self._compute_timing(all_timings)
-
-            # By domain
             by_domain: dict[str, dict[str, Any]] = {}
-            for domain, timings in self._domain_timings.items():
-                domain_count = self._domain_request_counts.get(domain, 0)
-                codes = self._domain_status_codes.get(domain, {})
-                success = sum(v for k, v in codes.items() if 200 <= k < 300)
-                by_domain[domain] = {
-                    "count": domain_count,
-                    "success": success,
-                    "p95_ms": self._percentile(timings, 0.95),
-                    "status_codes": {str(k): v for k, v in sorted(codes.items())},
-                }
+            for shard in self._domain_shards:
+                for domain, reservoir in shard.timings.items():
+                    timings = reservoir.samples
+                    all_timings.extend(timings)
+                    codes = shard.status_codes.get(domain, {})
+                    by_domain[domain] = {
+                        "count": shard.request_counts.get(domain, 0),
+                        "success": shard.success_counts.get(domain, 0),
+                        "p95_ms": self._percentile(timings, 0.95),
+                        "status_codes": {str(k): v for k, v in sorted(codes.items())},
+                    }
+            timing = self._compute_timing(all_timings)
 
             # By proxy
             by_proxy: dict[str, dict[str, Any]] = {}
-            for proxy_key, pstat in self._proxy_stats.items():
-                by_proxy[proxy_key] = {
-                    "count": pstat["count"],
-                    "success": pstat["success"],
-                    "p95_ms": self._percentile(pstat["timings"], 0.95),
-                }
-
-            stats: dict[str, Any] = {
-                "total_requests": self.request_count,
-                "total_errors": total_errors,
-                "error_rate_percent": round(error_rate, 2),
-                "error_breakdown": error_breakdown,
-                "timing": timing,
-                "by_domain": by_domain,
-                "by_proxy": by_proxy,
-            }
+            for proxy_shard in self._proxy_shards:
+                for proxy_key, pstat in proxy_shard.stats.items():
+                    by_proxy[proxy_key] = {
+                        "count": pstat["count"],
+                        "success": pstat["success"],
+                        "p95_ms": self._percentile(pstat["timings"].samples, 0.95),
+                    }
+
+            stats["timing"] = timing
+            stats["by_domain"] = by_domain
+            stats["by_proxy"] = by_proxy
 
-        logger.info("Request statistics", extra={"request_stats": stats})
         return stats
 
     @staticmethod
     def _compute_timing(timings: list[float]) -> dict[str, float | int]:
-        """Compute avg/p50/p95/p99 from a timing list."""
+        """Compute avg/p50/p95/p99 from a timing list, sorting it once."""
         if not timings:
             return {"avg_ms": 0, "p50_ms": 0, "p95_ms": 0, "p99_ms": 0}
+        sorted_data = sorted(timings)
+        last = len(sorted_data) - 1
         return {
             "avg_ms": round(sum(timings) / len(timings)),
-            "p50_ms": RequestMetrics._percentile(timings, 0.50),
-            "p95_ms": RequestMetrics._percentile(timings, 0.95),
-            "p99_ms": RequestMetrics._percentile(timings, 0.99),
+            "p50_ms": round(sorted_data[min(int(len(sorted_data) * 0.50), last)]),
+            "p95_ms": round(sorted_data[min(int(len(sorted_data) * 0.95), last)]),
+            "p99_ms": round(sorted_data[min(int(len(sorted_data) * 0.99), last)]),
         }
 
     @staticmethod
     def _percentile(data: list[float], pct: float) -> int:
-        """Compute a percentile value from a list of numbers."""
+        """Compute a percentile value from a list of numbers.
+
+        Only the values above the percentile rank are selected (``heapq.nlargest``),
+        which avoids sorting the whole list for the high percentiles used here.
+        """
         if not data:
             return 0
-        sorted_data = sorted(data)
-        idx = int(len(sorted_data) * pct)
-        idx = min(idx, len(sorted_data) - 1)
-        return round(sorted_data[idx])
+        idx = min(int(len(data) * pct), len(data) - 1)
+        return round(heapq.nlargest(len(data) - idx, data)[-1])
 
 
 class Request:
@@ -302,8 +476,20 @@ class Request:
         save_responses: Save raw responses to disk.
         save_dir: Directory for saved responses.
         metrics: Shared RequestMetrics collector for multi-threaded aggregation.
+        background_save: Write saved responses from a worker thread so the
+            request returns without waiting for disk I/O; ``close()`` waits
+            for pending writes.
+        http2: Negotiate HTTP/2 so concurrent requests to one host share a
+            connection. Requires the optional ``http2`` extra (``h2``).
     """
 
+    # Connection pool size of the reusable httpx clients
+    MAX_CONNECTIONS: int = 100
+    MAX_KEEPALIVE_CONNECTIONS: int = 50
+
+    _FORCIBLY_CLOSED = re.compile("forcibly closed", re.IGNORECASE)
+    _TIMEOUT = re.compile("timeout", re.IGNORECASE)
+
     _REQUEST_ERROR_TO_CATEGORY: dict[str, str] = {
         RequestErrorType.TIMEOUT: "http",
         RequestErrorType.PROXY: "proxy",
@@ -322,15 +508,22 @@ class Request:
         save_responses: bool = False,
         save_dir: str | None = None,
         metrics: RequestMetrics | None = None,
+        background_save: bool = False,
+        http2: bool = False,
     ) -> None:
         # Transport config
         self._timeout = timeout
         self._retries = retries
         self._backoff_factor = backoff_factor
-        self._retry_on_status = retry_on_status or [429, 500, 502, 503, 504]
+        self._retry_on_status: frozenset[int] = frozenset(retry_on_status or (429, 500, 502, 503, 504))
         self._save_responses = save_responses
         self._save_dir = save_dir
         self._metrics = metrics
+        self._background_save = background_save
+        if http2 and not is_module_available("h2"):
+            raise ValueError("HTTP/2 requires the 'h2' package. Install the 'http2' extra.")
+        self._http2 = http2
+        self._save_executor: ThreadPoolExecutor | None = None
 
         # Session state (mutable via setters)
         self._headers: dict[str, str] = {}
@@ -430,8 +623,17 @@ class Request:
             self._no_retry_statuses = set(statuses)
 
     def close(self) -> None:
-        """Close reusable httpx clients and release connections."""
+        """Close reusable httpx clients, release connections and finish pending response saves."""
         self._invalidate_clients()
+        if self._save_executor is not None:
+            self._save_executor.shutdown(wait=True)
+            self._save_executor = None
+
+    def __enter__(self) -> Request:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _invalidate_clients(self) -> None:
         """Close and discard cached httpx clients."""
@@ -458,8 +660,8 @@ class Request:
 
     def _get_client(self) -> httpx.Client:
         """Return a reusable sync httpx.Client, creating one if needed."""
-        kwargs = self._build_client_kwargs()
         if self._client is None:
+            kwargs = self._build_client_kwargs()
             self._client = httpx.Client(**kwargs)
             self._client_kwargs_snapshot = kwargs
         return self._client
@@ -507,6 +709,9 @@ class Request:
         kwargs: dict[str, Any] = {
             "timeout": self._timeout,
             "follow_redirects": True,
+            "limits": httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS, max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            ),
         }
         if self._headers:
             kwargs["headers"] = self._headers
@@ -516,6 +721,8 @@ class Request:
             kwargs["auth"] = self._auth
         if self._proxy:
             kwargs["proxy"] = self._proxy
+        if self._http2:
+            kwargs["http2"] = True
         return kwargs
 
     def _make_request(self, method: str, url: str, **kwargs: Any) -> httpx.Response | None:
@@ -527,46 +734,48 @@ class Request:
         proxy_key = self._get_proxy_key()
 
         client = self._get_client()
+        # Loop-invariant attributes as locals for the retry loop
+        metrics = self._metrics
+        retries = self._retries
 
-        for attempt in range(self._retries + 1):
+        for attempt in range(retries + 1):
             try:
-                start = time.monotonic()
-                self.response = client.request(method, url, **kwargs)
-                elapsed_ms = (time.monotonic() - start) * 1000
+                start = time.monotonic_ns()
+                response = self.response = client.request(method, url, **kwargs)
+                elapsed_ms = (time.monotonic_ns() - start) / 1_000_000
+                status = response.status_code
 
                 self.request_count += 1
-                if self._metrics:
-                    self._metrics.record_request(domain, proxy_key, self.response.status_code, elapsed_ms)
-
-                status = self.response.status_code
+                if metrics:
+                    metrics.record_request(domain, proxy_key, status, elapsed_ms)
 
                 # Success
                 if 200 <= status < 300:
                     self._last_request_time = datetime.now(UTC)
                     if self._save_responses:
                         self._auto_save_response(url)
-                    return self.response
+                    return response
 
                 # No retry for certain status codes
                 if status in self._no_retry_statuses:
                     self._record_error(RequestErrorType.BAD_STATUS, f"HTTP {status}", url)
-                    return self.response
+                    return response
 
                 # Retryable status
-                if status in self._retry_on_status and attempt < self._retries:
+                if status in self._retry_on_status and attempt < retries:
                     time.sleep(self._backoff_delay(attempt))
                     continue
 
                 # Non-retryable non-2xx
                 self._record_error(RequestErrorType.BAD_STATUS, f"HTTP {status}", url)
-                return self.response
+                return response
 
             except Exception as exc:
                 self.request_count += 1
                 error_type, retryable = self._classify_exception(exc)
-                if self._metrics:
-                    self._metrics.record_error(domain, proxy_key, error_type)
-                if retryable and attempt < self._retries:
+                if metrics:
+                    metrics.record_error(domain, proxy_key, error_type)
+                if retryable and attempt < retries:
                     time.sleep(self._backoff_delay(attempt))
                     continue
                 self._record_error(error_type, str(exc), url)
@@ -583,42 +792,44 @@ class Request:
         proxy_key = self._get_proxy_key()
 
         client = await self._get_async_client()
+        # Loop-invariant attributes as locals for the retry loop
+        metrics = self._metrics
+        retries = self._retries
 
-        for attempt in range(self._retries + 1):
+        for attempt in range(retries + 1):
             try:
-                start = time.monotonic()
-                self.response = await client.request(method, url, **kwargs)
-                elapsed_ms = (time.monotonic() - start) * 1000
+                start = time.monotonic_ns()
+                response = self.response = await client.request(method, url, **kwargs)
+                elapsed_ms = (time.monotonic_ns() - start) / 1_000_000
+                status = response.status_code
 
                 self.request_count += 1
-                if self._metrics:
-                    self._metrics.record_request(domain, proxy_key, self.response.status_code, elapsed_ms)
-
-                status = self.response.status_code
+                if metrics:
+                    metrics.record_request(domain, proxy_key, status, elapsed_ms)
 
                 if 200 <= status < 300:
                     self._last_request_time = datetime.now(UTC)
                     if self._save_responses:
                         self._auto_save_response(url)
-                    return self.response
+                    return response
 
                 if status in self._no_retry_statuses:
                     self._record_error(RequestErrorType.BAD_STATUS, f"HTTP {status}", url)
-                    return self.response
+                    return response
 
-                if status in self._retry_on_status and attempt < self._retries:
+                if status in self._retry_on_status and attempt < retries:
                     await asyncio.sleep(self._backoff_delay(attempt))
                     continue
 
                 self._record_error(RequestErrorType.BAD_STATUS, f"HTTP {status}", url)
-                return self.response
+                return response
 
             except Exception as exc:
                 self.request_count += 1
                 error_type, retryable = self._classify_exception(exc)
-                if self._metrics:
-                    self._metrics.record_error(domain, proxy_key, error_type)
-                if retryable and attempt < self._retries:
+                if metrics:
+                    metrics.record_error(domain, proxy_key, error_type)
+                if retryable and attempt < retries:
                     await asyncio.sleep(self._backoff_delay(attempt))
                     continue
                 self._record_error(error_type, str(exc), url)
@@ -629,14 +840,14 @@ class Request:
     def _record_error(self, error_type: str, message: str, url: str) -> None:
         """Record error in ExceptionDescriptor and increment local counter."""
         self.exception_descriptor.add_error(error_type, message, url)
-        counter_name = f"{error_type}_err"
-        if hasattr(self, counter_name):
+        counter_name = _ERROR_COUNTER_NAMES.get(error_type)
+        if counter_name is not None:
             setattr(self, counter_name, getattr(self, counter_name) + 1)
 
     @staticmethod
     def _extract_domain(url: str) -> str:
         """Extract domain (netloc) from URL for metrics keying."""
-        return urlparse(url).netloc
+        return _url_parts(url)[0]
 
     def _get_proxy_key(self) -> str | None:
         """Return sanitized proxy identifier for metrics.
@@ -689,41 +900,42 @@ class Request:
             return False
         return self.exception_descriptor.has_errors_after(self._last_request_time)
 
-    def is_blocked(self) -> bool:
-        """True if the last error indicates IP block or forcibly closed connection."""
+    def _last_error_flags(self) -> _ErrorFlag:
+        """Classify the last recorded error once into ``_ErrorFlag`` bits."""
         last = self.exception_descriptor.get_last_error()
         if last is None:
-            return False
-        if (
-            last.get("type") == RequestErrorType.BAD_STATUS
-            and self.response is not None
-            and self.response.status_code in self._blocked_statuses
-        ):
-            return True
-        return "forcibly closed" in last.get("message", "").lower()
+            return _ErrorFlag(0)
+        flags = _ErrorFlag(0)
+        error_type = last.get("type")
+        if error_type == RequestErrorType.BAD_STATUS and self.response is not None:
+            status = self.response.status_code
+            if status in self._blocked_statuses:
+                flags |= _ErrorFlag.BLOCKED
+            if 500 <= status < 600:
+                flags |= _ErrorFlag.SERVER_DOWN
+        elif error_type == RequestErrorType.PROXY:
+            flags |= _ErrorFlag.PROXY
+        elif error_type == RequestErrorType.TIMEOUT:
+            flags |= _ErrorFlag.TIMEOUT
+        if self._FORCIBLY_CLOSED.search(last.get("message", "")):
+            flags |= _ErrorFlag.BLOCKED
+        return flags
+
+    def is_blocked(self) -> bool:
+        """True if the last error indicates IP block or forcibly closed connection."""
+        return _ErrorFlag.BLOCKED in self._last_error_flags()
 
     def is_proxy_error(self) -> bool:
         """True if the last error is a proxy/connection/SSL error."""
-        last = self.exception_descriptor.get_last_error()
-        if last is None:
-            return False
-        return last.get("type") == RequestErrorType.PROXY
+        return _ErrorFlag.PROXY in self._last_error_flags()
 
     def is_timeout(self) -> bool:
         """True if the last error is a timeout."""
-        last = self.exception_descriptor.get_last_error()
-        if last is None:
-            return False
-        return last.get("type") == RequestErrorType.TIMEOUT
+        return _ErrorFlag.TIMEOUT in self._last_error_flags()
 
     def is_server_down(self) -> bool:
         """True if the last error indicates a 5xx server error."""
-        last = self.exception_descriptor.get_last_error()
-        if last is None:
-            return False
-        if last.get("type") != RequestErrorType.BAD_STATUS:
-            return False
-        return self.response is not None and 500 <= self.response.status_code < 600
+        return _ErrorFlag.SERVER_DOWN in self._last_error_flags()
 
     def should_abort(self, logger: logging.Logger, proxy_on: bool = False) -> bool:
         """Returns True if a critical error occurred and the caller should stop.
@@ -735,15 +947,16 @@ class Request:
         if not self.has_errors():
             return False
 
-        if proxy_on and (self.is_blocked() or self.is_proxy_error()):
+        flags = self._last_error_flags()
+        if proxy_on and flags & (_ErrorFlag.BLOCKED | _ErrorFlag.PROXY):
             logger.debug("Aborting: proxy is blocked or not working")
             return True
 
-        if self.is_timeout():
+        if _ErrorFlag.TIMEOUT in flags:
             logger.debug("Aborting: page or proxy timeout")
             return True
 
-        if self.is_server_down():
+        if _ErrorFlag.SERVER_DOWN in flags:
             logger.debug("Aborting: server page is down")
             return True
 
@@ -817,17 +1030,13 @@ class Request:
         if self._metrics:
             return self._metrics.log_stats(logger)
 
-        total_errors = (
-            self.timeout_err + self.proxy_err + self.bad_status_code_err
-            + self.redirect_err + self.request_err + self.other_err
-        )
+        error_counts: dict[str, int] = {
+            error_type: getattr(self, name) for error_type, name in _ERROR_COUNTER_NAMES.items()
+        }
+        total_errors = sum(error_counts.values())
         error_rate = (total_errors / self.request_count * 100) if self.request_count > 0 else 0.0
 
-        error_breakdown: dict[str, int] = {}
-        for attr in ("timeout", "proxy", "bad_status_code", "redirect", "request", "other"):
-            val: int = getattr(self, f"{attr}_err")
-            if val > 0:
-                error_breakdown[attr] = val
+        error_breakdown: dict[str, int] = {attr: val for attr, val in error_counts.items() if val > 0}
 
         stats: dict[str, Any] = {
             "total_requests": self.request_count,
@@ -846,15 +1055,33 @@ class Request:
         content_type = self.response.headers.get("content-type", "")
         ext = ".json" if "json" in content_type else ".html"
 
-        parsed = urlparse(url)
-        domain = parsed.netloc.replace(":", "_")
-        path_part = parsed.path.strip("/").replace("/", "_") or "index"
+        netloc, path_part = _url_parts(url)
+        domain = netloc.replace(":", "_")
         timestamp = datetime.now(UTC).strftime("%Y-%m-%d_%H%M%S_%f")
         filename = f"{timestamp}_{domain}_{path_part}{ext}"
 
-        save_dir = Path(self._save_dir)
-        save_dir.mkdir(parents=True, exist_ok=True)
-        (save_dir / filename).write_bytes(self.response.content)
+        save_path = Path(self._save_dir) / filename
+        content = self.response.content
+        if not self._background_save:
+            self._write_saved_response(save_path, content)
+            return
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="request-save")
+        future = self._save_executor.submit(self._write_saved_response, save_path, content)
+        future.add_done_callback(self._log_save_failure)
+
+    @staticmethod
+    def _write_saved_response(save_path: Path, content: bytes) -> None:
+        """Write one saved response, creating its directory if needed."""
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        save_path.write_bytes(content)
+
+    @staticmethod
+    def _log_save_failure(future: Future[None]) -> None:
+        """Report a failed background response save; there is no caller to raise to."""
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Failed to save response", exc_info=exc)
 
     def create_soap_client(self, wsdl_url: str, **kwargs: Any) -> Any:
         """Create a Zeep SOAP client wired through this Request's session.
@@ -900,33 +1127,37 @@ class Request:
             Result from the SOAP call, or None on error.
         """
         self._last_request_time = datetime.now(UTC)
+        # Derive the sanitized proxy key once per call, and only when metrics will use it
+        metrics = self._metrics
+        proxy_key = self._get_proxy_key() if metrics else None
         try:
-            start = time.monotonic()
+            start = time.monotonic_ns()
             result = service_method(**params)
-            elapsed_ms = (time.monotonic() - start) * 1000
+            elapsed_ms = (time.monotonic_ns() - start) / 1_000_000
 
             self.request_count += 1
-            if self._metrics:
-                self._metrics.record_request("soap", self._get_proxy_key(), 200, elapsed_ms)
+            if metrics:
+                metrics.record_request("soap", proxy_key, 200, elapsed_ms)
             return result
 
         except Fault as exc:
             self._record_error(RequestErrorType.REQUEST, f"SOAP Fault: {exc.message}", "soap")
-            if self._metrics:
-                self._metrics.record_error("soap", self._get_proxy_key(), RequestErrorType.REQUEST)
+            if metrics:
+                metrics.record_error("soap", proxy_key, RequestErrorType.REQUEST)
             if raise_faults:
                 raise
             return None
 
         except TransportError as exc:
             self._record_error(RequestErrorType.PROXY, f"SOAP TransportError: {exc}", "soap")
-            if self._metrics:
-                self._metrics.record_error("soap", self._get_proxy_key(), RequestErrorType.PROXY)
+            if metrics:
+                metrics.record_error("soap", proxy_key, RequestErrorType.PROXY)
             return None
 
         except Exception as exc:
-            error_type = RequestErrorType.TIMEOUT if "timeout" in str(exc).lower() else RequestErrorType.OTHER
-            self._record_error(error_type, str(exc), "soap")
-            if self._metrics:
-                self._metrics.record_error("soap", self._get_proxy_key(), error_type)
+            message = str(exc)
+            error_type = RequestErrorType.TIMEOUT if self._TIMEOUT.search(message) else RequestErrorType.OTHER
+            self._record_error(error_type, message, "soap")
+            if metrics:
+                metrics.record_error("soap", proxy_key, error_type)
             return None
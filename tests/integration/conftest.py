@@ -4,6 +4,7 @@ import os
 from collections.abc import Generator
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
@@ -60,6 +61,9 @@ def session(db: Database, db_engine: Engine) -> Generator[Session]:
 
 @pytest.fixture()
 def clean_example_table(session: Session) -> None:
-    """Deletes all rows from example_table before the test."""
-    session.query(ExampleTable).delete()
+    """Truncates example_table before the test.
+
+    TRUNCATE drops the table's pages in one step, where DELETE scans and WAL-logs every row.
+    """
+    session.execute(text(f"TRUNCATE TABLE {ExampleTable.__tablename__} RESTART IDENTITY"))
     session.commit()
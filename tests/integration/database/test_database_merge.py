@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Any, cast
 
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from data_collector.tables.examples import ExampleTable
@@ -11,32 +12,45 @@ from data_collector.utilities.database.main import Database, Stats
 from data_collector.utilities.functions import runtime
 
 
-def make_example_rows(
+def example_row_mappings(
     count: int,
     company_id: int = 1,
     start_person_id: int = 1,
-) -> list[ExampleTable]:
-    """Create ExampleTable instances with unique sha values."""
-    rows: list[ExampleTable] = []
-    for i in range(count):
-        pid = start_person_id + i
+) -> list[dict[str, Any]]:
+    """Create ExampleTable column mappings with unique sha values."""
+    rows: list[dict[str, Any]] = []
+    for pid in range(start_person_id, start_person_id + count):
         data: dict[str, Any] = {
             "company_id": company_id,
             "person_id": pid,
             "name": f"Name{pid}",
             "surname": f"Surname{pid}",
         }
-        sha = str(runtime.make_hash(data))
-        rows.append(ExampleTable(
-            company_id=company_id,
-            person_id=pid,
-            name=f"Name{pid}",
-            surname=f"Surname{pid}",
-            sha=sha,
-        ))
+        data["sha"] = str(runtime.make_hash(data))
+        rows.append(data)
     return rows
 
 
+def make_example_rows(
+    count: int,
+    company_id: int = 1,
+    start_person_id: int = 1,
+) -> list[ExampleTable]:
+    """Create ExampleTable instances with unique sha values, as passed to db.merge()."""
+    return [ExampleTable(**data) for data in example_row_mappings(count, company_id, start_person_id)]
+
+
+def seed_examples(
+    session: Session,
+    count: int,
+    company_id: int = 1,
+    start_person_id: int = 1,
+) -> None:
+    """Insert existing rows with one Core executemany, skipping ORM object construction."""
+    session.execute(insert(ExampleTable), example_row_mappings(count, company_id, start_person_id))
+    session.commit()
+
+
 @pytest.mark.integration
 @pytest.mark.usefixtures("clean_example_table")
 class TestMergeInsert:
@@ -63,8 +77,7 @@ class TestMergeInsert:
 @pytest.mark.usefixtures("clean_example_table")
 class TestMergeArchive:
     def test_archives_removed_records(self, db: Database, session: Session) -> None:
-        rows_abc = make_example_rows(3)
-        db.merge(rows_abc, session)
+        seed_examples(session, 3)
 
         # Merge with only first 2 — third should be archived
         rows_ab = make_example_rows(2)
@@ -80,8 +93,7 @@ class TestMergeArchive:
         assert cast(Any, archived[0].person_id) == 3
 
     def test_archives_with_custom_date(self, db: Database, session: Session) -> None:
-        rows = make_example_rows(2)
-        db.merge(rows, session)
+        seed_examples(session, 2)
 
         fixed_date = datetime(2024, 1, 15, 12, 0, 0)
         rows_first_only = make_example_rows(1)
@@ -93,8 +105,7 @@ class TestMergeArchive:
         assert cast(Any, archived_row.archive) == fixed_date
 
     def test_no_archive_when_update_false(self, db: Database, session: Session) -> None:
-        rows = make_example_rows(2)
-        db.merge(rows, session)
+        seed_examples(session, 2)
 
         rows_first_only = make_example_rows(1)
         db.merge(rows_first_only, session, update=False, delete=False)
@@ -108,8 +119,7 @@ class TestMergeArchive:
 @pytest.mark.usefixtures("clean_example_table")
 class TestMergeDelete:
     def test_deletes_when_delete_true(self, db: Database, session: Session) -> None:
-        rows = make_example_rows(3)
-        db.merge(rows, session)
+        seed_examples(session, 3)
 
         rows_first_only = make_example_rows(1)
         db.merge(rows_first_only, session, delete=True, update=False)
@@ -122,8 +132,7 @@ class TestMergeStats:
     @pytest.mark.usefixtures("clean_example_table")
     def test_returns_stats(self, db: Database, session: Session) -> None:
         # Seed with A, B
-        rows_ab = make_example_rows(2)
-        db.merge(rows_ab, session)
+        seed_examples(session, 2)
 
         # Merge with B, C — A should be archived, C inserted
         row_b = make_example_rows(1, start_person_id=2)
@@ -159,9 +168,8 @@ class TestMergeStats:
 class TestMergeFilters:
     def test_filter_scoped_merge(self, db: Database, session: Session) -> None:
         # Insert 3 rows for company_id=1 and 2 rows for company_id=2
-        rows_cid1 = make_example_rows(3, company_id=1)
-        rows_cid2 = make_example_rows(2, company_id=2)
-        db.merge(rows_cid1 + rows_cid2, session)
+        seed_examples(session, 3, company_id=1)
+        seed_examples(session, 2, company_id=2)
         assert session.query(ExampleTable).count() == 5
 
         # Merge only 1 row for company_id=1, scoped by filter
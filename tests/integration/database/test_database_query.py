@@ -3,7 +3,7 @@
 from typing import Any
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.engine import Result
 from sqlalchemy.orm import Session
 
@@ -12,11 +12,17 @@ from data_collector.utilities.database.main import Database
 from data_collector.utilities.functions import runtime
 
 
-def make_row(person_id: int, company_id: int = 1) -> ExampleTable:
-    """Create a single ExampleTable instance with a computed sha."""
+def make_row(person_id: int, company_id: int = 1) -> dict[str, Any]:
+    """Create a single ExampleTable column mapping with a computed sha."""
     data: dict[str, Any] = {"company_id": company_id, "person_id": person_id}
     sha = str(runtime.make_hash(data))
-    return ExampleTable(company_id=company_id, person_id=person_id, name=f"P{person_id}", sha=sha)
+    return {**data, "name": f"P{person_id}", "sha": sha}
+
+
+def seed_rows(session: Session, rows: list[dict[str, Any]]) -> None:
+    """Insert rows to query with one Core executemany; the ORM identity map is not needed."""
+    session.execute(insert(ExampleTable), rows)
+    session.commit()
 
 
 @pytest.mark.integration
@@ -28,9 +34,7 @@ class TestQuery:
 
     @pytest.mark.usefixtures("clean_example_table")
     def test_returns_inserted_rows(self, db: Database, session: Session) -> None:
-        rows = [make_row(i) for i in range(1, 4)]
-        db.bulk_insert(rows, session=session)
-        session.commit()
+        seed_rows(session, [make_row(i) for i in range(1, 4)])
 
         stmt = select(ExampleTable)
         result = db.query(stmt, session).scalars().all()
@@ -38,9 +42,7 @@ class TestQuery:
 
     @pytest.mark.usefixtures("clean_example_table")
     def test_filter_chaining(self, db: Database, session: Session) -> None:
-        rows = [make_row(1, company_id=1), make_row(2, company_id=1), make_row(3, company_id=2)]
-        db.bulk_insert(rows, session=session)
-        session.commit()
+        seed_rows(session, [make_row(1, company_id=1), make_row(2, company_id=1), make_row(3, company_id=2)])
 
         stmt = select(ExampleTable).where(ExampleTable.company_id == 1)
         result = db.query(stmt, session).scalars().all()
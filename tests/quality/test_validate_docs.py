@@ -1,22 +1,29 @@
 import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
 
+import pytest
 
-def load_validate_docs_module():
+
+@pytest.fixture(scope="module")
+def validator() -> ModuleType:
+    """Load validate_docs.py from source once for every test in this module."""
     repo_root = Path(__file__).resolve().parents[2]
     module_path = repo_root / "data_collector" / "utilities" / "validate_docs.py"
     spec = importlib.util.spec_from_file_location("validate_docs_module", module_path)
     if spec is None or spec.loader is None:
         raise RuntimeError(f"Unable to load validator module from {module_path}")
+    loaded = sys.modules.get(spec.name)
+    if loaded is not None:
+        return loaded
     module = importlib.util.module_from_spec(spec)
     sys.modules[spec.name] = module
     spec.loader.exec_module(module)
     return module
 
 
-def test_legacy_namespace_patterns_are_reported(tmp_path: Path) -> None:
-    validator = load_validate_docs_module()
+def test_legacy_namespace_patterns_are_reported(tmp_path: Path, validator: ModuleType) -> None:
     doc_path = tmp_path / "legacy-patterns.md"
     doc_path.write_text(
         "\n".join(
@@ -49,8 +56,7 @@ def test_legacy_namespace_patterns_are_reported(tmp_path: Path) -> None:
     assert "legacy_constants_enums_import" in codes
 
 
-def test_legacy_namespace_exceptions_are_allowed(tmp_path: Path) -> None:
-    validator = load_validate_docs_module()
+def test_legacy_namespace_exceptions_are_allowed(tmp_path: Path, validator: ModuleType) -> None:
     doc_path = tmp_path / "allowed-patterns.md"
     doc_path.write_text(
         "\n".join(
@@ -66,3 +72,8 @@ def test_legacy_namespace_exceptions_are_allowed(tmp_path: Path) -> None:
 
     issues = validator.check_legacy_namespace([doc_path])
     assert issues == []
+
+
+def test_legacy_namespace_tokens_cover_every_rule(validator: ModuleType) -> None:
+    for rule, pattern, _message in validator.LEGACY_NAMESPACE_PATTERNS:
+        assert any(token in pattern.pattern for token in validator.LEGACY_NAMESPACE_TOKENS), rule
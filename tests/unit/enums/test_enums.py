@@ -1,4 +1,7 @@
-from enum import IntEnum, StrEnum
+from enum import Enum, IntEnum, StrEnum
+from typing import Any
+
+import pytest
 
 from data_collector.enums import (
     AlertSeverity,
@@ -14,193 +17,62 @@ from data_collector.enums import (
 )
 
 # ---------------------------------------------------------------------------
-# AppType
-# ---------------------------------------------------------------------------
-
-def test_app_type_is_int_enum() -> None:
-    assert issubclass(AppType, IntEnum)
-
-
-def test_app_type_values() -> None:
-    assert AppType.STANDALONE == 0
-    assert AppType.MANAGED == 1
-    assert AppType.DRAMATIQ == 2
-
-
-def test_app_type_member_count() -> None:
-    assert len(AppType) == 3
-
-
-# ---------------------------------------------------------------------------
-# CmdFlag
-# ---------------------------------------------------------------------------
-
-def test_cmd_flag_is_int_enum() -> None:
-    assert issubclass(CmdFlag, IntEnum)
-
-
-def test_cmd_flag_values() -> None:
-    assert CmdFlag.PENDING == 0
-    assert CmdFlag.EXECUTED == 1
-    assert CmdFlag.NOT_EXECUTED == 2
-
-
-def test_cmd_flag_member_count() -> None:
-    assert len(CmdFlag) == 3
-
-
-# ---------------------------------------------------------------------------
-# CmdName
-# ---------------------------------------------------------------------------
-
-def test_cmd_name_is_int_enum() -> None:
-    assert issubclass(CmdName, IntEnum)
-
-
-def test_cmd_name_values() -> None:
-    assert CmdName.START == 1
-    assert CmdName.STOP == 2
-    assert CmdName.RESTART == 3
-    assert CmdName.ENABLE == 4
-    assert CmdName.DISABLE == 5
-
-
-def test_cmd_name_member_count() -> None:
-    assert len(CmdName) == 5
-
-
-# ---------------------------------------------------------------------------
-# RunStatus
-# ---------------------------------------------------------------------------
-
-def test_run_status_is_int_enum() -> None:
-    assert issubclass(RunStatus, IntEnum)
-
-
-def test_run_status_values() -> None:
-    assert RunStatus.NOT_RUNNING == 0
-    assert RunStatus.RUNNING == 1
-    assert RunStatus.STOPPED == 2
-
-
-def test_run_status_member_count() -> None:
-    assert len(RunStatus) == 3
-
-
-# ---------------------------------------------------------------------------
-# FatalFlag
-# ---------------------------------------------------------------------------
-
-def test_fatal_flag_is_int_enum() -> None:
-    assert issubclass(FatalFlag, IntEnum)
-
-
-def test_fatal_flag_values() -> None:
-    assert FatalFlag.FAILED_TO_START == 1
-    assert FatalFlag.APP_STOPPED_ALERT_SENT == 2
-    assert FatalFlag.UNEXPECTED_BEHAVIOUR == 3
-
-
-def test_fatal_flag_member_count() -> None:
-    assert len(FatalFlag) == 4
-
-
-# ---------------------------------------------------------------------------
-# RuntimeExitCode
-# ---------------------------------------------------------------------------
-
-def test_runtime_exit_code_is_int_enum() -> None:
-    assert issubclass(RuntimeExitCode, IntEnum)
-
-
-def test_runtime_exit_code_values() -> None:
-    assert RuntimeExitCode.FINISHED == 0
-    assert RuntimeExitCode.MANAGER_EXIT == 1
-    assert RuntimeExitCode.ORPHAN_PID == 2
-    assert RuntimeExitCode.CMD_DISABLE == 3
-    assert RuntimeExitCode.CMD_RESET == 4
-    assert RuntimeExitCode.CMD_STOP == 5
-    assert RuntimeExitCode.CMD_START == 6
-
-
-def test_runtime_exit_code_member_count() -> None:
-    assert len(RuntimeExitCode) == 7
-
-
-# ---------------------------------------------------------------------------
-# LogLevel
-# ---------------------------------------------------------------------------
-
-def test_log_level_is_int_enum() -> None:
-    assert issubclass(LogLevel, IntEnum)
-
-
-def test_log_level_values() -> None:
-    assert LogLevel.NOTSET == 0
-    assert LogLevel.DEBUG == 10
-    assert LogLevel.INFO == 20
-    assert LogLevel.WARNING == 30
-    assert LogLevel.ERROR == 40
-    assert LogLevel.CRITICAL == 50
-
-
-def test_log_level_member_count() -> None:
-    assert len(LogLevel) == 6
-
-
-# ---------------------------------------------------------------------------
-# DbObjectType
-# ---------------------------------------------------------------------------
-
-def test_db_object_type_is_int_enum() -> None:
-    assert issubclass(DbObjectType, IntEnum)
-
-
-def test_db_object_type_values() -> None:
-    assert DbObjectType.PROCEDURE == 1
-    assert DbObjectType.FUNCTION == 2
-
-
-def test_db_object_type_member_count() -> None:
-    assert len(DbObjectType) == 2
-
-
-# ---------------------------------------------------------------------------
-# UnicodeForm
-# ---------------------------------------------------------------------------
-
-def test_unicode_form_is_str_enum() -> None:
-    assert issubclass(UnicodeForm, StrEnum)
-
-
-def test_unicode_form_values() -> None:
-    assert UnicodeForm.NFC == "NFC"
-    assert UnicodeForm.NFD == "NFD"
-    assert UnicodeForm.NFKC == "NFKC"
-    assert UnicodeForm.NFKD == "NFKD"
-
-
-def test_unicode_form_member_count() -> None:
-    assert len(UnicodeForm) == 4
-
-
-# ---------------------------------------------------------------------------
-# AlertSeverity
-# ---------------------------------------------------------------------------
-
-def test_alert_severity_is_int_enum() -> None:
-    assert issubclass(AlertSeverity, IntEnum)
+# Expected shape of every enum: (enum class, base class, member values, member count)
+# ---------------------------------------------------------------------------
+
+ENUM_CASES: list[tuple[type[Enum], type[Enum], dict[str, Any], int]] = [
+    (AppType, IntEnum, {"STANDALONE": 0, "MANAGED": 1, "DRAMATIQ": 2}, 3),
+    (CmdFlag, IntEnum, {"PENDING": 0, "EXECUTED": 1, "NOT_EXECUTED": 2}, 3),
+    (CmdName, IntEnum, {"START": 1, "STOP": 2, "RESTART": 3, "ENABLE": 4, "DISABLE": 5}, 5),
+    (RunStatus, IntEnum, {"NOT_RUNNING": 0, "RUNNING": 1, "STOPPED": 2}, 3),
+    (FatalFlag, IntEnum, {"FAILED_TO_START": 1, "APP_STOPPED_ALERT_SENT": 2, "UNEXPECTED_BEHAVIOUR": 3}, 4),
+    (
+        RuntimeExitCode,
+        IntEnum,
+        {
+            "FINISHED": 0,
+            "MANAGER_EXIT": 1,
+            "ORPHAN_PID": 2,
+            "CMD_DISABLE": 3,
+            "CMD_RESET": 4,
+            "CMD_STOP": 5,
+            "CMD_START": 6,
+        },
+        7,
+    ),
+    (
+        LogLevel,
+        IntEnum,
+        {"NOTSET": 0, "DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50},
+        6,
+    ),
+    (DbObjectType, IntEnum, {"PROCEDURE": 1, "FUNCTION": 2}, 2),
+    (UnicodeForm, StrEnum, {"NFC": "NFC", "NFD": "NFD", "NFKC": "NFKC", "NFKD": "NFKD"}, 4),
+    (AlertSeverity, IntEnum, {"INFO": 1, "WARNING": 2, "ERROR": 3, "CRITICAL": 4}, 4),
+]
+ENUM_IDS = [enum_cls.__name__ for enum_cls, *_ in ENUM_CASES]
+
+
+@pytest.mark.parametrize(
+    ("enum_cls", "base"), [(enum_cls, base) for enum_cls, base, _, _ in ENUM_CASES], ids=ENUM_IDS
+)
+def test_enum_base_class(enum_cls: type[Enum], base: type[Enum]) -> None:
+    assert issubclass(enum_cls, base)
 
 
-def test_alert_severity_values() -> None:
-    assert AlertSeverity.INFO == 1
-    assert AlertSeverity.WARNING == 2
-    assert AlertSeverity.ERROR == 3
-    assert AlertSeverity.CRITICAL == 4
+@pytest.mark.parametrize(
+    ("enum_cls", "members"), [(enum_cls, members) for enum_cls, _, members, _ in ENUM_CASES], ids=ENUM_IDS
+)
+def test_enum_values(enum_cls: type[Enum], members: dict[str, Any]) -> None:
+    for name, value in members.items():
+        assert enum_cls[name] == value
 
 
-def test_alert_severity_member_count() -> None:
-    assert len(AlertSeverity) == 4
+@pytest.mark.parametrize(
+    ("enum_cls", "count"), [(enum_cls, count) for enum_cls, _, _, count in ENUM_CASES], ids=ENUM_IDS
+)
+def test_enum_member_count(enum_cls: type[Enum], count: int) -> None:
+    assert len(enum_cls) == count
 
 
 # ---------------------------------------------------------------------------
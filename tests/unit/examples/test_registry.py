@@ -7,6 +7,7 @@ from data_collector.examples.registry import (
     _extract_title,
     _has_top_level_main,
     _is_candidate,
+    _parse_module,  # pyright: ignore[reportPrivateUsage]
     discover_examples,
     filter_by_scope,
     resolve_target,
@@ -49,10 +50,10 @@ def test_has_top_level_main_detects_sync_and_async(tmp_path: Path) -> None:
     _write(no_main_file, "def helper() -> None:\n    return None\n")
     _write(syntax_error_file, "def main(:\n    pass\n")
 
-    assert _has_top_level_main(sync_file) is True
-    assert _has_top_level_main(async_file) is True
-    assert _has_top_level_main(no_main_file) is False
-    assert _has_top_level_main(syntax_error_file) is False
+    assert _has_top_level_main(_parse_module(sync_file)) is True
+    assert _has_top_level_main(_parse_module(async_file)) is True
+    assert _has_top_level_main(_parse_module(no_main_file)) is False
+    assert _has_top_level_main(_parse_module(syntax_error_file)) is False
 
 
 def test_discover_examples_recursively_and_extract_title(tmp_path: Path) -> None:
@@ -84,7 +85,7 @@ def test_extract_title_fallback_to_stem(tmp_path: Path) -> None:
     """When docstring is missing, title should fallback to stem."""
     target = tmp_path / "request" / "plain_example.py"
     _write(target, "def main() -> None:\n    return None\n")
-    assert _extract_title(target) == "plain_example"
+    assert _extract_title(_parse_module(target), target) == "plain_example"
 
 
 def test_filter_by_scope_and_resolve_target() -> None:
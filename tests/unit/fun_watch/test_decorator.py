@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import inspect
 import threading
 from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -341,6 +343,24 @@ class TestFunctionLog:
         assert "min_elapsed_ms" in call_kwargs
         assert "max_elapsed_ms" in call_kwargs
 
+    @patch("data_collector.utilities.fun_watch.time.perf_counter_ns", side_effect=[1_000_000_000, 1_250_000_000])
+    @patch(f"{_REGISTRY}.complete_function_log")
+    @patch(f"{_REGISTRY}.start_function_log", return_value=1)
+    @patch(f"{_REGISTRY}.update_last_seen")
+    @patch(f"{_REGISTRY}.register_function")
+    def test_duration_uses_monotonic_nanosecond_clock(
+        self,
+        _mock_register: MagicMock,
+        _mock_last_seen: MagicMock,
+        _mock_start_log: MagicMock,
+        mock_complete_log: MagicMock,
+        _mock_perf_counter: MagicMock,
+    ) -> None:
+        app = FakeApp()
+        app.process_items(["a"])
+        call_kwargs = mock_complete_log.call_args[1]
+        assert call_kwargs["total_elapsed_ms"] == 250
+
     @patch(f"{_REGISTRY}.complete_function_log")
     @patch(f"{_REGISTRY}.start_function_log", return_value=1)
     @patch(f"{_REGISTRY}.update_last_seen")
@@ -397,6 +417,27 @@ class TestFunctionLog:
         assert last_kwargs["call_count"] == 2
         assert last_kwargs["solved"] == 3
 
+    @patch(f"{_REGISTRY}.complete_function_log")
+    @patch(f"{_REGISTRY}.start_function_log", return_value=1)
+    @patch(f"{_REGISTRY}.update_last_seen")
+    @patch(f"{_REGISTRY}.register_function")
+    def test_start_time_read_once_per_aggregate(
+        self,
+        _mock_register: MagicMock,
+        _mock_last_seen: MagicMock,
+        mock_start_log: MagicMock,
+        mock_complete_log: MagicMock,
+    ) -> None:
+        """Wall clock is read for start_time only when the aggregate is created."""
+        app = FakeApp()
+        with patch("data_collector.utilities.fun_watch.datetime", wraps=datetime) as mock_datetime:
+            app.process_items(["a"])
+            app.process_items(["b"])
+        # One read for the aggregate start_time plus one end_time read per invocation.
+        assert mock_datetime.now.call_count == 3
+        start_time = mock_start_log.call_args[1]["start_time"]
+        assert start_time <= mock_complete_log.call_args[1]["end_time"]
+
 
 class TestExceptionHandling:
     def setup_method(self) -> None:
@@ -1106,6 +1147,28 @@ class TestLifecycleLogging:
         assert kwargs["module_name"] == "test_decorator.py"
         assert kwargs["module_path"].endswith("test_decorator.py")
 
+    @patch(f"{_REGISTRY}.complete_function_log")
+    @patch(f"{_REGISTRY}.start_function_log", return_value=1)
+    @patch(f"{_REGISTRY}.update_last_seen")
+    @patch(f"{_REGISTRY}.register_function")
+    def test_source_location_resolved_once_per_function_and_class(
+        self,
+        _mock_register: MagicMock,
+        _mock_last_seen: MagicMock,
+        _mock_start_log: MagicMock,
+        _mock_complete_log: MagicMock,
+    ) -> None:
+        class LocationApp(FakeApp):
+            @fun_watch
+            def located(self) -> None:
+                return None
+
+        app = LocationApp()
+        with patch("data_collector.utilities.fun_watch.inspect.getfile", wraps=inspect.getfile) as mock_getfile:
+            app.located()
+            app.located()
+        assert mock_getfile.call_count == 1
+
     @patch(f"{_REGISTRY}.complete_function_log")
     @patch(f"{_REGISTRY}.start_function_log", return_value=1)
     @patch(f"{_REGISTRY}.update_last_seen")
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from data_collector.utilities.functions.converters import object_to_dict, to_none
 
 
@@ -17,6 +19,18 @@ class ObjWithSlots:
         self.counter = 3
 
 
+@dataclass
+class DataclassRow:
+    name: str
+    _internal: str = "hidden"
+
+
+@dataclass(slots=True)
+class SlottedDataclassRow:
+    name: str
+    counter: int
+
+
 def test_to_none_handles_known_null_like_values() -> None:
     assert to_none(None) is None
     assert to_none("None") is None
@@ -38,3 +52,11 @@ def test_object_to_dict_for_object_with___dict__() -> None:
 def test_object_to_dict_for_object_with___slots__() -> None:
     obj = ObjWithSlots()
     assert object_to_dict(obj) == {"name": "slot", "counter": 3}
+
+
+def test_object_to_dict_for_dataclass() -> None:
+    assert object_to_dict(DataclassRow(name="row")) == {"name": "row"}
+
+
+def test_object_to_dict_for_slotted_dataclass() -> None:
+    assert object_to_dict(SlottedDataclassRow(name="row", counter=2)) == {"name": "row", "counter": 2}
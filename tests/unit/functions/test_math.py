@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from data_collector.utilities.functions.math import get_totalh, get_totalm, get_totals
+from data_collector.utilities.functions.math import get_runtime_totals, get_totalh, get_totalm, get_totals
 
 
 def test_get_totals_returns_seconds_difference() -> None:
@@ -22,3 +22,17 @@ def test_get_totalh_returns_hours_difference() -> None:
     end = datetime(2026, 1, 1, 11, 30, 0)
 
     assert get_totalh(start, end) == 3
+
+
+def test_get_runtime_totals_returns_seconds_minutes_and_hours() -> None:
+    start = datetime(2026, 1, 1, 8, 0, 0)
+    end = datetime(2026, 1, 1, 11, 30, 5)
+
+    assert get_runtime_totals(start, end) == (12605, 210, 3)
+
+
+def test_get_totals_truncates_microseconds_and_spans_days() -> None:
+    start = datetime(2026, 1, 1, 23, 59, 59, 900000)
+    end = datetime(2026, 1, 3, 0, 0, 1, 100000)
+
+    assert get_totals(start, end) == 86401
@@ -1,10 +1,14 @@
 from enum import Enum
 from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from data_collector.utilities.functions.runtime import (
     bulk_hash,
     get_app_id,
     get_app_info,
+    get_function_id,
     get_parent_id,
     is_module_available,
     list_enum_values,
@@ -23,8 +27,20 @@ def test_is_module_available_for_known_and_unknown_module() -> None:
     assert is_module_available("module_that_should_not_exist_for_tests") is False
 
 
+def test_is_module_available_caches_probe_results() -> None:
+    is_module_available.cache_clear()
+    with patch("data_collector.utilities.functions.runtime.importlib.import_module", side_effect=ImportError):
+        assert is_module_available("module_probed_once_for_tests") is False
+        assert is_module_available("module_probed_once_for_tests") is False
+    assert is_module_available.cache_info().hits == 1
+
+
 def test_list_enum_values_returns_member_values_in_declaration_order() -> None:
-    assert list_enum_values(SampleEnum) == [1, 2]
+    assert list_enum_values(SampleEnum) == (1, 2)
+
+
+def test_list_enum_values_is_cached_per_enum_class() -> None:
+    assert list_enum_values(SampleEnum) is list_enum_values(SampleEnum)
 
 
 def test_make_hash_is_deterministic_with_case_and_spacing_normalization() -> None:
@@ -34,6 +50,16 @@ def test_make_hash_is_deterministic_with_case_and_spacing_normalization() -> Non
     assert make_hash(row_a) == make_hash(row_b)
 
 
+def test_make_hash_strips_unicode_whitespace() -> None:
+    assert make_hash({"name": "Acme\u00a0Corp\u3000d.o.o.\n"}) == make_hash({"name": "acmecorpd.o.o."})
+    assert make_hash("a\tb\u2028c") == make_hash("abc")
+
+
+def test_make_hash_digest_is_stable_for_persisted_rows() -> None:
+    row = {"name": "Acme Corp", "city": "Zagreb", "id": 7}
+    assert make_hash(row) == "a5e2e49dd945ac93dcc486d851c18c13e851c1656a4d68241a7cadfac795405e"
+
+
 def test_make_hash_supports_on_keys_and_exclude_keys() -> None:
     source = {"name": "ACME", "city": "Zagreb", "country": "Croatia"}
 
@@ -46,6 +72,30 @@ def test_make_hash_supports_on_keys_and_exclude_keys() -> None:
     assert no_country == no_country_reference
 
 
+def test_make_hash_rejects_unknown_constructor() -> None:
+    with pytest.raises(ValueError, match="not available"):
+        make_hash("value", constructor="not_a_real_hash")
+
+
+def test_make_hash_blake3_requires_optional_package() -> None:
+    with (
+        patch("data_collector.utilities.functions.runtime.is_module_available", return_value=False),
+        pytest.raises(ValueError, match="Install the 'blake3' package"),
+    ):
+        make_hash("value", constructor="blake3")
+
+
+def test_make_hash_blake3_uses_optional_package() -> None:
+    blake3_module = pytest.importorskip("blake3")
+    expected = blake3_module.blake3(b"value").hexdigest()
+    assert make_hash("value", constructor="blake3") == expected
+
+
+def test_make_hash_reuses_constructor_across_calls() -> None:
+    assert make_hash("value", constructor="sha256") == make_hash("value", constructor="sha256")
+    assert make_hash("value", constructor="sha256") != make_hash("other", constructor="sha256")
+
+
 def test_bulk_hash_updates_dicts_inplace_by_default() -> None:
     rows = [
         {"id": 1, "name": "Alpha"},
@@ -99,6 +149,12 @@ def test_get_app_id_is_deterministic_sha256() -> None:
     assert result != get_app_id("examples", "scraping", "quotes")
 
 
+def test_get_function_id_matches_make_hash_of_concatenation() -> None:
+    result = get_function_id("app_hash", "Scraper.collect")
+    assert result == make_hash("app_hashScraper.collect")
+    assert result is get_function_id("app_hash", "Scraper.collect")
+
+
 def test_get_app_info_returns_app_info_with_parent_id() -> None:
     info = get_app_info("data_collector/examples/scraping/books/main.py")
     assert not isinstance(info, str)
@@ -114,3 +170,43 @@ def test_get_app_info_only_id_returns_string() -> None:
     result = get_app_info("data_collector/examples/scraping/books/main.py", only_id=True)
     assert isinstance(result, str)
     assert len(result) == 64
+
+
+def test_get_app_info_depth_three_derives_app_name_from_module() -> None:
+    info = get_app_info("data_collector/examples/fun_watch/01_basic_decorator.py", depth=-3)
+    assert not isinstance(info, str)
+    assert info["app_parent"] == "fun_watch"
+    assert info["app_name"] == "01_basic_decorator"
+    assert info["module_name"] == "01_basic_decorator.py"
+
+
+def test_get_app_info_rejects_short_paths() -> None:
+    with pytest.raises(ValueError, match="need at least 4"):
+        get_app_info("books/main.py")
+
+
+def test_obj_diff_with_single_element_key_list() -> None:
+    existing = [SimpleNamespace(sha="1"), SimpleNamespace(sha="2")]
+    incoming = [SimpleNamespace(sha="2"), SimpleNamespace(sha="3")]
+
+    to_insert, to_remove = obj_diff(incoming, existing, compare_key=["sha"])
+    assert [obj.sha for obj in to_insert] == ["3"]
+    assert [obj.sha for obj in to_remove] == ["1"]
+
+
+def test_obj_diff_warns_on_duplicate_keys_and_keeps_last_occurrence() -> None:
+    logger = MagicMock()
+    first = SimpleNamespace(sha="1", marker="first")
+    last = SimpleNamespace(sha="1", marker="last")
+
+    to_insert, to_remove = obj_diff([first, last], [], logger=logger)
+
+    assert [obj.marker for obj in to_insert] == ["last"]
+    assert to_remove == []
+    logger.warning.assert_called_once_with("Duplicate key in new_objs: 1")
+
+
+def test_obj_diff_does_not_warn_without_duplicates() -> None:
+    logger = MagicMock()
+    obj_diff([SimpleNamespace(sha="1")], [SimpleNamespace(sha="2")], logger=logger)
+    logger.warning.assert_not_called()
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import csv
+import gzip
+import io
 import json
 import logging
-from typing import Any, cast
+import threading
+from pathlib import Path
+from typing import IO, Any, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,7 +15,12 @@ import requests
 
 from data_collector.enums import LogLevel
 from data_collector.tables.log import Logs
-from data_collector.utilities.log.handlers import DatabaseHandler, SplunkHECHandler
+from data_collector.utilities.log.handlers import (  # pyright: ignore[reportPrivateUsage]
+    DatabaseHandler,
+    SplunkHECHandler,
+    _BufferedHandler,  # pyright: ignore[reportPrivateUsage]
+)
+from data_collector.utilities.log.router import RouterHandler
 
 
 def _make_structured_record() -> logging.LogRecord:
@@ -39,22 +49,26 @@ def _make_structured_record() -> logging.LogRecord:
     )
 
 
-@patch("data_collector.utilities.log.handlers.Session")
-def test_database_handler_maps_structured_payload_to_logs_model(mock_session: MagicMock) -> None:
-    session = MagicMock()
-    context_manager = MagicMock()
-    context_manager.__enter__.return_value = session
-    context_manager.__exit__.return_value = False
-    mock_session.return_value = context_manager
+def _mock_engine() -> tuple[MagicMock, MagicMock]:
+    engine = MagicMock()
+    engine.begin.return_value.__exit__.return_value = False
+    connection = engine.begin.return_value.__enter__.return_value
+    return engine, connection
 
-    handler = DatabaseHandler(engine=object())
-    handler.emit(_make_structured_record())
 
-    assert session.add.called
-    assert session.commit.called
-    inserted = session.add.call_args.args[0]
-    assert isinstance(inserted, Logs)
-    inserted_data = cast(dict[str, Any], inserted.__dict__)
+def test_database_handler_maps_structured_payload_to_logs_model() -> None:
+    engine, connection = _mock_engine()
+
+    handler = DatabaseHandler(engine=engine, batch_size=1)
+    handler.emit(_make_structured_record())
+    handler.close()
+
+    assert connection.execute.call_count == 1
+    assert engine.begin.called
+    statement, rows = connection.execute.call_args.args
+    assert statement.table.name == Logs.__tablename__
+    assert len(rows) == 1
+    inserted_data = cast(dict[str, Any], rows[0])
     assert inserted_data["app_id"] == "app_hash"
     assert inserted_data["runtime"] == "runtime_hash"
     assert inserted_data["function_id"] == "function_hash"
@@ -69,34 +83,216 @@ def test_database_handler_maps_structured_payload_to_logs_model(mock_session: Ma
     assert context_json["logger"] == "tests.handler"
 
 
-@patch("data_collector.utilities.log.handlers.Session")
-def test_database_handler_propagates_sink_errors(mock_session: MagicMock) -> None:
-    session = MagicMock()
-    session.add.side_effect = RuntimeError("db unavailable")
-    context_manager = MagicMock()
-    context_manager.__enter__.return_value = session
-    context_manager.__exit__.return_value = False
-    mock_session.return_value = context_manager
+def test_database_handler_reports_emit_write_failure_once_and_keeps_row() -> None:
+    engine, connection = _mock_engine()
+    error = RuntimeError("db unavailable")
+    connection.execute.side_effect = error
 
-    handler = DatabaseHandler(engine=object())
-    with pytest.raises(RuntimeError, match="db unavailable"):
-        handler.emit(_make_structured_record())
+    handler = DatabaseHandler(engine=engine, batch_size=1)
+    callback = MagicMock()
+    handler.on_write_failure = callback
+    handler.emit(_make_structured_record())
+
+    callback.assert_called_once()
+    assert callback.call_args.args[2][1] is error
+    assert "1 still buffered for retry" in callback.call_args.args[1].getMessage()
+
+    # The failed row stays buffered and is written once the database recovers
+    connection.execute.side_effect = None
+    handler.close()
+    assert connection.execute.call_count == 2
+    assert len(connection.execute.call_args.args[1]) == 1
+
+
+def test_database_handler_buffers_until_batch_size() -> None:
+    engine, connection = _mock_engine()
+
+    handler = DatabaseHandler(engine=engine, batch_size=3, flush_interval=60.0)
+    handler.emit(_make_structured_record())
+    handler.emit(_make_structured_record())
+    assert connection.execute.call_count == 0
+
+    handler.emit(_make_structured_record())
+    assert connection.execute.call_count == 1
+    assert len(connection.execute.call_args.args[1]) == 3
+    handler.close()
+
+
+def test_database_handler_emit_many_buffers_records_together() -> None:
+    engine, connection = _mock_engine()
+
+    handler = DatabaseHandler(engine=engine, batch_size=2, flush_interval=60.0)
+    handler.emit_many([_make_structured_record(), _make_structured_record()])
+
+    assert connection.execute.call_count == 1
+    assert len(connection.execute.call_args.args[1]) == 2
+    handler.close()
+
+
+def test_database_handler_close_flushes_partial_batch() -> None:
+    engine, connection = _mock_engine()
+
+    handler = DatabaseHandler(engine=engine, batch_size=100, flush_interval=60.0)
+    handler.emit(_make_structured_record())
+    handler.close()
+
+    assert connection.execute.call_count == 1
+    assert len(connection.execute.call_args.args[1]) == 1
 
 
-@patch("data_collector.utilities.log.handlers.requests.post")
-def test_splunk_handler_posts_structured_payload(mock_post: MagicMock) -> None:
+def test_database_handler_flusher_writes_partial_batch() -> None:
+    engine, connection = _mock_engine()
+    written = threading.Event()
+
+    def _execute(*_args: object) -> None:
+        written.set()
+
+    connection.execute.side_effect = _execute
+
+    handler = DatabaseHandler(engine=engine, batch_size=100, flush_interval=0.01)
+    handler.emit(_make_structured_record())
+
+    assert written.wait(timeout=2.0)
+    handler.close()
+
+
+def test_database_handler_flush_reports_errors_via_handle_error() -> None:
+    engine, connection = _mock_engine()
+    connection.execute.side_effect = RuntimeError("db unavailable")
+
+    handler = DatabaseHandler(engine=engine, batch_size=100, flush_interval=60.0)
+    handler.emit(_make_structured_record())
+    with patch.object(handler, "handleError") as mock_handle_error:
+        handler.flush()
+    mock_handle_error.assert_called_once()
+    assert "1 still buffered for retry" in mock_handle_error.call_args.args[0].getMessage()
+
+    connection.execute.side_effect = None
+    handler.close()
+
+
+def test_database_handler_flush_failure_goes_to_write_failure_callback() -> None:
+    engine, connection = _mock_engine()
+    error = RuntimeError("db unavailable")
+    connection.execute.side_effect = error
+
+    handler = DatabaseHandler(engine=engine, batch_size=100, flush_interval=60.0)
+    callback = MagicMock()
+    handler.on_write_failure = callback
+    handler.emit(_make_structured_record())
+    with patch.object(handler, "handleError") as mock_handle_error:
+        handler.flush()
+
+    mock_handle_error.assert_not_called()
+    failed_handler, failure_record, exc_info = callback.call_args.args
+    assert failed_handler is handler
+    assert failure_record.levelno == logging.ERROR
+    assert exc_info[1] is error
+
+    connection.execute.side_effect = None
+    handler.close()
+
+
+def test_database_handler_requeues_failed_rows_within_max_buffer() -> None:
+    engine, connection = _mock_engine()
+    connection.execute.side_effect = RuntimeError("db unavailable")
+
+    handler = DatabaseHandler(engine=engine, batch_size=2, flush_interval=60.0, max_buffer=3)
+    handler.on_write_failure = MagicMock()
+    records = [_make_structured_record() for _ in range(2)]
+    for index, record in enumerate(records):
+        cast(dict[str, Any], record.msg)["record_id"] = index
+    handler.emit_many(records)
+
+    # While failing, full batches are left to the flusher instead of writing per record
+    later = [_make_structured_record() for _ in range(2)]
+    for index, record in enumerate(later, start=2):
+        cast(dict[str, Any], record.msg)["record_id"] = index
+    handler.emit_many(later)
+    assert connection.execute.call_count == 1
+    assert handler.dropped_items == 1
+
+    connection.execute.side_effect = None
+    handler.close()
+    written_ids = [
+        json.loads(row["context_json"])["record_id"]
+        for call in connection.execute.call_args_list[1:]
+        for row in call.args[1]
+    ]
+    assert written_ids == [1, 2, 3]
+
+
+def _mock_psycopg2_engine() -> tuple[MagicMock, MagicMock, MagicMock]:
+    engine = MagicMock()
+    engine.dialect.driver = "psycopg2"
+    connection = engine.raw_connection.return_value
+    cursor = connection.cursor.return_value
+    return engine, connection, cursor
+
+
+def test_database_handler_copies_batch_on_psycopg2() -> None:
+    engine, connection, cursor = _mock_psycopg2_engine()
+    copied: list[str] = []
+
+    def _copy_expert(sql: str, file: IO[str]) -> None:
+        copied.append(file.read())
+
+    cursor.copy_expert.side_effect = _copy_expert
+
+    handler = DatabaseHandler(engine=engine, batch_size=2, flush_interval=60.0)
+    handler.emit_many([_make_structured_record(), _make_structured_record()])
+
+    assert not engine.begin.called
+    copy_sql = cursor.copy_expert.call_args.args[0]
+    assert copy_sql.startswith(f"COPY {Logs.__tablename__} (app_id, ")
+    assert copy_sql.endswith("FROM STDIN WITH (FORMAT csv)")
+    assert connection.commit.called
+    assert connection.close.called
+    rows = list(csv.reader(io.StringIO(copied[0])))
+    assert len(rows) == 2
+    assert rows[0][0] == "app_hash"
+    assert "Record failed" in rows[0]
+    handler.close()
+
+
+def test_database_handler_uses_insert_when_copy_disabled() -> None:
+    engine, _, cursor = _mock_psycopg2_engine()
+    engine.begin.return_value.__exit__.return_value = False
+    connection = engine.begin.return_value.__enter__.return_value
+
+    handler = DatabaseHandler(engine=engine, batch_size=1, use_copy=False)
+    handler.emit(_make_structured_record())
+
+    assert connection.execute.call_count == 1
+    assert not cursor.copy_expert.called
+    handler.close()
+
+
+def _make_splunk_handler(**kwargs: Any) -> tuple[SplunkHECHandler, MagicMock, MagicMock]:
+    kwargs.setdefault("background_writes", False)
+    handler = SplunkHECHandler("https://splunk.local/services/collector", "token", batch_size=1, **kwargs)
     response = MagicMock()
-    mock_post.return_value = response
+    session_post = MagicMock(return_value=response)
+    handler.session.post = session_post  # type: ignore[method-assign]
+    return handler, session_post, response
+
+
+def _posted_events(session_post: MagicMock) -> list[dict[str, Any]]:
+    data = cast(bytes, session_post.call_args.kwargs["data"])
+    body = gzip.decompress(data).decode("utf-8") if data[:2] == b"\x1f\x8b" else data.decode("utf-8")
+    return [json.loads(line) for line in body.split("\n")]
 
-    handler = SplunkHECHandler("https://splunk.local/services/collector", "token")
+
+def test_splunk_handler_posts_structured_payload() -> None:
+    handler, session_post, response = _make_splunk_handler()
     handler.emit(_make_structured_record())
 
-    assert mock_post.called
-    assert mock_post.call_args.args[0].endswith("/event")
-    assert mock_post.call_args.kwargs["headers"]["Authorization"] == "Splunk token"
-    assert mock_post.call_args.kwargs["timeout"] == 2.5
-    assert mock_post.call_args.kwargs["verify"] is True
-    payload = mock_post.call_args.kwargs["json"]
+    assert session_post.called
+    assert session_post.call_args.args[0].endswith("/event")
+    assert handler.session.headers["Authorization"] == "Splunk token"
+    assert session_post.call_args.kwargs["timeout"] == (1.0, 5.0)
+    assert session_post.call_args.kwargs["verify"] is True
+    payload = _posted_events(session_post)[0]
     assert payload["event"]["event"] == "Record failed"
     assert payload["event"]["record_id"] == 42
     assert payload["source"] == "app_hash"
@@ -105,29 +301,21 @@ def test_splunk_handler_posts_structured_payload(mock_post: MagicMock) -> None:
     assert isinstance(payload["host"], str)
     assert len(payload["host"]) > 0
     response.raise_for_status.assert_called_once()
+    handler.close()
 
 
-@patch("data_collector.utilities.log.handlers.requests.post")
-def test_splunk_handler_uses_custom_index_and_sourcetype(mock_post: MagicMock) -> None:
-    response = MagicMock()
-    mock_post.return_value = response
-
-    handler = SplunkHECHandler(
-        "https://splunk.local/services/collector", "token",
-        index="my_index", sourcetype="my_sourcetype",
-    )
+def test_splunk_handler_uses_custom_index_and_sourcetype() -> None:
+    handler, session_post, _ = _make_splunk_handler(index="my_index", sourcetype="my_sourcetype")
     handler.emit(_make_structured_record())
 
-    payload = mock_post.call_args.kwargs["json"]
+    payload = _posted_events(session_post)[0]
     assert payload["index"] == "my_index"
     assert payload["sourcetype"] == "my_sourcetype"
+    handler.close()
 
 
-@patch("data_collector.utilities.log.handlers.requests.post")
-def test_splunk_handler_source_falls_back_to_logger_name(mock_post: MagicMock) -> None:
-    response = MagicMock()
-    mock_post.return_value = response
-
+def test_splunk_handler_source_falls_back_to_logger_name() -> None:
+    handler, session_post, _ = _make_splunk_handler()
     record = logging.LogRecord(
         name="fallback.logger",
         level=logging.INFO,
@@ -137,49 +325,151 @@ def test_splunk_handler_source_falls_back_to_logger_name(mock_post: MagicMock) -
         args=(),
         exc_info=None,
     )
-    handler = SplunkHECHandler("https://splunk.local/services/collector", "token")
     handler.emit(record)
 
-    payload = mock_post.call_args.kwargs["json"]
+    payload = _posted_events(session_post)[0]
     assert payload["source"] == "fallback.logger"
+    handler.close()
 
 
-@patch("data_collector.utilities.log.handlers.requests.post")
-def test_splunk_handler_respects_verify_tls_setting(mock_post: MagicMock) -> None:
-    response = MagicMock()
-    mock_post.return_value = response
-
-    handler = SplunkHECHandler("https://splunk.local/services/collector", "token", verify_tls=False)
+def test_splunk_handler_respects_verify_tls_setting() -> None:
+    handler, session_post, response = _make_splunk_handler(verify_tls=False)
     handler.emit(_make_structured_record())
 
-    assert mock_post.call_args.kwargs["verify"] is False
+    assert session_post.call_args.kwargs["verify"] is False
     response.raise_for_status.assert_called_once()
+    handler.close()
 
 
-@patch("data_collector.utilities.log.handlers.requests.post")
-def test_splunk_handler_prefers_ca_bundle_over_verify_flag(mock_post: MagicMock) -> None:
-    response = MagicMock()
-    mock_post.return_value = response
-
+def test_splunk_handler_prefers_ca_bundle_over_verify_flag() -> None:
     ca_bundle = "C:/certs/splunk-ca.pem"
-    handler = SplunkHECHandler(
-        "https://splunk.local/services/collector",
-        "token",
-        verify_tls=False,
-        ca_bundle=ca_bundle,
-    )
+    handler, session_post, response = _make_splunk_handler(verify_tls=False, ca_bundle=ca_bundle)
     handler.emit(_make_structured_record())
 
-    assert mock_post.call_args.kwargs["verify"] == ca_bundle
+    assert session_post.call_args.kwargs["verify"] == ca_bundle
     response.raise_for_status.assert_called_once()
+    handler.close()
 
 
-@patch("data_collector.utilities.log.handlers.requests.post")
-def test_splunk_handler_propagates_http_errors(mock_post: MagicMock) -> None:
-    response = MagicMock()
+def test_splunk_handler_reports_http_errors() -> None:
+    handler, session_post, response = _make_splunk_handler()
     response.raise_for_status.side_effect = requests.HTTPError("bad response")
-    mock_post.return_value = response
 
-    handler = SplunkHECHandler("https://splunk.local/services/collector", "token")
-    with pytest.raises(requests.HTTPError, match="bad response"):
+    with patch.object(handler, "handleError") as mock_handle_error:
         handler.emit(_make_structured_record())
+    mock_handle_error.assert_called_once()
+
+    response.raise_for_status.side_effect = None
+    handler.close()
+    assert session_post.call_count == 2
+
+
+def test_splunk_handler_batches_events_into_one_request() -> None:
+    handler = SplunkHECHandler(
+        "https://splunk.local/services/collector", "token", batch_size=3, flush_interval=60.0, background_writes=False,
+    )
+    session_post = MagicMock(return_value=MagicMock())
+    handler.session.post = session_post  # type: ignore[method-assign]
+
+    handler.emit(_make_structured_record())
+    handler.emit(_make_structured_record())
+    assert session_post.call_count == 0
+
+    handler.emit(_make_structured_record())
+    assert session_post.call_count == 1
+    assert len(_posted_events(session_post)) == 3
+    handler.close()
+
+
+def test_splunk_handler_gzips_batch_body_by_default() -> None:
+    handler, session_post, _ = _make_splunk_handler()
+    handler.emit(_make_structured_record())
+
+    assert handler.session.headers["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(session_post.call_args.kwargs["data"]))
+    assert body["event"]["event"] == "Record failed"
+    handler.close()
+
+
+def test_splunk_handler_sends_plain_body_when_compression_disabled() -> None:
+    handler, session_post, _ = _make_splunk_handler(compress=False)
+    handler.emit(_make_structured_record())
+
+    assert "Content-Encoding" not in handler.session.headers
+    body = json.loads(session_post.call_args.kwargs["data"])
+    assert body["event"]["event"] == "Record failed"
+    handler.close()
+
+
+def test_splunk_handler_posts_full_batch_from_flusher_thread() -> None:
+    handler = SplunkHECHandler("https://splunk.local/services/collector", "token", batch_size=2, flush_interval=60.0)
+    posted = threading.Event()
+    posting_threads: list[str] = []
+
+    def _post(*_args: Any, **_kwargs: Any) -> MagicMock:
+        posting_threads.append(threading.current_thread().name)
+        posted.set()
+        return MagicMock()
+
+    handler.session.post = _post  # type: ignore[method-assign]
+    handler.emit_many([_make_structured_record(), _make_structured_record()])
+
+    assert posted.wait(timeout=2.0)
+    assert posting_threads == ["SplunkHECHandlerFlusher"]
+    handler.close()
+
+
+def test_splunk_handler_reports_background_post_failure_and_retries(tmp_path: Path) -> None:
+    error_file = tmp_path / "error.log"
+    handler = SplunkHECHandler("https://splunk.local/services/collector", "token", batch_size=2, flush_interval=60.0)
+    router = RouterHandler([handler], error_file=str(error_file))
+    failed = threading.Event()
+    calls: list[int] = []
+
+    def _post(*_args: Any, **_kwargs: Any) -> MagicMock:
+        calls.append(1)
+        if len(calls) == 1:
+            failed.set()
+            raise requests.ConnectionError("hec unreachable")
+        return MagicMock()
+
+    handler.session.post = _post  # type: ignore[method-assign]
+    router.emit_batch([_make_structured_record(), _make_structured_record()])
+
+    assert failed.wait(timeout=2.0)
+    handler.close()
+    router._fallback.close()  # pyright: ignore[reportPrivateUsage]
+
+    content = error_file.read_text(encoding="utf-8")
+    assert "SINK_FAILURE handler=SplunkHECHandler" in content
+    assert "hec unreachable" in content
+    # The failed batch was retried on close instead of being dropped
+    assert len(calls) == 2
+
+
+def test_buffered_handler_drops_oldest_beyond_max_buffer() -> None:
+    handler = SplunkHECHandler(
+        "https://splunk.local/services/collector", "token", batch_size=2, flush_interval=60.0, max_buffer=3,
+    )
+    session_post = MagicMock(return_value=MagicMock())
+    handler.session.post = session_post  # type: ignore[method-assign]
+    handler._flusher = threading.current_thread()  # pyright: ignore[reportPrivateUsage]
+
+    records = [_make_structured_record() for _ in range(5)]
+    for index, record in enumerate(records):
+        cast(dict[str, Any], record.msg)["record_id"] = index
+    handler.emit_many(records)
+
+    assert handler.dropped_items == 2
+    handler.close()
+    posted_ids = [
+        json.loads(line)["event"]["record_id"]
+        for call in session_post.call_args_list
+        for line in gzip.decompress(call.kwargs["data"]).decode("utf-8").split("\n")
+    ]
+    assert posted_ids == [2, 3, 4]
+
+
+def test_buffered_handler_base_is_abstract() -> None:
+    with pytest.raises(TypeError, match="abstract"):
+        _BufferedHandler(batch_size=1, flush_interval=60.0)  # type: ignore[abstract]
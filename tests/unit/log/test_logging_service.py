@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import logging
+import sys
+import threading
 import uuid
 from logging.handlers import QueueHandler
 from pathlib import Path
+from queue import Queue, SimpleQueue
 from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
@@ -12,7 +15,13 @@ from structlog.stdlib import BoundLogger, ProcessorFormatter  # type: ignore[imp
 
 from data_collector.settings.main import LogSettings
 from data_collector.utilities.log.handlers import DatabaseHandler, SplunkHECHandler
-from data_collector.utilities.log.main import LoggingService, _build_pre_chain  # pyright: ignore[reportPrivateUsage]
+from data_collector.utilities.log.main import (  # pyright: ignore[reportPrivateUsage]
+    LoggingService,
+    _BatchingQueueListener,  # pyright: ignore[reportPrivateUsage]
+    _BatchStreamHandler,  # pyright: ignore[reportPrivateUsage]
+    _build_pre_chain,  # pyright: ignore[reportPrivateUsage]
+    _RawQueueHandler,  # pyright: ignore[reportPrivateUsage]
+)
 
 
 @pytest.fixture(autouse=True)
@@ -81,7 +90,7 @@ def test_debug_mode_disables_auto_db_and_splunk_sinks() -> None:
 
 @patch("data_collector.utilities.log.main.SplunkHECHandler")
 def test_configure_logger_passes_splunk_tls_settings(mock_splunk_handler: MagicMock) -> None:
-    mock_splunk_handler.return_value = cast(Any, MagicMock())
+    mock_splunk_handler.return_value = cast(Any, MagicMock(level=logging.NOTSET))
     settings = LogSettings(
         log_to_db=False,
         log_to_splunk=True,
@@ -102,6 +111,11 @@ def test_configure_logger_passes_splunk_tls_settings(mock_splunk_handler: MagicM
             ca_bundle="C:/certs/splunk-ca.pem",
             index="default",
             sourcetype="data_collector:structured",
+            batch_size=100,
+            flush_interval=0.5,
+            compress=True,
+            background_writes=True,
+            max_buffer=10000,
         )
     finally:
         service.stop()
@@ -150,3 +164,293 @@ def test_build_pre_chain_returns_eight_processors() -> None:
     assert len(chain) == 8
     for processor in chain:
         assert callable(processor)
+
+
+class _BatchRecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[logging.LogRecord]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.batches.append([record])
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        self.batches.append(list(records))
+
+
+def test_batching_listener_drains_queued_records_in_batches() -> None:
+    log_queue: Queue[logging.LogRecord] = Queue()
+    handler = _BatchRecordingHandler()
+    listener = _BatchingQueueListener(log_queue, handler, respect_handler_level=True, batch_max=3)
+    for index in range(5):
+        log_queue.put(logging.makeLogRecord({"msg": f"record {index}", "levelno": logging.INFO}))
+
+    listener.start()
+    listener.stop()
+
+    assert [len(batch) for batch in handler.batches] == [3, 2]
+    assert [record.msg for batch in handler.batches for record in batch] == [f"record {i}" for i in range(5)]
+    assert log_queue.unfinished_tasks == 0
+
+
+def test_batching_listener_respects_handler_level() -> None:
+    log_queue: Queue[logging.LogRecord] = Queue()
+    handler = _BatchRecordingHandler()
+    handler.setLevel(logging.WARNING)
+    listener = _BatchingQueueListener(log_queue, handler, respect_handler_level=True)
+    log_queue.put(logging.makeLogRecord({"msg": "info", "levelno": logging.INFO}))
+    log_queue.put(logging.makeLogRecord({"msg": "error", "levelno": logging.ERROR}))
+
+    listener.start()
+    listener.stop()
+
+    assert [record.msg for batch in handler.batches for record in batch] == ["error"]
+
+
+def test_raw_queue_handler_enqueues_record_without_preparing() -> None:
+    log_queue: Queue[logging.LogRecord] = Queue()
+    handler = _RawQueueHandler(log_queue)
+    record = logging.makeLogRecord({"msg": {"event": "structured"}, "args": ()})
+
+    handler.emit(record)
+
+    assert log_queue.get_nowait() is record
+
+
+def test_raw_queue_handler_renders_and_clears_exc_info() -> None:
+    log_queue: Queue[logging.LogRecord] = Queue()
+    handler = _RawQueueHandler(log_queue, strip_exc_info=True)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.makeLogRecord({"msg": "failed", "levelno": logging.ERROR})
+        record.exc_info = sys.exc_info()
+
+    handler.emit(record)
+
+    queued = log_queue.get_nowait()
+    assert queued is record
+    assert queued.exc_info is None
+    assert queued.exc_text is not None
+    assert "ValueError: boom" in queued.exc_text
+
+
+def test_raw_queue_handler_drops_and_counts_when_queue_full() -> None:
+    log_queue: Queue[logging.LogRecord] = Queue(maxsize=1)
+    handler = _RawQueueHandler(log_queue, overflow="drop")
+
+    with patch.object(handler, "handleError") as mock_handle_error:
+        for _ in range(3):
+            handler.emit(logging.makeLogRecord({"msg": "record"}))
+
+    assert log_queue.qsize() == 1
+    assert handler.dropped_records == 2
+    mock_handle_error.assert_not_called()
+
+
+def test_configure_logger_passes_overflow_policy_to_queue_handler() -> None:
+    service = _build_service(LogSettings(log_to_db=False, log_to_splunk=False, log_queue_overflow="block"))
+    try:
+        service.configure_logger()
+        queue_handlers = [handler for handler in service.logger.handlers if isinstance(handler, _RawQueueHandler)]
+        assert [handler.overflow for handler in queue_handlers] == ["block"]
+    finally:
+        service.stop()
+
+
+def test_batching_listener_supports_simple_queue() -> None:
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    handler = _BatchRecordingHandler()
+    listener = _BatchingQueueListener(log_queue, handler)
+    log_queue.put(logging.makeLogRecord({"msg": "first", "levelno": logging.INFO}))
+    log_queue.put(logging.makeLogRecord({"msg": "second", "levelno": logging.INFO}))
+
+    listener.start()
+    listener.stop()
+
+    assert [record.msg for batch in handler.batches for record in batch] == ["first", "second"]
+
+
+def test_configure_logger_uses_simple_queue_when_selected() -> None:
+    service = _build_service(LogSettings(log_to_db=False, log_to_splunk=False, log_queue_impl="simple"))
+    try:
+        service.configure_logger()
+        assert isinstance(service.log_queue, SimpleQueue)
+    finally:
+        service.stop()
+
+
+def test_raw_queue_handler_soft_limit_caps_simple_queue() -> None:
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    handler = _RawQueueHandler(log_queue, overflow="drop", soft_limit=2)
+
+    for index in range(3):
+        handler.emit(logging.makeLogRecord({"msg": f"record {index}"}))
+
+    assert log_queue.qsize() == 2
+    assert handler.dropped_records == 1
+
+
+def test_raw_queue_handler_reserve_keeps_capacity_for_warnings() -> None:
+    log_queue: Queue[logging.LogRecord] = Queue(maxsize=4)
+    handler = _RawQueueHandler(log_queue, overflow="reserve")
+
+    for index in range(4):
+        handler.emit(logging.makeLogRecord({"msg": f"info {index}", "levelno": logging.INFO}))
+    assert log_queue.qsize() == 3
+
+    handler.emit(logging.makeLogRecord({"msg": "warning", "levelno": logging.WARNING}))
+    handler.emit(logging.makeLogRecord({"msg": "error", "levelno": logging.ERROR}))
+
+    assert log_queue.qsize() == 4
+    assert handler.dropped_records == 2
+    assert [record.msg for record in [log_queue.get_nowait() for _ in range(4)]][-1] == "warning"
+
+
+def test_start_pins_listener_thread_when_cpu_configured() -> None:
+    service = _build_service(LogSettings(log_to_db=False, log_to_splunk=False, log_listener_cpu=0))
+    with patch("data_collector.utilities.log.main.os.sched_setaffinity", create=True) as mock_affinity:
+        try:
+            service.configure_logger()
+        finally:
+            service.stop()
+
+    assert mock_affinity.call_count == 1
+    assert mock_affinity.call_args.args[1] == {0}
+
+
+def test_batch_stream_handler_writes_batch_in_one_call() -> None:
+    stream = MagicMock()
+    handler = _BatchStreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    records = [logging.makeLogRecord({"msg": f"line {index}", "levelno": logging.INFO}) for index in range(3)]
+
+    handler.emit_many(records)
+
+    stream.write.assert_called_once_with("line 0\nline 1\nline 2\n")
+    stream.flush.assert_called_once()
+
+
+def test_queue_handlers_are_gated_at_lowest_sink_level() -> None:
+    service = _build_service(LogSettings(log_to_db=False, log_to_splunk=False, log_level=logging.WARNING))
+    try:
+        service.configure_logger()
+        queue_handler = next(handler for handler in service.logger.handlers if isinstance(handler, _RawQueueHandler))
+        assert queue_handler.level == logging.WARNING
+
+        debug_sink = logging.NullHandler()
+        debug_sink.setLevel(logging.DEBUG)
+        service.append_sink(debug_sink)
+        assert queue_handler.level == logging.DEBUG
+    finally:
+        service.stop()
+
+
+def test_raw_queue_handler_reports_drops_after_next_queued_record() -> None:
+    log_queue: Queue[logging.LogRecord] = Queue(maxsize=2)
+    handler = _RawQueueHandler(log_queue, overflow="drop")
+
+    for index in range(4):
+        handler.emit(logging.makeLogRecord({"msg": f"record {index}"}))
+    assert handler.dropped_records == 2
+    log_queue.get_nowait()
+    log_queue.get_nowait()
+
+    handler.emit(logging.makeLogRecord({"msg": "after"}))
+
+    summary = log_queue.queue[-1]
+    assert log_queue.qsize() == 2
+    assert summary.levelno == logging.WARNING
+    assert summary.getMessage().startswith("Dropped 2 log record(s)")
+
+    # Already reported drops are not repeated
+    handler.emit(logging.makeLogRecord({"msg": "again"}))
+    assert log_queue.qsize() == 2
+
+
+def test_raw_queue_handler_keeps_drops_pending_when_summary_does_not_fit() -> None:
+    log_queue: Queue[logging.LogRecord] = Queue(maxsize=4)
+    handler = _RawQueueHandler(log_queue, overflow="reserve")
+
+    for index in range(4):
+        handler.emit(logging.makeLogRecord({"msg": f"info {index}", "levelno": logging.INFO}))
+    handler.emit(logging.makeLogRecord({"msg": "warning", "levelno": logging.WARNING}))
+    assert handler.report_dropped() is False
+
+    log_queue.get_nowait()
+    assert handler.report_dropped() is True
+    assert log_queue.queue[-1].getMessage().startswith("Dropped 1 log record(s)")
+
+
+def test_raw_queue_handler_counts_and_reports_concurrent_drops_once() -> None:
+    log_queue: Queue[logging.LogRecord] = Queue(maxsize=1)
+    handler = _RawQueueHandler(log_queue, overflow="drop")
+    log_queue.put_nowait(logging.makeLogRecord({"msg": "filler"}))
+
+    def _produce() -> None:
+        for _ in range(500):
+            handler.emit(logging.makeLogRecord({"msg": "dropped"}))
+
+    producers = [threading.Thread(target=_produce) for _ in range(4)]
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    assert handler.dropped_records == 2000
+
+    log_queue.get_nowait()
+    reporters = [threading.Thread(target=handler.report_dropped) for _ in range(4)]
+    for thread in reporters:
+        thread.start()
+    for thread in reporters:
+        thread.join()
+    assert log_queue.qsize() == 1
+    assert log_queue.get_nowait().getMessage().startswith("Dropped 2000 log record(s)")
+
+
+def test_stop_reports_pending_drops_and_exposes_total() -> None:
+    service = _build_service(LogSettings(log_to_db=False, log_to_splunk=False))
+    received: list[logging.LogRecord] = []
+    sink = logging.Handler()
+    sink.emit = received.append  # type: ignore[method-assign]
+    service.append_sink(sink)
+    service.configure_logger()
+    handler = next(
+        handler for handler in service.logger.handlers if isinstance(handler, _RawQueueHandler)
+    )
+    handler.dropped_records = 3
+
+    service.stop()
+
+    assert service.dropped_records == 3
+    assert [record.getMessage() for record in received][-1].startswith("Dropped 3 log record(s)")
+
+
+def test_stop_warns_when_drop_summary_does_not_fit() -> None:
+    service = _build_service(LogSettings(log_to_db=False, log_to_splunk=False))
+    service.configure_logger()
+    handler = next(
+        handler for handler in service.logger.handlers if isinstance(handler, _RawQueueHandler)
+    )
+    handler.dropped_records = 2
+
+    with (
+        patch.object(handler, "report_dropped", return_value=False),
+        pytest.warns(RuntimeWarning, match="2 log record"),
+    ):
+        service.stop()
+
+
+@pytest.mark.parametrize("error", [OSError(22, "Invalid argument"), ValueError("invalid CPU")])
+def test_start_keeps_listener_running_when_pinning_fails(error: Exception) -> None:
+    service = _build_service(LogSettings(log_to_db=False, log_to_splunk=False, log_listener_cpu=4096))
+    with (
+        patch("data_collector.utilities.log.main.os.sched_setaffinity", create=True, side_effect=error),
+        pytest.warns(RuntimeWarning, match="CPU 4096"),
+    ):
+        try:
+            service.configure_logger()
+            thread = getattr(service.log_listener, "_thread", None)
+            assert thread is not None and thread.is_alive()
+        finally:
+            service.stop()
@@ -3,12 +3,15 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from typing import Any
+from unittest.mock import patch
 
 from data_collector.utilities.log.processors import (
     STRUCTLOG_INTERNAL_MODULE_PREFIXES,
+    attach_rendered_exception,
     extract_caller_info,
     limit_context_size,
     normalize_log_record,
+    rendered_message,
     separate_fixed_context,
 )
 
@@ -96,6 +99,26 @@ def test_normalize_log_record_with_structured_message() -> None:
     assert event_dict["logger"] == "tests.logger"
 
 
+def test_normalize_log_record_drops_structlog_bookkeeping_keys() -> None:
+    record = logging.LogRecord(
+        name="tests.logger",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=10,
+        msg={"event": "Structured event", "_record": object(), "_from_structlog": True},
+        args=(),
+        exc_info=None,
+    )
+    record._logger = object()  # pyright: ignore[reportAttributeAccessIssue]
+    record._from_structlog = True  # pyright: ignore[reportAttributeAccessIssue]
+    event_dict = normalize_log_record(record)
+
+    assert event_dict["event"] == "Structured event"
+    assert "_record" not in event_dict
+    assert "_from_structlog" not in event_dict
+    assert "_logger" not in event_dict
+
+
 def test_normalize_log_record_with_string_message_and_args() -> None:
     record = logging.LogRecord(
         name="tests.logger",
@@ -129,3 +152,45 @@ def test_internal_module_prefixes_include_bootstrap_modules() -> None:
 def test_extract_caller_info_does_not_set_call_chain() -> None:
     event = _log_from_target(extract_caller_info())
     assert "call_chain" not in event
+
+
+def test_extract_caller_info_uses_foreign_record_location() -> None:
+    record = logging.LogRecord(
+        name="library",
+        level=logging.INFO,
+        pathname="/srv/app/data_collector/processing/pdf.py",
+        lineno=42,
+        msg="parsed",
+        args=(),
+        exc_info=None,
+        func="extract",
+    )
+    event = extract_caller_info()(None, "info", {"event": "parsed", "_record": record})
+    assert event["module_name"] == "pdf.py"
+    assert event["module_path"] == "/srv/app/data_collector/processing/pdf.py"
+    assert event["function_name"] == "extract"
+    assert event["lineno"] == 42
+
+
+def test_attach_rendered_exception_uses_record_exc_text() -> None:
+    record = logging.makeLogRecord({"msg": "failed", "exc_text": "Traceback: boom"})
+    result = attach_rendered_exception(None, "error", {"event": "failed", "_record": record})
+    assert result["exception"] == "Traceback: boom"
+
+    untouched = attach_rendered_exception(None, "error", {"event": "failed", "_record": record, "exception": "own"})
+    assert untouched["exception"] == "own"
+
+
+def test_rendered_message_formats_args_once_per_record() -> None:
+    record = logging.makeLogRecord({"msg": "value=%s", "args": ("x",)})
+
+    def _get_message(log_record: logging.LogRecord) -> str:
+        return str(log_record.msg) % log_record.args
+
+    with patch.object(logging.LogRecord, "getMessage", autospec=True, side_effect=_get_message) as spy:
+        assert normalize_log_record(record)["event"] == "value=x"
+        assert normalize_log_record(record)["event"] == "value=x"
+        assert rendered_message(record) == "value=x"
+
+    assert spy.call_count == 1
+    assert "_rendered_message" not in normalize_log_record(record)
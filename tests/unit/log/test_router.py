@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import logging
+import traceback
 from pathlib import Path
+from typing import Any, cast
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from data_collector.utilities.log.router import RouterHandler
+from data_collector.utilities.log.handlers import DatabaseHandler, _BufferedHandler  # pyright: ignore[reportPrivateUsage]
+from data_collector.utilities.log.router import RouterHandler, _CachedTimeFormatter  # pyright: ignore[reportPrivateUsage]
 
 
 class _TrackingHandler(logging.Handler):
@@ -22,6 +26,18 @@ class _FailingHandler(logging.Handler):
         raise RuntimeError("sink failure")
 
 
+class _BatchTrackingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[logging.LogRecord]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        raise AssertionError("emit_many should be used for batches")
+
+    def emit_many(self, records: list[logging.LogRecord]) -> None:
+        self.batches.append(records)
+
+
 def _make_record() -> logging.LogRecord:
     return logging.LogRecord(
         name="tests.router",
@@ -63,3 +79,187 @@ def test_router_reraises_when_swallow_errors_is_false(tmp_path: Path) -> None:
 
     with pytest.raises(RuntimeError, match="sink failure"):
         router.emit(_make_record())
+
+
+def test_router_skips_handlers_above_record_level(tmp_path: Path) -> None:
+    info_handler = _TrackingHandler()
+    critical_handler = _TrackingHandler()
+    critical_handler.setLevel(logging.CRITICAL)
+    router = RouterHandler([info_handler, critical_handler], error_file=str(tmp_path / "error.log"))
+
+    router.emit(_make_record())
+
+    assert len(info_handler.records) == 1
+    assert critical_handler.records == []
+
+
+def test_router_emit_batch_applies_level_and_filters(tmp_path: Path) -> None:
+    tracking_handler = _TrackingHandler()
+    tracking_handler.addFilter(lambda record: record.lineno != 7)
+    critical_handler = _TrackingHandler()
+    critical_handler.setLevel(logging.CRITICAL)
+    router = RouterHandler([tracking_handler, critical_handler], error_file=str(tmp_path / "error.log"))
+    filtered_out = _make_record()
+    filtered_out.lineno = 7
+
+    router.emit_batch([_make_record(), filtered_out, _make_record()])
+
+    assert len(tracking_handler.records) == 2
+    assert critical_handler.records == []
+
+
+def test_router_emit_batch_uses_emit_many_fast_path(tmp_path: Path) -> None:
+    batch_handler = _BatchTrackingHandler()
+    router = RouterHandler([batch_handler], error_file=str(tmp_path / "error.log"))
+    records = [_make_record(), _make_record()]
+
+    router.emit_batch(records)
+
+    assert batch_handler.batches == [records]
+
+
+def test_router_emit_batch_isolates_failures_per_record(tmp_path: Path) -> None:
+    error_file = tmp_path / "error.log"
+    tracking_handler = _TrackingHandler()
+    router = RouterHandler([_FailingHandler(), tracking_handler], error_file=str(error_file))
+
+    router.emit_batch([_make_record(), _make_record()])
+
+    assert len(tracking_handler.records) == 2
+    assert error_file.read_text(encoding="utf-8").count("handler=_FailingHandler") == 2
+
+def test_cached_time_formatter_matches_stdlib_formatter() -> None:
+    fmt = "%(asctime)s SINK_FAILURE %(message)s"
+    cached_formatter = _CachedTimeFormatter(fmt)
+    stdlib_formatter = logging.Formatter(fmt)
+    first = _make_record()
+    second = _make_record()
+    second.created = first.created + 0.25
+    second.msecs = first.msecs
+
+    for record in (first, second, first):
+        assert cached_formatter.format(record) == stdlib_formatter.format(record)
+        assert cached_formatter.formatTime(record, "%Y-%m-%d") == stdlib_formatter.formatTime(record, "%Y-%m-%d")
+
+
+def test_router_emit_batch_shares_batch_when_nothing_is_filtered(tmp_path: Path) -> None:
+    batch_handler = _BatchTrackingHandler()
+    router = RouterHandler([batch_handler], error_file=str(tmp_path / "error.log"))
+    records = [_make_record(), _make_record()]
+
+    router.emit_batch(records)
+
+    assert batch_handler.batches[0] is records
+
+
+def test_router_emit_skips_filter_call_for_unfiltered_sinks(tmp_path: Path) -> None:
+    tracking_handler = _TrackingHandler()
+    router = RouterHandler([tracking_handler], error_file=str(tmp_path / "error.log"))
+    record = _make_record()
+
+    def _filter(_record: logging.LogRecord) -> bool:
+        pytest.fail("filter() should not run")
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(tracking_handler, "filter", _filter)
+        router.emit(record)
+
+    assert tracking_handler.records == [record]
+
+
+def test_router_emit_forwards_record_returned_by_filter(tmp_path: Path) -> None:
+    tracking_handler = _TrackingHandler()
+    replacement = _make_record()
+    tracking_handler.addFilter(lambda _record: replacement)
+    router = RouterHandler([tracking_handler], error_file=str(tmp_path / "error.log"))
+
+    router.emit(_make_record())
+
+    assert tracking_handler.records == [replacement]
+
+
+class _FailingBatchHandler(logging.Handler):
+    def emit(self, record: logging.LogRecord) -> None:
+        raise AssertionError("emit_many should be used for batches")
+
+    def emit_many(self, records: list[logging.LogRecord]) -> None:
+        raise RuntimeError("batch sink failure")
+
+
+def test_router_emit_many_failure_renders_traceback_once(tmp_path: Path) -> None:
+    error_file = tmp_path / "error.log"
+    router = RouterHandler([_FailingBatchHandler()], error_file=str(error_file))
+
+    target = "data_collector.utilities.log.router.traceback.format_exception"
+    with patch(target, wraps=traceback.format_exception) as spy:
+        router.emit_batch([_make_record(), _make_record(), _make_record()])
+    router._fallback.close()  # pyright: ignore[reportPrivateUsage]
+
+    assert spy.call_count == 1
+    assert error_file.read_text(encoding="utf-8").count("SINK_FAILURE") == 3
+
+
+def test_router_has_no_lock_and_handles_records(tmp_path: Path) -> None:
+    tracking_handler = _TrackingHandler()
+    router = RouterHandler([tracking_handler], error_file=str(tmp_path / "error.log"))
+    record = _make_record()
+
+    router.acquire()
+    router.release()
+    assert router.lock is None
+    assert router.handle(record)
+    assert tracking_handler.records == [record]
+
+
+def test_router_logs_buffered_sink_flush_failures_to_fallback_file(tmp_path: Path) -> None:
+    error_file = tmp_path / "error.log"
+    engine = MagicMock()
+    connection = engine.begin.return_value.__enter__.return_value
+    connection.execute.side_effect = RuntimeError("db unavailable")
+    db_handler = DatabaseHandler(engine, batch_size=100, flush_interval=60.0)
+    router = RouterHandler([db_handler], error_file=str(error_file))
+
+    router.emit(_make_record())
+    db_handler.flush()  # What the flusher thread does every flush_interval
+    router._fallback.close()  # pyright: ignore[reportPrivateUsage]
+
+    content = error_file.read_text(encoding="utf-8")
+    assert "SINK_FAILURE handler=DatabaseHandler" in content
+    assert "db unavailable" in content
+    assert "1 still buffered for retry" in content
+
+    connection.execute.side_effect = None
+    db_handler.close()
+
+
+class _FailOnceBufferedHandler(_BufferedHandler):
+    def __init__(self) -> None:
+        super().__init__(batch_size=2, flush_interval=60.0)
+        self.failures_left = 1
+        self.written: list[dict[str, Any]] = []
+
+    def _build_item(self, record: logging.LogRecord) -> dict[str, Any]:
+        return dict(cast(dict[str, Any], record.msg))
+
+    def _write_batch(self, items: list[dict[str, Any]]) -> None:
+        if self.failures_left:
+            self.failures_left -= 1
+            raise RuntimeError("write failed once")
+        self.written.extend(items)
+
+
+def test_router_never_logs_retried_records_as_sink_failures(tmp_path: Path) -> None:
+    error_file = tmp_path / "error.log"
+    buffered_handler = _FailOnceBufferedHandler()
+    router = RouterHandler([buffered_handler], error_file=str(error_file))
+
+    router.emit_batch([_make_record(), _make_record()])
+    buffered_handler.flush()
+    buffered_handler.close()
+    router._fallback.close()  # pyright: ignore[reportPrivateUsage]
+
+    content = error_file.read_text(encoding="utf-8")
+    assert content.count("SINK_FAILURE") == 1
+    assert "2 still buffered for retry" in content
+    assert "Record failed" not in content
+    assert len(buffered_handler.written) == 2
@@ -10,7 +10,7 @@ def test_add_error_stores_with_timestamp() -> None:
     ed = ExceptionDescriptor()
     ed.add_error("timeout", "Connection timed out", "https://example.com")
     assert len(ed.errors) == 1
-    entry = next(iter(ed.errors.values()))
+    _, entry = ed.errors[0]
     assert entry["type"] == "timeout"
     assert entry["message"] == "Connection timed out"
     assert entry["url"] == "https://example.com"
@@ -19,15 +19,22 @@ def test_add_error_stores_with_timestamp() -> None:
 def test_add_error_url_defaults_to_empty() -> None:
     ed = ExceptionDescriptor()
     ed.add_error("timeout", "Connection timed out")
-    entry = next(iter(ed.errors.values()))
+    _, entry = ed.errors[0]
     assert entry["url"] == ""
 
 
-def test_add_error_key_is_datetime() -> None:
+def test_add_error_timestamp_is_datetime() -> None:
     ed = ExceptionDescriptor()
     ed.add_error("timeout", "test")
-    key = next(iter(ed.errors.keys()))
-    assert isinstance(key, datetime)
+    timestamp, _ = ed.errors[0]
+    assert isinstance(timestamp, datetime)
+
+
+def test_add_error_keeps_only_most_recent() -> None:
+    ed = ExceptionDescriptor(max_errors=3)
+    for i in range(5):
+        ed.add_error("timeout", f"error {i}")
+    assert [error["message"] for _, error in ed.errors] == ["error 2", "error 3", "error 4"]
 
 
 # ---------------------------------------------------------------------------
@@ -3,6 +3,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import httpx
+import pytest
 import respx
 
 from data_collector.utilities.request import Request, RequestErrorType, RequestMetrics
@@ -385,6 +386,17 @@ def test_save_responses_auto(tmp_path: Path) -> None:
     assert saved_files[0].read_text(encoding="utf-8") == "<html>saved</html>"
 
 
+@respx.mock
+def test_save_responses_background(tmp_path: Path) -> None:
+    respx.get("https://example.com/page").mock(return_value=httpx.Response(200, text="<html>saved</html>"))
+    with Request(timeout=5, retries=0, save_responses=True, save_dir=str(tmp_path), background_save=True) as req:
+        req.get("https://example.com/page")
+    # close() waits for the pending write
+    saved_files = list(tmp_path.iterdir())
+    assert len(saved_files) == 1
+    assert saved_files[0].read_text(encoding="utf-8") == "<html>saved</html>"
+
+
 # ---------------------------------------------------------------------------
 # log_stats
 # ---------------------------------------------------------------------------
@@ -472,6 +484,50 @@ def test_set_proxy_cleared() -> None:
     assert "proxy" not in kwargs
 
 
+def test_http2_requires_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _is_module_available(_name: str) -> bool:
+        return False
+
+    monkeypatch.setattr("data_collector.utilities.request.is_module_available", _is_module_available)
+    with pytest.raises(ValueError, match="h2"):
+        Request(http2=True)
+
+
+def test_http2_applied(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _is_module_available(_name: str) -> bool:
+        return True
+
+    monkeypatch.setattr("data_collector.utilities.request.is_module_available", _is_module_available)
+    req = Request(timeout=5, retries=0, http2=True)
+    assert req._build_client_kwargs()["http2"] is True  # pyright: ignore[reportPrivateUsage]
+    assert "http2" not in Request(timeout=5)._build_client_kwargs()  # pyright: ignore[reportPrivateUsage]
+
+
+# ---------------------------------------------------------------------------
+# client reuse
+# ---------------------------------------------------------------------------
+
+@respx.mock
+def test_sync_client_reused_across_requests() -> None:
+    respx.get("https://example.com/a").mock(return_value=httpx.Response(200))
+    respx.get("https://example.com/b").mock(return_value=httpx.Response(200))
+    req = Request(timeout=5, retries=0)
+    req.get("https://example.com/a")
+    client = req._client  # pyright: ignore[reportPrivateUsage]
+    req.get("https://example.com/b")
+    assert client is not None
+    assert req._client is client  # pyright: ignore[reportPrivateUsage]
+    limits = req._build_client_kwargs()["limits"]  # pyright: ignore[reportPrivateUsage]
+    assert limits.max_connections == Request.MAX_CONNECTIONS
+
+
+def test_context_manager_closes_client() -> None:
+    with Request(timeout=5, retries=0) as req:
+        client = req._get_client()  # pyright: ignore[reportPrivateUsage]
+    assert client.is_closed
+    assert req._client is None  # pyright: ignore[reportPrivateUsage]
+
+
 # ---------------------------------------------------------------------------
 # _auto_save_response JSON extension
 # ---------------------------------------------------------------------------
@@ -539,7 +595,7 @@ def test_is_blocked_no_false_positive_on_port_4013() -> None:
     """Port number resembling '401' must not trigger is_blocked()."""
     req = Request(timeout=5, retries=0)
     req.exception_descriptor.add_error("proxy", "Connection refused on port 4013", "https://example.com")
-    req._last_request_time = req.exception_descriptor.errors.copy().popitem()[0]  # pyright: ignore[reportPrivateUsage]
+    req._last_request_time = req.exception_descriptor.errors[-1][0]  # pyright: ignore[reportPrivateUsage]
     assert req.is_blocked() is False
 
 
@@ -548,7 +604,7 @@ def test_is_blocked_true_on_forcibly_closed() -> None:
     """'forcibly closed' message triggers is_blocked()."""
     req = Request(timeout=5, retries=0)
     req.exception_descriptor.add_error("other", "Connection forcibly closed by remote host", "https://example.com")
-    req._last_request_time = req.exception_descriptor.errors.copy().popitem()[0]  # pyright: ignore[reportPrivateUsage]
+    req._last_request_time = req.exception_descriptor.errors[-1][0]  # pyright: ignore[reportPrivateUsage]
     assert req.is_blocked() is True
 
 
@@ -563,7 +619,7 @@ def test_is_blocked_not_stale_after_soap_error() -> None:
     req.exception_descriptor.clear()
     req._last_request_time = None  # pyright: ignore[reportPrivateUsage]
     req.exception_descriptor.add_error(RequestErrorType.REQUEST, "SOAP Fault: invalid input", "soap")
-    req._last_request_time = req.exception_descriptor.errors.copy().popitem()[0]  # pyright: ignore[reportPrivateUsage]
+    req._last_request_time = req.exception_descriptor.errors[-1][0]  # pyright: ignore[reportPrivateUsage]
     # self.response still holds 403, but last error is SOAP — is_blocked must be False
     assert req.is_blocked() is False
 
@@ -577,7 +633,7 @@ def test_is_server_down_no_false_positive_on_timeout_500ms() -> None:
     """Timeout message containing '500' must not trigger is_server_down()."""
     req = Request(timeout=5, retries=0)
     req.exception_descriptor.add_error("timeout", "Read timed out after 500ms", "https://example.com")
-    req._last_request_time = req.exception_descriptor.errors.copy().popitem()[0]  # pyright: ignore[reportPrivateUsage]
+    req._last_request_time = req.exception_descriptor.errors[-1][0]  # pyright: ignore[reportPrivateUsage]
     assert req.is_server_down() is False
 
 
@@ -592,7 +648,7 @@ def test_is_server_down_not_stale_after_soap_error() -> None:
     req.exception_descriptor.clear()
     req._last_request_time = None  # pyright: ignore[reportPrivateUsage]
     req.exception_descriptor.add_error(RequestErrorType.REQUEST, "SOAP Fault: timeout", "soap")
-    req._last_request_time = req.exception_descriptor.errors.copy().popitem()[0]  # pyright: ignore[reportPrivateUsage]
+    req._last_request_time = req.exception_descriptor.errors[-1][0]  # pyright: ignore[reportPrivateUsage]
     # self.response still holds 500, but last error is SOAP — is_server_down must be False
     assert req.is_server_down() is False
 
@@ -1,6 +1,9 @@
 import logging
+import random
 from concurrent.futures import ThreadPoolExecutor
 
+import pytest
+
 from data_collector.utilities.request import RequestMetrics
 
 # ---------------------------------------------------------------------------
@@ -33,6 +36,7 @@ def test_record_request_tracks_status_codes() -> None:
     codes = stats["by_domain"]["example.com"]["status_codes"]
     assert codes["200"] == 2
     assert codes["503"] == 1
+    assert stats["by_domain"]["example.com"]["success"] == 2
 
 
 def test_record_request_tracks_proxy_stats() -> None:
@@ -138,6 +142,20 @@ def test_is_target_unhealthy_resets_on_success() -> None:
     assert m.is_target_unhealthy("https://example.com/page") is False
 
 
+def test_failures_after_trip_still_add_new_proxies() -> None:
+    m = RequestMetrics(max_target_failures=2, min_distinct_proxies=1)
+    m.record_error("example.com", "proxy1", "timeout")
+    m.record_error("example.com", "proxy1", "timeout")
+    m.record_error("example.com", "proxy1", "timeout")
+    m.record_error("example.com", "proxy2", "timeout")
+    shard = m._domain_shard("example.com")  # pyright: ignore[reportPrivateUsage]
+    entry = shard.target_failures["example.com"]
+    # The third failure took the lock-free path; the new proxy was still recorded
+    assert entry.failures == 3
+    assert entry.proxies == {"proxy1", "proxy2"}
+    assert m.error_stats()["error_breakdown"] == {"timeout": 4}
+
+
 # ---------------------------------------------------------------------------
 # log_stats
 # ---------------------------------------------------------------------------
@@ -170,6 +188,28 @@ def test_log_stats_timing_percentiles() -> None:
     assert timing["p99_ms"] == 100
 
 
+def test_error_stats_has_counters_only() -> None:
+    m = RequestMetrics()
+    m.record_request("example.com", None, 200, 100.0)
+    m.record_error("example.com", None, "timeout")
+    stats = m.error_stats()
+    assert stats == {
+        "total_requests": 2,
+        "total_errors": 1,
+        "error_rate_percent": 50.0,
+        "error_breakdown": {"timeout": 1},
+    }
+
+
+def test_compute_stats_does_not_log(caplog: pytest.LogCaptureFixture) -> None:
+    m = RequestMetrics()
+    m.record_request("example.com", None, 200, 100.0)
+    with caplog.at_level(logging.INFO):
+        stats = m.compute_stats()
+    assert stats["by_domain"]["example.com"]["count"] == 1
+    assert not caplog.records
+
+
 def test_log_stats_empty() -> None:
     m = RequestMetrics()
     logger = logging.getLogger("test")
@@ -199,7 +239,21 @@ def test_reservoir_sampling_bounded() -> None:
     for i in range(5000):
         m.record_request("example.com", None, 200, float(i))
     # Reservoir size is an internal implementation detail; access needed for bound check
-    assert len(m._domain_timings["example.com"]) == RequestMetrics.RESERVOIR_SIZE  # pyright: ignore[reportPrivateUsage]
+    shard = m._domain_shard("example.com")  # pyright: ignore[reportPrivateUsage]
+    assert len(shard.timings["example.com"].samples) == RequestMetrics.RESERVOIR_SIZE
+
+
+def test_reservoir_sampling_stays_uniform() -> None:
+    random.seed(1234)
+    m = RequestMetrics()
+    total = 50_000
+    for i in range(total):
+        m.record_request("example.com", None, 200, float(i))
+    shard = m._domain_shard("example.com")  # pyright: ignore[reportPrivateUsage]
+    samples = shard.timings["example.com"].samples
+    # A uniform sample of 0..total-1 has mean ~total/2 and draws from every part of the stream
+    assert abs(sum(samples) / len(samples) - total / 2) < total * 0.05
+    assert sum(1 for value in samples if value >= total * 0.9) > 50
 
 
 # ---------------------------------------------------------------------------
@@ -221,3 +275,15 @@ def test_thread_safety() -> None:
             f.result()
 
     assert m.request_count == n_threads * requests_per_thread
+
+
+def test_counters_are_stable_across_reads_and_assignable() -> None:
+    m = RequestMetrics()
+    m.record_error("example.com", None, "timeout")
+    assert m.timeout_err == 1
+    assert m.timeout_err == 1
+    assert m.request_count == 1
+
+    m.request_count = 100
+    m.record_request("example.com", None, 200, 10.0)
+    assert m.request_count == 101
@@ -79,6 +79,14 @@ def test_soap_call_timeout() -> None:
     assert req.timeout_err == 1
 
 
+def test_soap_call_timeout_match_is_case_insensitive() -> None:
+    mock_method = MagicMock(side_effect=Exception("Read TimeOut while waiting for response"))
+    req = Request(timeout=5, retries=0)
+    req.soap_call(mock_method, id="123")
+    assert req.timeout_err == 1
+    assert req.other_err == 0
+
+
 def test_soap_call_should_abort_after_fault() -> None:
     mock_method = MagicMock(side_effect=Fault("Server error"))
     req = Request(timeout=5, retries=0)
@@ -150,7 +150,7 @@ class TestFatalCheck:
     def test_below_threshold_no_fatal(self, *_mocks: MagicMock) -> None:
         scraper = _make_scraper()
         scraper.metrics.request_count = 100
-        scraper.metrics.log_stats = MagicMock(return_value={  # type: ignore[method-assign]
+        scraper.metrics.error_stats = MagicMock(return_value={  # type: ignore[method-assign]
             "error_rate_percent": 10.0,
             "error_breakdown": {"timeout": 10},
         })
@@ -161,7 +161,7 @@ class TestFatalCheck:
     def test_above_threshold_triggers_fatal(self, *_mocks: MagicMock) -> None:
         scraper = _make_scraper()
         scraper.metrics.request_count = 100
-        scraper.metrics.log_stats = MagicMock(return_value={  # type: ignore[method-assign]
+        scraper.metrics.error_stats = MagicMock(return_value={  # type: ignore[method-assign]
             "error_rate_percent": 30.0,
             "error_breakdown": {"timeout": 20, "proxy": 10},
         })
@@ -176,7 +176,7 @@ class TestFatalCheck:
         scraper = _make_scraper()
         scraper.alert_threshold = 0.50
         scraper.metrics.request_count = 100
-        scraper.metrics.log_stats = MagicMock(return_value={  # type: ignore[method-assign]
+        scraper.metrics.error_stats = MagicMock(return_value={  # type: ignore[method-assign]
             "error_rate_percent": 30.0,
             "error_breakdown": {},
         })
@@ -186,7 +186,7 @@ class TestFatalCheck:
     def test_exact_threshold_no_fatal(self, *_mocks: MagicMock) -> None:
         scraper = _make_scraper()
         scraper.metrics.request_count = 100
-        scraper.metrics.log_stats = MagicMock(return_value={  # type: ignore[method-assign]
+        scraper.metrics.error_stats = MagicMock(return_value={  # type: ignore[method-assign]
             "error_rate_percent": 20.0,
             "error_breakdown": {},
         })